@@ -18,7 +18,7 @@ dx = Lx / (N - 1)
 dy = Ly / (N - 1)
 dt = 0.9 * dx**2 / (4 * alpha) * 4   # ADI permite dt más grande
 T_final = 0.1
-pasos = int(T_final / dt)
+tiempos = np.linspace(0, T_final, 81)  # cuadros de la animación en tiempos físicos exactos
 
 # Crear malla inicial
 x = np.linspace(0, Lx, N)
@@ -27,7 +27,7 @@ X, Y = np.meshgrid(x, y)
 u0 = np.sin(np.pi * X) * np.sin(np.pi * Y)
 
 # Ejecutar resolución
-sols = resolver_adi(u0, dx, dy, dt, pasos, alpha)
+sols = resolver_adi(u0, dx, dy, dt, None, alpha, tiempos_salida=tiempos)
 
 # --- Visualización de malla ---
 fig, ax = plt.subplots(figsize=(5, 4))
@@ -55,9 +55,9 @@ ax2.set_ylabel('y')
 
 def animar(i):
     grafico.set_array(sols[i])
-    txt.set_text(f'Paso {i}/{pasos} | t={i * dt:.3f} s')
+    txt.set_text(f'Cuadro {i}/{len(tiempos) - 1} | t={tiempos[i]:.3f} s')
     return grafico, txt
 
 anim = animation.FuncAnimation(
-    fig2, animar, frames=range(0, pasos+1, max(1, pasos//80)), interval=60, blit=False)
+    fig2, animar, frames=range(len(tiempos)), interval=60, blit=False)
 plt.show()
@@ -7,8 +7,16 @@ Curso MO-0014 Álgebra Lineal Numérica
 Añade:
 - Gráficas individuales de matrices de resultados para FTCS, CN, ADI y analítica
 - Modelo real: enfriamiento de una placa con borde superior caliente y resto frío
+
+Con argumentos se ejecutan especificaciones por lotes sin GUI (ver utils/lote.py):
+    python main.py ejemplos/placa_borde_caliente.toml -o resultados
 """
 
+import sys
+if len(sys.argv) > 1:
+    from utils.lote import principal
+    sys.exit(principal())
+
 import numpy as np
 import matplotlib.pyplot as plt
 from src.condiciones import inicializar_dominio, temperatura_inicial, aplicar_frontera_dirichlet
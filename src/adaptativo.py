@@ -0,0 +1,260 @@
+"""Refinamiento adaptativo por bloques (AMR) para zonas calientes localizadas
+
+La malla gruesa se divide en bloques de `bloque`×`bloque` celdas. Los bloques
+donde el indicador de gradiente supera el umbral reciben un parche fino con
+razón de refinamiento `razon`; los que bajan de la mitad del umbral se
+engrosan (se descarta su parche). Cada parche guarda sus nodos finos con un
+halo de un nodo que se llena desde el parche vecino si existe, o por
+interpolación cúbica de la malla gruesa (en espacio; lineal en el tiempo con
+subciclos). Como los nodos compartidos por dos parches vecinos ven el mismo
+esténcil, ambos calculan el mismo valor.
+
+Los parches nuevos se prolongan con interpolación cúbica más una corrección
+constante que iguala la integral del trapecio del bloque grueso, así que el
+refinamiento conserva el contenido de calor discreto. La restricción es por
+inyección: cada nodo grueso coincide con un nodo fino y toma su valor, sin
+promediar (una ponderación completa aplanaría los picos que resuelven los
+parches y dejaría el campo grueso peor que sin refinar). Con
+subciclos el nivel fino avanza razon² pasos de dt/razon² por cada paso grueso
+(límite de estabilidad de FTCS); sin ellos ambos niveles usan el paso fino.
+"""
+
+import numpy as np
+from src.solucionadores import SolucionadorCalor
+
+
+def _posiciones(inicio, n, razon, n_grueso, puntos=2):
+    """Nodos gruesos y pesos de Lagrange (puntos=2 bilineal, 4 cúbica) de n nodos finos desde `inicio`
+
+    Returns:
+        (indices, pesos), ambos (n, puntos); el esténcil se desplaza hacia dentro en los bordes
+    """
+    p = np.clip((inicio + np.arange(n)) / razon, 0, n_grueso - 1)
+    base = np.clip(np.floor(p).astype(np.intp) - (puntos // 2 - 1), 0, n_grueso - puntos)
+    indices = base[:, None] + np.arange(puntos)
+    pesos = np.ones((n, puntos))
+    for a in range(puntos):
+        for b in range(puntos):
+            if a != b:
+                pesos[:, a] *= (p - indices[:, b]) / (a - b)
+    return indices, pesos
+
+
+def _interpolar(u, filas, columnas):
+    """Interpolación tensorial de u en el producto de posiciones (indices, pesos) de filas y columnas"""
+    (i, wi), (j, wj) = filas, columnas
+    resultado = np.zeros((len(i), len(j)))
+    for a in range(i.shape[1]):
+        for b in range(j.shape[1]):
+            resultado += np.outer(wi[:, a], wj[:, b]) * u[np.ix_(i[:, a], j[:, b])]
+    return resultado
+
+
+def _media_trapecio(v):
+    """Promedio de v sobre su rectángulo con la regla del trapecio"""
+    w0 = np.ones(v.shape[0]); w0[[0, -1]] = 0.5
+    w1 = np.ones(v.shape[1]); w1[[0, -1]] = 0.5
+    return w0 @ v @ w1 / (w0.sum() * w1.sum())
+
+
+class Parche:
+    """Nodos finos de un bloque (con halo de un nodo) y sus posiciones de interpolación del halo"""
+    __slots__ = ('bloque', 'u', 'u_new', 'lados', 'dominio')
+
+    def __init__(self, bloque, u, lados, dominio):
+        self.bloque = bloque
+        self.u = u
+        self.u_new = u.copy()
+        self.lados = lados          # por lado: (índice del halo, posiciones en la malla gruesa)
+        self.dominio = dominio      # (inferior, superior, izquierdo, derecho) en la frontera del dominio
+
+
+class MallaAdaptativa:
+    """Ecuación de calor 2D con FTCS sobre una malla gruesa y parches finos adaptativos.
+
+    Args:
+        u0: temperatura inicial en la malla gruesa (nx, ny), eje 0 ↔ dx
+        dx, dy: pasos de la malla gruesa
+        dt: paso temporal grueso (estable para FTCS en la malla gruesa)
+        alpha: difusividad
+        valor_frontera: temperatura Dirichlet del borde del dominio
+        bloque: celdas gruesas por lado de cada bloque; debe dividir nx-1 y ny-1
+        razon: razón de refinamiento de los parches
+        umbral: salto máximo entre nodos gruesos vecinos sin refinar, relativo al rango de u0
+        subciclos: si es True el nivel grueso avanza con dt y el fino con dt/razon²
+        cada_regrid: pasos gruesos entre reevaluaciones del indicador
+        inicial: callable opcional inicial(X0, X1) con la condición inicial exacta para
+            inicializar los primeros parches (si no, se prolonga u0)
+    """
+
+    def __init__(self, u0, dx, dy, dt, alpha=1.0, valor_frontera=0.0, bloque=8, razon=2, umbral=0.05,
+                 subciclos=True, cada_regrid=4, inicial=None):
+        nx, ny = np.shape(u0)
+        if (nx - 1) % bloque or (ny - 1) % bloque:
+            raise ValueError(f'bloque={bloque} debe dividir nx-1={nx - 1} y ny-1={ny - 1}.')
+        self.forma = (nx, ny)
+        self.dx, self.dy, self.dt, self.alpha = dx, dy, dt, alpha
+        self.valor_frontera = valor_frontera
+        self.bloque, self.razon, self.umbral = bloque, razon, umbral
+        self.subciclos = subciclos
+        self.cada_regrid = cada_regrid
+        self.bloques = ((nx - 1) // bloque, (ny - 1) // bloque)
+        self.dt_fino = dt / razon**2
+        dt_grueso = dt if subciclos else self.dt_fino
+        self._grueso = SolucionadorCalor(self.forma, dx, dy, dt_grueso, 'ftcs', alpha,
+                                         valor_frontera=valor_frontera)
+        self._grueso.fijar_estado(u0)
+        self._previo = np.empty(self.forma)
+        # Escala fija del indicador: al difundirse la solución los bloques se engrosan
+        self._escala = max(float(np.ptp(u0)), 1e-300)
+        self.r_x = alpha * self.dt_fino / (dx / razon)**2
+        self.r_y = alpha * self.dt_fino / (dy / razon)**2
+        n = bloque * razon + 3
+        self._tmp = np.empty((n - 2, n - 2))
+        self.parches = {}
+        self.t = 0.0
+        self.pasos_dados = 0
+        self.regrid(inicial)
+
+    @property
+    def u(self):
+        """Campo grueso compuesto (en los bloques refinados, los valores del parche en los nodos gruesos)"""
+        return self._grueso.u
+
+    def _crear_parche(self, bi, bj, inicial=None):
+        b, r = self.bloque, self.razon
+        nx, ny = self.forma
+        n = b * r + 3
+        # Nodos finos del parche (halo incluido) en índices finos globales
+        f0, g0 = bi * b * r - 1, bj * b * r - 1
+        # El halo usa interpolación cúbica: con la bilineal su error O(h²) se dividiría por
+        # el h_fino² del esténcil y dominaría la solución en la interfaz
+        filas, columnas = _posiciones(f0, n, r, nx, 4), _posiciones(g0, n, r, ny, 4)
+        if inicial is not None:
+            X0, X1 = np.meshgrid((f0 + np.arange(n)) * self.dx / r, (g0 + np.arange(n)) * self.dy / r,
+                                 indexing='ij')
+            u = np.asarray(inicial(X0, X1), dtype=float)
+        else:
+            # Prolongación cúbica corregida para conservar la integral del trapecio del bloque
+            u = _interpolar(self._grueso.u, filas, columnas)
+            grueso = self._grueso.u[bi*b:(bi + 1)*b + 1, bj*b:(bj + 1)*b + 1]
+            u += _media_trapecio(grueso) - _media_trapecio(u[1:-1, 1:-1])
+        lados = {'inferior': (np.s_[0, :], (filas[0][:1], filas[1][:1]), columnas),
+                 'superior': (np.s_[-1, :], (filas[0][-1:], filas[1][-1:]), columnas),
+                 'izquierdo': (np.s_[:, 0], filas, (columnas[0][:1], columnas[1][:1])),
+                 'derecho': (np.s_[:, -1], filas, (columnas[0][-1:], columnas[1][-1:]))}
+        dominio = (bi == 0, bi == self.bloques[0] - 1, bj == 0, bj == self.bloques[1] - 1)
+        parche = Parche((bi, bj), u, lados, dominio)
+        self._frontera_parche(parche.u, dominio)
+        return parche
+
+    def indicador(self):
+        """Salto máximo entre nodos gruesos vecinos en cada bloque relativo al rango de u0, (bloques_x, bloques_y)"""
+        u = self._grueso.u
+        salto = np.maximum(np.abs(np.diff(u, axis=0))[:, :-1], np.abs(np.diff(u, axis=1))[:-1, :])
+        b = self.bloque
+        return salto.reshape(self.bloques[0], b, self.bloques[1], b).max(axis=(1, 3)) / self._escala
+
+    def regrid(self, inicial=None):
+        """Refina los bloques sobre el umbral y engrosa los que bajan de umbral/2"""
+        indicador = self.indicador()
+        for bloque in list(self.parches):
+            if indicador[bloque] < 0.5 * self.umbral:
+                del self.parches[bloque]
+        for bi, bj in zip(*np.nonzero(indicador > self.umbral)):
+            if (bi, bj) not in self.parches:
+                self.parches[(bi, bj)] = self._crear_parche(bi, bj, inicial)
+
+    def nodos(self):
+        """Nodos calculados: malla gruesa más todos los parches (sin halos)"""
+        return self._grueso.u.size + len(self.parches) * (self.bloque * self.razon + 1)**2
+
+    def _frontera_parche(self, v, dominio):
+        inferior, superior, izquierdo, derecho = dominio
+        g = self.valor_frontera
+        if inferior:
+            v[1, :] = g
+        if superior:
+            v[-2, :] = g
+        if izquierdo:
+            v[:, 1] = g
+        if derecho:
+            v[:, -2] = g
+
+    def _llenar_halos(self, theta):
+        """Halo de cada parche: del vecino refinado si existe, si no de la malla gruesa en t + θ·dt"""
+        previo, actual = self._previo, self._grueso.u
+        vecinos = {'inferior': ((-1, 0), np.s_[0, 1:-1], np.s_[-3, 1:-1]),
+                   'superior': ((1, 0), np.s_[-1, 1:-1], np.s_[2, 1:-1]),
+                   'izquierdo': ((0, -1), np.s_[1:-1, 0], np.s_[1:-1, -3]),
+                   'derecho': ((0, 1), np.s_[1:-1, -1], np.s_[1:-1, 2])}
+        for (bi, bj), parche in self.parches.items():
+            for lado, ((di, dj), destino, origen) in vecinos.items():
+                vecino = self.parches.get((bi + di, bj + dj))
+                if vecino is not None:
+                    parche.u[destino] = vecino.u[origen]
+                    continue
+                halo, filas, columnas = parche.lados[lado]
+                valores = _interpolar(actual, filas, columnas)
+                if theta < 1:
+                    valores = theta * valores + (1 - theta) * _interpolar(previo, filas, columnas)
+                parche.u[halo] = valores.ravel()
+
+    def _paso_fino(self, theta):
+        self._llenar_halos(theta)
+        r_x, r_y, tmp = self.r_x, self.r_y, self._tmp
+        for parche in self.parches.values():
+            u, u_new = parche.u, parche.u_new
+            interior = u_new[1:-1, 1:-1]
+            np.add(u[2:, 1:-1], u[:-2, 1:-1], out=interior)
+            interior *= r_x
+            np.add(u[1:-1, 2:], u[1:-1, :-2], out=tmp)
+            tmp *= r_y
+            interior += tmp
+            np.multiply(u[1:-1, 1:-1], 1 - 2*r_x - 2*r_y, out=tmp)
+            interior += tmp
+            self._frontera_parche(u_new, parche.dominio)
+            parche.u, parche.u_new = u_new, u
+
+    def _restringir(self):
+        """Inyección de cada parche en los nodos gruesos de su bloque (coinciden con nodos finos)"""
+        b, r = self.bloque, self.razon
+        u = self._grueso.u
+        for (bi, bj), parche in self.parches.items():
+            u[bi*b:(bi + 1)*b + 1, bj*b:(bj + 1)*b + 1] = parche.u[1:-1:r, 1:-1:r]
+
+    def paso(self):
+        """Avanza un paso grueso dt (con todos los subpasos finos) y devuelve el campo grueso"""
+        n_finos = self.razon**2
+        if self.subciclos:
+            np.copyto(self._previo, self._grueso.u)
+            self._grueso.paso()
+            for k in range(1, n_finos + 1):
+                self._paso_fino(k / n_finos)
+        else:
+            for _ in range(n_finos):
+                self._grueso.paso()
+                self._paso_fino(1.0)
+        self._restringir()
+        self.t += self.dt
+        self.pasos_dados += 1
+        if self.pasos_dados % self.cada_regrid == 0:
+            self.regrid()
+        return self._grueso.u
+
+    def avanzar(self, n):
+        """Avanza n pasos gruesos y devuelve el campo grueso"""
+        for _ in range(n):
+            self.paso()
+        return self._grueso.u
+
+    def campo_fino(self):
+        """Solución compuesta en la malla fina uniforme equivalente (para validar y graficar)"""
+        nx, ny = self.forma
+        r = self.razon
+        n0, n1 = (nx - 1) * r + 1, (ny - 1) * r + 1
+        fino = _interpolar(self._grueso.u, _posiciones(0, n0, r, nx), _posiciones(0, n1, r, ny))
+        b = self.bloque * r
+        for (bi, bj), parche in self.parches.items():
+            fino[bi*b:(bi + 1)*b + 1, bj*b:(bj + 1)*b + 1] = parche.u[1:-1, 1:-1]
+        return fino
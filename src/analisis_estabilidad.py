@@ -3,9 +3,10 @@ Módulo de análisis de estabilidad para métodos de diferencias finitas
 Autor: Luis Enrique Reyes García
 
 Incluye:
-- Graficar factor de amplificación (Von Neumann) para FTCS
+- Graficar factor de amplificación (Von Neumann) para FTCS, CN y ADI
 - Verificar condición CFL
-- Calcular número de condición de matrices para CN/ADI
+- Calcular número de condición de matrices para CN/ADI (forma cerrada o dispersa)
+- Barridos vectorizados de estabilidad sobre arreglos de (dt, dx, alpha)
 
 Notas explicativas en contexto sobre la interpretación y utilidad de las gráficas.
 """
@@ -20,6 +21,50 @@ def factor_amplificacion_ftcs(alpha, dt, dx, dy, theta_x, theta_y):
     G = 1 - 4 * rx * np.sin(theta_x / 2) ** 2 - 4 * ry * np.sin(theta_y / 2) ** 2
     return G
 
+# Factor de amplificación de Crank-Nicolson 2D: G = (1 - z) / (1 + z)
+def factor_amplificacion_cn(alpha, dt, dx, dy, theta_x, theta_y):
+    rx = alpha * dt / dx ** 2
+    ry = alpha * dt / dy ** 2
+    z = 2 * rx * np.sin(theta_x / 2) ** 2 + 2 * ry * np.sin(theta_y / 2) ** 2
+    return (1 - z) / (1 + z)
+
+# Factor de amplificación de ADI (Peaceman-Rachford): producto de un factor CN por dirección
+def factor_amplificacion_adi(alpha, dt, dx, dy, theta_x, theta_y):
+    rx = alpha * dt / dx ** 2
+    ry = alpha * dt / dy ** 2
+    zx = 2 * rx * np.sin(theta_x / 2) ** 2
+    zy = 2 * ry * np.sin(theta_y / 2) ** 2
+    return (1 - zx) * (1 - zy) / ((1 + zx) * (1 + zy))
+
+FACTORES_AMPLIFICACION = {
+    'ftcs': factor_amplificacion_ftcs,
+    'cn': factor_amplificacion_cn,
+    'adi': factor_amplificacion_adi,
+}
+
+def amplificacion_maxima(metodo, alpha, dt, dx, dy):
+    """
+    max |G| sobre todas las frecuencias, vectorizado: alpha, dt, dx, dy pueden ser
+    arreglos (con broadcasting) y el resultado tiene su forma común.
+    |G| es máximo en los extremos de sin²(θ/2) en cada dirección, así que basta
+    evaluar las esquinas θ ∈ {0, π}² en lugar de una malla de frecuencias.
+    """
+    factor = FACTORES_AMPLIFICACION[metodo]
+    alpha, dt, dx, dy = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (alpha, dt, dx, dy)))
+    esquinas = [factor(alpha, dt, dx, dy, tx, ty) for tx in (0.0, np.pi) for ty in (0.0, np.pi)]
+    return np.max(np.abs(esquinas), axis=0)
+
+def es_estable(metodo, alpha, dt, dx, dy, tol=1e-12):
+    """Criterio de Von Neumann |G| ≤ 1 para cada combinación de parámetros"""
+    return amplificacion_maxima(metodo, alpha, dt, dx, dy) <= 1 + tol
+
+def amortiguamiento_alta_frecuencia(metodo, alpha, dt, dx, dy):
+    """
+    |G| del modo más oscilatorio (θ_x = θ_y = π). Cerca de 1 en CN con dt grande:
+    las discontinuidades no se amortiguan y aparecen oscilaciones.
+    """
+    return np.abs(FACTORES_AMPLIFICACION[metodo](alpha, dt, dx, dy, np.pi, np.pi))
+
 def graficar_region_estabilidad_ftcs(alpha, dt, dx, dy):
     """
     Grafica la región donde el método FTCS es estable (|G| <= 1)
@@ -47,18 +92,68 @@ def graficar_region_estabilidad_ftcs(alpha, dt, dx, dy):
     plt.colorbar(label='|G|')
     plt.show()
 
+def graficar_region_estabilidad(metodo, alpha, dt, dx, dy):
+    """Grafica |G(θ_x, θ_y)| de 'ftcs', 'cn' o 'adi'; |G| ≤ 1 en todo el plano indica estabilidad."""
+    theta = np.linspace(0, np.pi, 200)
+    T1, T2 = np.meshgrid(theta, theta)
+    G = FACTORES_AMPLIFICACION[metodo](alpha, dt, dx, dy, T1, T2)
+    plt.figure(figsize=(8,6))
+    plt.contourf(T1, T2, np.abs(G), levels=20, cmap='cool')
+    plt.colorbar(label='|G|')
+    plt.contour(T1, T2, np.abs(G), levels=[1.0], colors='k')
+    plt.xlabel('θ_x (frecuencia espacial x)')
+    plt.ylabel('θ_y (frecuencia espacial y)')
+    plt.title(f'Factor de amplificación {metodo.upper()} (Von Neumann), max |G| = {np.abs(G).max():.3f}')
+    plt.tight_layout()
+    plt.show()
+
 # Función para verificar CFL FTCS
 def verificar_cfl_ftcs(alpha, dx, dy, dt):
     cfl = dt <= 0.25 * (1 / (alpha * (1/(dx**2) + 1/(dy**2))))
     print(f"¿Cumple CFL para FTCS?: {'Sí' if cfl else 'No'}\n(CFL: Δt ≤ (1/[4α]) * (1/(Δx²) + 1/(Δy²))⁻¹)")
     return cfl
 
+# Autovalores exactos de una matriz tridiagonal de Toeplitz (diagonal d, vecinos f):
+# λ_k = d + 2 f cos(kπ/(n+1)), k = 1..n. Vectorizado sobre arreglos d, f (eje final = k)
+def autovalores_tridiagonal(n, diagonal, fuera):
+    k = np.arange(1, n + 1)
+    diagonal = np.asarray(diagonal, dtype=float)[..., None]
+    fuera = np.asarray(fuera, dtype=float)[..., None]
+    return diagonal + 2 * fuera * np.cos(k * np.pi / (n + 1))
+
+# Número de condición (norma 2) de la matriz simétrica tridiagonal de Toeplitz en O(n)
+def numero_condicion_tridiagonal(n, diagonal, fuera):
+    modulo = np.abs(autovalores_tridiagonal(n, diagonal, fuera))
+    return modulo.max(axis=-1) / modulo.min(axis=-1)
+
+# Número de condición de las matrices de línea de CN/ADI, vectorizado sobre (nx, alpha, dt, dx)
+def numero_condicion_cn(nx, alpha, dt, dx):
+    rx = alpha * np.asarray(dt, dtype=float) / (2 * np.asarray(dx, dtype=float) ** 2)
+    # Matriz definida positiva: extremos en k = 1 y k = n
+    c = np.cos(np.pi / (nx - 1))
+    return (1 + 2*rx + 2*rx*c) / (1 + 2*rx - 2*rx*c)
+
+# Estimación dispersa (eigsh) para matrices simétricas sin forma cerrada, p. ej. coeficiente variable
+def numero_condicion_disperso(A):
+    from scipy.sparse.linalg import eigsh
+    A = A.tocsc()
+    lam_max = eigsh(A, k=1, which='LM', return_eigenvectors=False)[0]
+    # Desplazamiento-inversión en 0: el autovalor más cercano a cero
+    lam_min = eigsh(A, k=1, sigma=0, which='LM', return_eigenvectors=False)[0]
+    return abs(lam_max) / abs(lam_min)
+
+# Matriz de línea implícita con difusividad variable por nodo (media armónica en las caras)
+def matriz_coeficiente_variable(alpha_nodos, dt, dx):
+    alpha_nodos = np.asarray(alpha_nodos, dtype=float)
+    caras = 2 * alpha_nodos[:-1] * alpha_nodos[1:] / (alpha_nodos[:-1] + alpha_nodos[1:])
+    r = dt / (2 * dx ** 2) * caras
+    diagonal = 1 + r[:-1] + r[1:]
+    return diags([diagonal, -r[1:-1], -r[1:-1]], [0, -1, 1], format='csc')
+
 # Número de condición de matrices de Crank-Nicolson y ADI
 def calcular_numero_condicion(nx, alpha, dt, dx):
     rx = alpha * dt / (2 * dx ** 2)
-    diagonales = [np.ones(nx-2) * (1 + 2*rx), np.ones(nx-3)*(-rx), np.ones(nx-3)*(-rx)]
-    A = diags(diagonales, [0, -1, 1]).toarray()
-    cond = np.linalg.cond(A)
+    cond = float(numero_condicion_tridiagonal(nx - 2, 1 + 2*rx, -rx))
     print(f"Número de condición (nx={nx}): {cond:.2e}\n" +
           "Este valor mide la sensibilidad de la solución. Un número muy grande significa posible inestabilidad \\n en métodos implícitos si el sistema es mal condicionado.")
     return cond
@@ -0,0 +1,147 @@
+"""FTCS con bloqueo de caché y bloqueo temporal en memoria
+
+El campo se recorre en teselas 2D del tamaño de la caché. Cada tesela se copia
+con un halo de k+1 nodos a un buffer de trabajo preasignado, recibe k pasos de
+tiempo seguidos (el halo se degrada un nodo por paso, como en los trapecios de
+fuera_de_memoria.py) y solo sus nodos propios se escriben en el campo de salida.
+Así cada valor se lee de memoria principal una vez cada k pasos en lugar de una
+vez por paso. autoajustar_bloques() elige el tamaño de tesela y k midiendo en
+el equipo sobre una submalla acotada.
+"""
+
+import time
+import numpy as np
+
+_ajustes = {}
+
+
+def _frontera_tesela(v, bordes, tipo_frontera, valor_frontera, dx, dy):
+    """Aplica la frontera a los lados de la tesela que coinciden con el borde del dominio"""
+    arriba, abajo, izquierda, derecha = bordes
+    if tipo_frontera == 'dirichlet':
+        if arriba:
+            v[0, :] = valor_frontera
+        if abajo:
+            v[-1, :] = valor_frontera
+        if izquierda:
+            v[:, 0] = valor_frontera
+        if derecha:
+            v[:, -1] = valor_frontera
+    elif tipo_frontera == 'neumann':
+        # Mismo orden que aplicar_frontera_neumann: primero filas, luego columnas
+        if arriba:
+            v[0, :] = v[1, :] - valor_frontera * dy
+        if abajo:
+            v[-1, :] = v[-2, :] + valor_frontera * dy
+        if izquierda:
+            v[:, 0] = v[:, 1] - valor_frontera * dx
+        if derecha:
+            v[:, -1] = v[:, -2] + valor_frontera * dx
+    else:
+        raise ValueError('Tipo de frontera no soportado.')
+
+
+def _paso_ftcs(u, u_new, tmp, r_x, r_y):
+    """Un paso FTCS en el interior de u, sin arreglos temporales (igual que SolucionadorCalor)"""
+    interior = u_new[1:-1, 1:-1]
+    tmp = tmp[:interior.shape[0], :interior.shape[1]]
+    np.add(u[2:, 1:-1], u[0:-2, 1:-1], out=interior)
+    interior *= r_x
+    np.add(u[1:-1, 2:], u[1:-1, 0:-2], out=tmp)
+    tmp *= r_y
+    interior += tmp
+    np.multiply(u[1:-1, 1:-1], 1 - 2*r_x - 2*r_y, out=tmp)
+    interior += tmp
+
+
+def resolver_ftcs_bloqueado(u0, dx, dy, dt, pasos, alpha=1.0, tipo_frontera='dirichlet',
+                            valor_frontera=0.0, tesela=None, pasos_por_bloque=None):
+    """Resuelve la ecuación de calor 2D con FTCS por teselas y bloqueo temporal.
+    Args:
+        u0: temperatura inicial np.ndarray
+        dx, dy: pasos espaciales
+        dt: paso temporal
+        pasos: pasos de tiempo
+        alpha: difusividad
+        tipo_frontera: 'dirichlet' o 'neumann'
+        valor_frontera: valor para frontera
+        tesela: (filas, columnas) propias de cada tesela (None = autoajustar_bloques)
+        pasos_por_bloque: pasos aplicados por cada carga de una tesela (None = autoajuste)
+    Returns:
+        Solución final (mismo resultado que resolver_ftcs(...)[-1])
+    """
+    if tesela is None or pasos_por_bloque is None:
+        tesela_auto, k_auto = autoajustar_bloques(u0.shape)
+        tesela = tesela or tesela_auto
+        pasos_por_bloque = pasos_por_bloque or k_auto
+    nx, ny = u0.shape
+    filas, columnas = min(tesela[0], nx), min(tesela[1], ny)
+    r_x = alpha * dt / dx**2
+    r_y = alpha * dt / dy**2
+    origen = np.array(u0, dtype=float)
+    destino = np.empty_like(origen)
+    # Buffers de trabajo de una tesela con su halo, reutilizados en todo el recorrido
+    halo_max = pasos_por_bloque + 1
+    forma_trabajo = (filas + 2*halo_max, columnas + 2*halo_max)
+    trabajo_a, trabajo_b = np.empty(forma_trabajo), np.empty(forma_trabajo)
+    tmp = np.empty(forma_trabajo)
+    hechos = 0
+    while hechos < pasos:
+        k = min(pasos_por_bloque, pasos - hechos)
+        h = k + 1  # Neumann lee la fila vecina del borde en el mismo paso
+        for i0 in range(0, nx, filas):
+            i1 = min(nx, i0 + filas)
+            a, b = max(0, i0 - h), min(nx, i1 + h)
+            for j0 in range(0, ny, columnas):
+                j1 = min(ny, j0 + columnas)
+                c, d = max(0, j0 - h), min(ny, j1 + h)
+                u = trabajo_a[:b - a, :d - c]
+                u_new = trabajo_b[:b - a, :d - c]
+                u[...] = origen[a:b, c:d]
+                u_new[...] = u
+                bordes = (a == 0, b == nx, c == 0, d == ny)
+                for _ in range(k):
+                    _paso_ftcs(u, u_new, tmp, r_x, r_y)
+                    _frontera_tesela(u_new, bordes, tipo_frontera, valor_frontera, dx, dy)
+                    u, u_new = u_new, u
+                destino[i0:i1, j0:j1] = u[i0 - a:i1 - a, j0 - c:j1 - c]
+        origen, destino = destino, origen
+        hechos += k
+    return origen
+
+
+def autoajustar_bloques(forma, candidatos_tesela=(32, 64, 128, 256), candidatos_k=(1, 2, 4, 8),
+                        pasos_prueba=8, lado_muestra=512, tiempo_max=1.0):
+    """Elige (tesela, pasos_por_bloque) midiendo cada combinación en este equipo.
+
+    Se mide sobre una submalla de a lo sumo lado_muestra x lado_muestra nodos: ya
+    excede la caché, así que representa a las mallas mayores sin pagar pasos de
+    prueba sobre toda la malla. Si las mediciones superan tiempo_max segundos se
+    devuelve la mejor combinación medida hasta entonces. El resultado se guarda por
+    forma de la submalla y candidatos, así que la medición se hace una sola vez por
+    proceso.
+    Returns:
+        ((filas, columnas), pasos_por_bloque)
+    """
+    muestra = (min(forma[0], lado_muestra), min(forma[1], lado_muestra))
+    clave = (muestra, tuple(candidatos_tesela), tuple(candidatos_k), pasos_prueba)
+    if clave in _ajustes:
+        return _ajustes[clave]
+    rng = np.random.default_rng(0)
+    u0 = rng.random(muestra)
+    mejor, mejor_tiempo = None, np.inf
+    inicio_ajuste = time.perf_counter()
+    for lado in candidatos_tesela:
+        if lado > 2 * max(muestra) and mejor is not None:
+            continue
+        for k in candidatos_k:
+            if mejor is not None and time.perf_counter() - inicio_ajuste > tiempo_max:
+                break
+            inicio = time.perf_counter()
+            resolver_ftcs_bloqueado(u0, 1.0, 1.0, 0.2, pasos_prueba, tesela=(lado, lado),
+                                    pasos_por_bloque=k)
+            transcurrido = time.perf_counter() - inicio
+            if transcurrido < mejor_tiempo:
+                mejor, mejor_tiempo = ((lado, lado), k), transcurrido
+    _ajustes[clave] = mejor
+    return mejor
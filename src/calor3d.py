@@ -0,0 +1,254 @@
+"""Ecuación de calor 3D: malla, condiciones, FTCS y ADI de Douglas-Gunn
+
+Contraparte 3D de condiciones.py y solucionadores.py para piezas gruesas. Los
+campos usan indexing='ij' (eje 0 ↔ x, eje 1 ↔ y, eje 2 ↔ z). El ADI es el
+esquema de Douglas-Gunn (Crank-Nicolson factorizado, segundo orden e
+incondicionalmente estable):
+    (I - r_x δx²) u*   = (I + r_x δx² + 2 r_y δy² + 2 r_z δz²) uⁿ
+    (I - r_y δy²) u**  = u*  - r_y δy² uⁿ
+    (I - r_z δz²) uⁿ⁺¹ = u** - r_z δz² uⁿ
+con r = α dt / (2h²). Cada barrido resuelve todas sus líneas en una sola llamada
+a LAPACK: el buffer de cada dirección se guarda con ese eje como el más rápido
+en memoria, de modo que se ve como una matriz (n, líneas) contigua en Fortran.
+Todos los buffers se asignan una vez (seis campos en total con ADI), así que
+una malla de 256³ cabe en menos de 1 GB.
+"""
+
+import numpy as np
+from src.operadores import factorizar_linea
+
+METODOS_3D = ('ftcs', 'adi')
+
+
+def inicializar_dominio_3d(nx, ny, nz, lx=1.0, ly=1.0, lz=1.0):
+    """Crea malla espacial 3D
+
+    Returns:
+        x, y, z, dx, dy, dz: Arreglos espaciales y pasos
+    """
+    x = np.linspace(0, lx, nx)
+    y = np.linspace(0, ly, ny)
+    z = np.linspace(0, lz, nz)
+    return x, y, z, lx / (nx - 1), ly / (ny - 1), lz / (nz - 1)
+
+
+def temperatura_inicial_3d(x, y, z, tipo='cero'):
+    """Distribución inicial de temperatura (nx, ny, nz)
+
+    Args:
+        x, y, z: Arreglos de coordenadas
+        tipo: 'cero', 'gaussiana', 'senoidal'
+    """
+    X, Y, Z = np.meshgrid(x, y, z, indexing='ij')
+    if tipo == 'cero':
+        return np.zeros_like(X)
+    elif tipo == 'gaussiana':
+        sigma = 0.1
+        return np.exp(-((X - 0.5)**2 + (Y - 0.5)**2 + (Z - 0.5)**2) / (2 * sigma**2))
+    elif tipo == 'senoidal':
+        return np.sin(np.pi * X) * np.sin(np.pi * Y) * np.sin(np.pi * Z)
+    else:
+        raise ValueError(f"Tipo '{tipo}' no reconocido")
+
+
+def aplicar_frontera_dirichlet_3d(u, valor=0.0):
+    """Temperatura fija en las seis caras"""
+    u[0], u[-1] = valor, valor
+    u[:, 0], u[:, -1] = valor, valor
+    u[:, :, 0], u[:, :, -1] = valor, valor
+
+
+def aplicar_frontera_neumann_3d(u, dx, dy, dz, flujo=0.0):
+    """Flujo fijo en las seis caras (derivada a lo largo del eje, como aplicar_frontera_neumann)"""
+    u[0] = u[1] - flujo * dx
+    u[-1] = u[-2] + flujo * dx
+    u[:, 0] = u[:, 1] - flujo * dy
+    u[:, -1] = u[:, -2] + flujo * dy
+    u[:, :, 0] = u[:, :, 1] - flujo * dz
+    u[:, :, -1] = u[:, :, -2] + flujo * dz
+
+
+def _segunda_diferencia(u, eje, out):
+    """out = δ²u (sin dividir por h²) en el interior a lo largo de `eje`, sin temporales"""
+    c = u[1:-1, 1:-1, 1:-1]
+    if eje == 0:
+        np.add(u[2:, 1:-1, 1:-1], u[:-2, 1:-1, 1:-1], out=out)
+    elif eje == 1:
+        np.add(u[1:-1, 2:, 1:-1], u[1:-1, :-2, 1:-1], out=out)
+    else:
+        np.add(u[1:-1, 1:-1, 2:], u[1:-1, 1:-1, :-2], out=out)
+    out -= c
+    out -= c
+    return out
+
+
+class SolucionadorCalor3D:
+    """Solucionador reutilizable de la ecuación de calor 3D en una malla fija.
+
+    Args:
+        forma: (nx, ny, nz) de la malla
+        dx, dy, dz: pasos espaciales
+        dt: paso temporal
+        metodo: 'ftcs' o 'adi' (Douglas-Gunn, solo frontera Dirichlet)
+        alpha: difusividad
+        tipo_frontera: 'dirichlet' o 'neumann' (solo 'ftcs')
+        valor_frontera: valor para frontera
+    """
+    __slots__ = ('metodo', 'forma', 'dx', 'dy', 'dz', 'dt', 'alpha', 'tipo_frontera', 'valor_frontera',
+                 'r', 'u', 't', 'pasos_dados', '_aux', '_tmp', '_rhs', '_factores')
+
+    def __init__(self, forma, dx, dy, dz, dt, metodo='ftcs', alpha=1.0, tipo_frontera='dirichlet',
+                 valor_frontera=0.0):
+        if metodo not in METODOS_3D:
+            raise ValueError(f"Método '{metodo}' no reconocido")
+        if tipo_frontera not in ('dirichlet', 'neumann'):
+            raise ValueError('Tipo de frontera no soportado.')
+        if metodo == 'adi' and tipo_frontera != 'dirichlet':
+            raise ValueError('El ADI de Douglas-Gunn 3D solo admite frontera Dirichlet.')
+        nx, ny, nz = forma
+        self.metodo = metodo
+        self.forma = (nx, ny, nz)
+        self.dx, self.dy, self.dz, self.dt, self.alpha = dx, dy, dz, dt, alpha
+        self.tipo_frontera = tipo_frontera
+        self.valor_frontera = valor_frontera
+        escala = 1.0 if metodo == 'ftcs' else 0.5
+        self.r = tuple(escala * alpha * dt / h**2 for h in (dx, dy, dz))
+        self.u = np.zeros(self.forma)
+        self._aux = np.zeros(self.forma)
+        self.t = 0.0
+        self.pasos_dados = 0
+        interior = (nx - 2, ny - 2, nz - 2)
+        self._tmp = np.empty(interior)
+        self._rhs = self._factores = None
+        if metodo == 'adi':
+            # Vistas (mx, my, mz) cuyo eje de barrido es el más rápido en memoria
+            rhs_y = np.empty((ny - 2, nx - 2, nz - 2), order='F').transpose(1, 0, 2)
+            self._rhs = (np.empty(interior, order='F'), rhs_y, np.empty(interior))
+            self._factores = tuple(factorizar_linea(n - 2, r) for n, r in zip(self.forma, self.r))
+
+    def fijar_estado(self, u0, t=0.0):
+        """Copia u0 como estado actual y reinicia el reloj sin reconstruir operadores"""
+        if np.shape(u0) != self.forma:
+            raise ValueError(f'Se esperaba un campo de forma {self.forma}, se recibió {np.shape(u0)}')
+        np.copyto(self.u, u0)
+        self.t = t
+        self.pasos_dados = 0
+
+    def _frontera(self, u):
+        if self.tipo_frontera == 'dirichlet':
+            aplicar_frontera_dirichlet_3d(u, self.valor_frontera)
+        else:
+            aplicar_frontera_neumann_3d(u, self.dx, self.dy, self.dz, self.valor_frontera)
+
+    def _paso_ftcs(self, u, u_new):
+        interior = u_new[1:-1, 1:-1, 1:-1]
+        interior[...] = u[1:-1, 1:-1, 1:-1]
+        for eje, r in enumerate(self.r):
+            _segunda_diferencia(u, eje, self._tmp)
+            self._tmp *= r
+            interior += self._tmp
+
+    def _barrido(self, eje, b):
+        """Resuelve (I - r δ²) x = b en todas las líneas de `eje` con una sola llamada, en sitio"""
+        m = b.shape[eje]
+        # Frontera Dirichlet constante: los valores de borde de las etapas intermedias son g
+        g = self.r[eje] * self.valor_frontera
+        if g:
+            indice = [slice(None)] * 3
+            for extremo in (0, -1):
+                indice[eje] = extremo
+                b[tuple(indice)] += g
+        if eje == 0:
+            lineas = b.reshape(m, -1, order='F')
+        elif eje == 1:
+            lineas = b.transpose(1, 0, 2).reshape(m, -1, order='F')
+        else:
+            lineas = b.reshape(-1, m).T
+        x = self._factores[eje].resolver(lineas)
+        if not np.shares_memory(x, b):
+            lineas[...] = x
+
+    def _paso_adi(self, u, u_new):
+        r_x, r_y, r_z = self.r
+        tmp = self._tmp
+        rhs_x, rhs_y, rhs_z = self._rhs
+        c = u[1:-1, 1:-1, 1:-1]
+        # Barrido en x: predictor Crank-Nicolson completo
+        rhs_x[...] = c
+        for eje, peso in ((0, r_x), (1, 2*r_y), (2, 2*r_z)):
+            _segunda_diferencia(u, eje, tmp)
+            tmp *= peso
+            rhs_x += tmp
+        self._barrido(0, rhs_x)
+        # Barridos en y y en z: correcciones que restan la parte explícita de uⁿ
+        for eje, r, previo, rhs in ((1, r_y, rhs_x, rhs_y), (2, r_z, rhs_y, rhs_z)):
+            _segunda_diferencia(u, eje, tmp)
+            tmp *= r
+            np.subtract(previo, tmp, out=rhs)
+            self._barrido(eje, rhs)
+        u_new[1:-1, 1:-1, 1:-1] = rhs_z
+
+    def paso(self):
+        """Avanza un paso de tiempo dt y devuelve el estado actual (sin copiar)"""
+        u, u_new = self.u, self._aux
+        if self.metodo == 'ftcs':
+            self._paso_ftcs(u, u_new)
+        else:
+            self._paso_adi(u, u_new)
+        self._frontera(u_new)
+        self.u, self._aux = u_new, u
+        self.t += self.dt
+        self.pasos_dados += 1
+        return self.u
+
+    def avanzar(self, n):
+        """Avanza n pasos de tiempo y devuelve el estado actual (sin copiar)"""
+        for _ in range(n):
+            self.paso()
+        return self.u
+
+
+def _integrar_3d(solucionador, u0, pasos, solo_final):
+    solucionador.fijar_estado(u0)
+    if solo_final:
+        return [solucionador.avanzar(pasos).copy()]
+    soluciones = [solucionador.u.copy()]
+    for _ in range(pasos):
+        soluciones.append(solucionador.paso().copy())
+    return soluciones
+
+
+def resolver_ftcs_3d(u0, dx, dy, dz, dt, pasos, alpha=1.0, tipo_frontera='dirichlet', valor_frontera=0.0,
+                     solo_final=False):
+    """Resuelve la ecuación de calor 3D usando FTCS explícito.
+    Args:
+        u0: temperatura inicial np.ndarray (nx, ny, nz)
+        dx, dy, dz: pasos espaciales
+        dt: paso temporal (estable si α dt (1/dx² + 1/dy² + 1/dz²) ≤ 1/2)
+        pasos: pasos de tiempo
+        alpha: difusividad
+        tipo_frontera: 'dirichlet' o 'neumann'
+        valor_frontera: valor para frontera
+        solo_final: si es True solo se devuelve el campo final (mallas grandes)
+    Returns:
+        Lista de soluciones por cada paso, o [campo final]
+    """
+    solucionador = SolucionadorCalor3D(u0.shape, dx, dy, dz, dt, 'ftcs', alpha, tipo_frontera, valor_frontera)
+    return _integrar_3d(solucionador, u0, pasos, solo_final)
+
+
+def resolver_adi_3d(u0, dx, dy, dz, dt, pasos, alpha=1.0, valor_frontera=0.0, solo_final=False):
+    """Resuelve la ecuación de calor 3D con el ADI de Douglas-Gunn (frontera Dirichlet).
+    Args:
+        u0: temperatura inicial np.ndarray (nx, ny, nz)
+        dx, dy, dz: pasos espaciales
+        dt: paso temporal
+        pasos: pasos de tiempo
+        alpha: difusividad
+        valor_frontera: temperatura de las seis caras
+        solo_final: si es True solo se devuelve el campo final (mallas grandes)
+    Returns:
+        Lista de soluciones por cada paso, o [campo final]
+    """
+    solucionador = SolucionadorCalor3D(u0.shape, dx, dy, dz, dt, 'adi', alpha, 'dirichlet', valor_frontera)
+    return _integrar_3d(solucionador, u0, pasos, solo_final)
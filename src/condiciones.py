@@ -3,6 +3,17 @@
 import numpy as np
 
 
+def inicializar_dominio_periodico(nx, ny, lx=1.0, ly=1.0):
+    """Malla periódica: nx·ny nodos distintos, el punto x = lx coincide con x = 0 y no se repite
+
+    Returns:
+        x, y, dx, dy con dx = lx / nx, dy = ly / ny
+    """
+    dx = lx / nx
+    dy = ly / ny
+    return np.arange(nx) * dx, np.arange(ny) * dy, dx, dy
+
+
 def inicializar_dominio(nx, ny, lx=1.0, ly=1.0):
     """Crea malla espacial
     
@@ -107,3 +118,59 @@ def aplicar_frontera_mixta(u, dx, dy, borde_dirichlet, borde_neumann):
             u[:, 0] = u[:, 1] - flujo * dx
         elif borde == 'derecho':
             u[:, -1] = u[:, -2] + flujo * dx
+
+
+BORDES = ('inferior', 'superior', 'izquierdo', 'derecho')
+
+
+def normalizar_bordes(tipo_frontera, valor_frontera=0.0, bordes=None):
+    """Describe cada borde como ('dirichlet', valor), ('flujo', beta, g) con ∂u/∂n + beta·u = g,
+    o ('periodica',)
+
+    Args:
+        tipo_frontera: 'dirichlet', 'neumann', 'periodica' o 'mixta'
+        valor_frontera: valor (Dirichlet) o flujo (Neumann, derivada a lo largo del eje
+            como en aplicar_frontera_neumann) común a los cuatro bordes
+        bordes: solo con 'mixta', dict {'inferior': espec, ...} donde espec es
+            ('dirichlet', valor), ('neumann', flujo) con flujo = ∂u/∂n (normal exterior),
+            ('robin', coeficiente, valor_exterior) con ∂u/∂n = -coeficiente·(u - valor_exterior),
+            o ('periodica',) en ambos bordes opuestos
+    Returns:
+        dict con una descripción normalizada por borde; inferior/superior son u[0, :] y u[-1, :]
+    """
+    if tipo_frontera == 'dirichlet':
+        return {borde: ('dirichlet', valor_frontera) for borde in BORDES}
+    if tipo_frontera == 'neumann':
+        # Flujo a lo largo del eje: la normal exterior apunta hacia atrás en inferior e izquierdo
+        return {'inferior': ('flujo', 0.0, -valor_frontera), 'superior': ('flujo', 0.0, valor_frontera),
+                'izquierdo': ('flujo', 0.0, -valor_frontera), 'derecho': ('flujo', 0.0, valor_frontera)}
+    if tipo_frontera == 'periodica':
+        return {borde: ('periodica',) for borde in BORDES}
+    if tipo_frontera != 'mixta':
+        raise ValueError('Tipo de frontera no soportado.')
+    if bordes is None or set(bordes) != set(BORDES):
+        raise ValueError(f'La frontera mixta requiere los cuatro bordes: {BORDES}')
+    normalizados = {}
+    for borde, espec in bordes.items():
+        tipo = espec[0]
+        if tipo == 'dirichlet':
+            normalizados[borde] = ('dirichlet', espec[1])
+        elif tipo == 'neumann':
+            normalizados[borde] = ('flujo', 0.0, espec[1])
+        elif tipo == 'robin':
+            coeficiente, exterior = espec[1], espec[2]
+            normalizados[borde] = ('flujo', coeficiente, coeficiente * exterior)
+        elif tipo == 'periodica':
+            normalizados[borde] = ('periodica',)
+        else:
+            raise ValueError(f"Condición '{tipo}' no reconocida en el borde {borde}")
+    for a, b in (('inferior', 'superior'), ('izquierdo', 'derecho')):
+        if (normalizados[a][0] == 'periodica') != (normalizados[b][0] == 'periodica'):
+            raise ValueError(f'Los bordes {a} y {b} deben ser periódicos a la vez.')
+    return normalizados
+
+
+def aplicar_bordes_dirichlet(u, bordes):
+    """Fija los valores de los bordes Dirichlet de una descripción normalizada"""
+    aplicar_frontera_mixta(u, 0.0, 0.0, {borde: espec[1] for borde, espec in bordes.items()
+                                         if espec[0] == 'dirichlet'}, {})
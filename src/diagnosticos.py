@@ -0,0 +1,80 @@
+"""Diagnósticos calculados durante la integración: energía, normas, extremos, flujo y error
+
+Se conecta como observador de SolucionadorCalor y escribe cada registro en un
+arreglo compacto preasignado, sin guardar historiales ni hacer una segunda pasada.
+"""
+
+import numpy as np
+from src.validacion import error_l2, error_linf
+
+CAMPOS = ('t', 'energia', 'norma_l2', 'norma_linf', 'maximo', 'minimo', 'flujo_frontera')
+CAMPOS_ERROR = ('error_l2', 'error_linf')
+
+
+class Diagnosticos:
+    """Monitor de conservación y precisión con cadencia configurable.
+
+    La energía usa pesos trapezoidales (los que conservan exactamente los esquemas
+    con Neumann implícito) y el flujo es α∮∂u/∂n ds con diferencias unilaterales de
+    segundo orden, de modo que d(energía)/dt ≈ flujo_frontera.
+
+    Args:
+        dx, dy: pasos espaciales (eje 0 ↔ dx, como en los solucionadores)
+        alpha: difusividad, escala el flujo de frontera
+        cada: registra uno de cada `cada` pasos
+        referencia: callable opcional referencia(t) -> campo exacto para el error relativo
+        capacidad: registros preasignados (crece al doble si se agota)
+    """
+
+    def __init__(self, dx, dy, alpha=1.0, cada=1, referencia=None, capacidad=1024):
+        self.dx, self.dy, self.alpha = dx, dy, alpha
+        self.cada = int(cada)
+        self.referencia = referencia
+        self.campos = CAMPOS + (CAMPOS_ERROR if referencia is not None else ())
+        self._datos = np.empty((int(capacidad), len(self.campos)))
+        self._pesos = None
+        self.n = 0
+
+    def _pesos_trapecio(self, forma):
+        if self._pesos is None or self._pesos.shape != forma:
+            w_x = np.full(forma[0], self.dx); w_x[[0, -1]] *= 0.5
+            w_y = np.full(forma[1], self.dy); w_y[[0, -1]] *= 0.5
+            self._pesos = np.outer(w_x, w_y)
+        return self._pesos
+
+    def _flujo(self, u):
+        """α∮∂u/∂n ds: derivada normal exterior unilateral de segundo orden en cada borde"""
+        def borde(b0, b1, b2, h, ds):
+            derivada = (3*b0 - 4*b1 + b2) / (2*h)
+            return ds * (np.sum(derivada) - 0.5*(derivada[0] + derivada[-1]))
+        total = (borde(u[0], u[1], u[2], self.dx, self.dy) + borde(u[-1], u[-2], u[-3], self.dx, self.dy)
+                 + borde(u[:, 0], u[:, 1], u[:, 2], self.dy, self.dx)
+                 + borde(u[:, -1], u[:, -2], u[:, -3], self.dy, self.dx))
+        return self.alpha * total
+
+    def reiniciar(self):
+        """Descarta los registros"""
+        self.n = 0
+
+    def registrar(self, u, t, paso=0):
+        """Calcula y guarda los diagnósticos si `paso` cae en la cadencia; lo llama el solucionador"""
+        if paso % self.cada:
+            return
+        if self.n == len(self._datos):
+            self._datos = np.concatenate([self._datos, np.empty_like(self._datos)])
+        pesos = self._pesos_trapecio(u.shape)
+        fila = self._datos[self.n]
+        fila[:len(CAMPOS)] = (t, np.vdot(pesos, u), np.sqrt(np.vdot(pesos, u*u)), np.max(np.abs(u)),
+                              u.max(), u.min(), self._flujo(u))
+        if self.referencia is not None:
+            exacta = self.referencia(t)
+            fila[len(CAMPOS):] = (error_l2(u, exacta), error_linf(u, exacta))
+        self.n += 1
+
+    def __getitem__(self, campo):
+        """Serie temporal de un diagnóstico, p. ej. diagnosticos['energia']"""
+        return self._datos[:self.n, self.campos.index(campo)]
+
+    def como_dict(self):
+        """Todas las series como dict de arreglos"""
+        return {campo: self[campo] for campo in self.campos}
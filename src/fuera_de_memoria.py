@@ -0,0 +1,164 @@
+"""FTCS fuera de memoria: el campo vive en archivos np.memmap y se procesa por bloques de filas
+
+Cada pasada lee un bloque de filas con k+1 filas de halo a cada lado, aplica k
+pasos de tiempo sobre el bloque (bloqueo temporal) y escribe solo las filas
+propias en el archivo de salida. La memoria de trabajo depende del tamaño del
+bloque, no del tamaño de la malla.
+"""
+
+import os
+import shutil
+import tempfile
+import weakref
+import numpy as np
+
+_BYTES = np.dtype(np.float64).itemsize
+
+
+def _abrir_filas(ruta, forma, inicio, fin, modo):
+    """Mapea solo las filas [inicio, fin) de un archivo binario de forma (nx, ny)"""
+    ny = forma[1]
+    return np.memmap(ruta, dtype=np.float64, mode=modo, offset=inicio * ny * _BYTES,
+                     shape=(fin - inicio, ny))
+
+
+def _copiar_a_archivo(u0, ruta, filas_por_bloque):
+    """Copia u0 (arreglo o .npy) al archivo de trabajo sin cargarlo completo"""
+    if isinstance(u0, (str, os.PathLike)):
+        u0 = np.load(u0, mmap_mode='r')
+    nx, ny = u0.shape
+    destino = np.memmap(ruta, dtype=np.float64, mode='w+', shape=(nx, ny))
+    del destino
+    for inicio in range(0, nx, filas_por_bloque):
+        fin = min(nx, inicio + filas_por_bloque)
+        bloque = _abrir_filas(ruta, (nx, ny), inicio, fin, 'r+')
+        bloque[:] = u0[inicio:fin]
+        del bloque
+    return nx, ny
+
+
+def _frontera_bloque(v, arriba, abajo, tipo_frontera, valor_frontera, dx, dy):
+    """Aplica la frontera a un bloque local; las filas de borde solo si el bloque las contiene"""
+    if tipo_frontera == 'dirichlet':
+        if arriba:
+            v[0, :] = valor_frontera
+        if abajo:
+            v[-1, :] = valor_frontera
+        v[:, 0] = valor_frontera
+        v[:, -1] = valor_frontera
+    elif tipo_frontera == 'neumann':
+        if arriba:
+            v[0, :] = v[1, :] - valor_frontera * dy
+        if abajo:
+            v[-1, :] = v[-2, :] + valor_frontera * dy
+        v[:, 0] = v[:, 1] - valor_frontera * dx
+        v[:, -1] = v[:, -2] + valor_frontera * dx
+    else:
+        raise ValueError('Tipo de frontera no soportado.')
+
+
+def _paso_bloque(u, u_new, tmp, r_x, r_y):
+    """Un paso FTCS en el interior de u, en sitio sobre u_new y el temporal tmp (sin otros arreglos)"""
+    interior = u_new[1:-1, 1:-1]
+    tmp = tmp[:interior.shape[0], :interior.shape[1]]
+    np.add(u[2:, 1:-1], u[0:-2, 1:-1], out=interior)
+    interior *= r_x
+    np.add(u[1:-1, 2:], u[1:-1, 0:-2], out=tmp)
+    tmp *= r_y
+    interior += tmp
+    np.multiply(u[1:-1, 1:-1], 1 - 2*r_x - 2*r_y, out=tmp)
+    interior += tmp
+
+
+def filas_por_bloque(ny, memoria_max, pasos_por_bloque):
+    """Filas propias por bloque para que el trabajo quepa en memoria_max bytes
+
+    El trabajo son tres arreglos de (filas + 2(k+1)) × ny valores float64: el bloque,
+    su paso siguiente y el temporal del esténcil, reservados una vez para todas las pasadas.
+    """
+    filas = memoria_max // (3 * ny * _BYTES) - 2 * (pasos_por_bloque + 1)
+    if filas < 1:
+        raise ValueError('memoria_max insuficiente para una fila con su halo.')
+    return int(filas)
+
+
+def _integrar_memmap(u0, dx, dy, dt, pasos, alpha, tipo_frontera, valor_frontera, rutas, memoria_max,
+                     pasos_por_bloque):
+    """Pasadas por bloques entre los dos archivos de trabajo; al terminar rutas[0] es la solución"""
+    forma = np.load(u0, mmap_mode='r').shape if isinstance(u0, (str, os.PathLike)) else u0.shape
+    k = max(1, min(pasos_por_bloque, pasos)) if pasos > 0 else 1
+    filas = filas_por_bloque(forma[1], memoria_max, k)
+    nx, ny = _copiar_a_archivo(u0, rutas[0], filas)
+    np.memmap(rutas[1], dtype=np.float64, mode='w+', shape=(nx, ny)).flush()
+
+    r_x = alpha * dt / dx**2
+    r_y = alpha * dt / dy**2
+    # Buffers del bloque con su halo, reutilizados en todos los bloques y pasadas
+    forma_trabajo = (min(nx, filas + 2 * (k + 1)), ny)
+    trabajo_a, trabajo_b, tmp = np.empty(forma_trabajo), np.empty(forma_trabajo), np.empty(forma_trabajo)
+    hechos = 0
+    while hechos < pasos:
+        k_pasada = min(k, pasos - hechos)
+        origen, destino = rutas
+        for inicio in range(0, nx, filas):
+            fin = min(nx, inicio + filas)
+            # Halo de k+1 filas: Neumann lee la fila vecina del borde en el mismo paso
+            a = max(0, inicio - k_pasada - 1)
+            b = min(nx, fin + k_pasada + 1)
+            u, u_new = trabajo_a[:b - a], trabajo_b[:b - a]
+            bloque = _abrir_filas(origen, forma, a, b, 'r')
+            u[...] = bloque
+            del bloque
+            u_new[...] = u
+            for _ in range(k_pasada):
+                # Esquema FTCS en el interior del bloque (el halo se degrada una fila por paso)
+                _paso_bloque(u, u_new, tmp, r_x, r_y)
+                _frontera_bloque(u_new, a == 0, b == nx, tipo_frontera, valor_frontera, dx, dy)
+                u, u_new = u_new, u
+            salida = _abrir_filas(destino, forma, inicio, fin, 'r+')
+            salida[:] = u[inicio - a:fin - a]
+            salida.flush()
+            del salida
+        rutas.reverse()
+        hechos += k_pasada
+    return nx, ny
+
+
+def resolver_ftcs_memmap(u0, dx, dy, dt, pasos, alpha=1.0, tipo_frontera='dirichlet',
+                         valor_frontera=0.0, directorio=None, memoria_max=256 * 2**20,
+                         pasos_por_bloque=8):
+    """Resuelve la ecuación de calor 2D con FTCS manteniendo el campo en disco.
+    Args:
+        u0: temperatura inicial np.ndarray o ruta a un archivo .npy
+        dx, dy: pasos espaciales
+        dt: paso temporal
+        pasos: pasos de tiempo
+        alpha: difusividad
+        tipo_frontera: 'dirichlet' o 'neumann'
+        valor_frontera: valor para frontera
+        directorio: carpeta para los archivos de trabajo. Con None se usa una carpeta
+            temporal: el archivo auxiliar se borra al terminar y el de la solución cuando
+            se libera el memmap devuelto (o al salir del intérprete)
+        memoria_max: bytes máximos de los arreglos de trabajo en memoria (ver filas_por_bloque)
+        pasos_por_bloque: pasos de tiempo aplicados por cada lectura de un bloque
+    Returns:
+        np.memmap de solo lectura con la solución final (mismo resultado que
+        resolver_ftcs(...)[-1])
+    """
+    temporal = directorio is None
+    if temporal:
+        directorio = tempfile.mkdtemp(prefix='ftcs_memmap_')
+    os.makedirs(directorio, exist_ok=True)
+    rutas = [os.path.join(directorio, 'u_a.dat'), os.path.join(directorio, 'u_b.dat')]
+    try:
+        nx, ny = _integrar_memmap(u0, dx, dy, dt, pasos, alpha, tipo_frontera, valor_frontera, rutas,
+                                  memoria_max, pasos_por_bloque)
+    except BaseException:
+        if temporal:
+            shutil.rmtree(directorio, ignore_errors=True)
+        raise
+    solucion = np.memmap(rutas[0], dtype=np.float64, mode='r', shape=(nx, ny))
+    if temporal:
+        os.remove(rutas[1])
+        weakref.finalize(solucion, shutil.rmtree, directorio, True)
+    return solucion
@@ -0,0 +1,154 @@
+"""Historial comprimido de instantáneas: cuantización con error acotado y codificación por deltas
+
+Cada campo se cuantiza a enteros K = round(u / q) con q = 2·error_max, de modo que
+|u - q·K| ≤ error_max. Cada `cada_clave` cuadros se guarda un cuadro clave con K
+completo; los demás guardan solo K_n - K_{n-1}, que en la ecuación de calor es
+casi siempre cero o muy pequeño y cabe en int8/int16. Cada cuadro se comprime
+por separado con zlib, así que cualquier cuadro se reconstruye leyendo a lo sumo
+un cuadro clave y `cada_clave - 1` deltas.
+"""
+
+import zlib
+import numpy as np
+
+_TIPOS_ENTEROS = (np.int8, np.int16, np.int32, np.int64)
+
+
+def _entero_minimo(valores):
+    """Menor tipo entero con signo que representa todos los valores"""
+    if valores.size == 0:
+        return np.int8
+    bajo, alto = valores.min(), valores.max()
+    for tipo in _TIPOS_ENTEROS:
+        info = np.iinfo(tipo)
+        if info.min <= bajo and alto <= info.max:
+            return tipo
+    return np.int64
+
+
+class HistorialComprimido:
+    """Secuencia de campos 2D con error absoluto máximo garantizado y acceso aleatorio.
+
+    Args:
+        forma: forma de cada campo
+        error_max: error absoluto máximo por nodo al reconstruir
+        cada_clave: distancia entre cuadros clave (acota el costo del acceso aleatorio)
+        nivel: nivel de compresión zlib (0 = sin compresión)
+    """
+
+    def __init__(self, forma, error_max, cada_clave=32, nivel=1):
+        if error_max <= 0:
+            raise ValueError('error_max debe ser positivo.')
+        self.forma = tuple(forma)
+        self.error_max = float(error_max)
+        self.cada_clave = int(cada_clave)
+        self.nivel = int(nivel)
+        self._q = 2 * self.error_max
+        self._cuadros = []  # (dtype, bytes) por cuadro; puede leerse de un .npz bajo demanda
+        self._ultimo = None  # K del último cuadro agregado
+        self._cache = (None, None)  # (índice, K) del último cuadro reconstruido
+
+    def __len__(self):
+        return len(self._cuadros)
+
+    def agregar(self, u):
+        """Cuantiza y agrega un campo al final del historial"""
+        u = np.asarray(u, dtype=float)
+        if u.shape != self.forma:
+            raise ValueError(f'Se esperaba un campo de forma {self.forma}, se recibió {u.shape}')
+        K = np.rint(u / self._q).astype(np.int64)
+        if len(self._cuadros) % self.cada_clave == 0:
+            datos = K
+        else:
+            datos = K - self._ultimo
+        datos = datos.astype(_entero_minimo(datos))
+        crudo = datos.tobytes()
+        self._cuadros.append((datos.dtype.str, zlib.compress(crudo, self.nivel) if self.nivel else crudo))
+        self._ultimo = K
+
+    def extender(self, campos):
+        """Agrega todos los campos de un iterable"""
+        for u in campos:
+            self.agregar(u)
+
+    def _decodificar(self, i):
+        tipo, datos = self._cuadros[i]
+        if self.nivel:
+            datos = zlib.decompress(datos)
+        return np.frombuffer(datos, dtype=tipo).reshape(self.forma).astype(np.int64)
+
+    def _enteros(self, i):
+        indice, K = self._cache
+        clave = i - i % self.cada_clave
+        if indice is None or not clave <= indice <= i:
+            indice, K = clave, self._decodificar(clave)
+        else:
+            K = K.copy()
+        # Recorrido secuencial: continúa desde el último cuadro reconstruido
+        for j in range(indice + 1, i + 1):
+            K += self._decodificar(j)
+        self._cache = (i, K)
+        return K
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError('Índice de cuadro fuera de rango.')
+        return self._enteros(i) * self._q
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def nbytes(self):
+        """Bytes ocupados por los cuadros comprimidos"""
+        return sum(len(datos) for _, datos in self._cuadros)
+
+    def razon_compresion(self):
+        """Tamaño en float64 dividido entre el tamaño comprimido"""
+        return len(self) * int(np.prod(self.forma)) * 8 / max(1, self.nbytes())
+
+    def guardar(self, ruta):
+        """Guarda el historial en un .npz (un arreglo de bytes por cuadro)"""
+        cuadros = {f'cuadro_{i:06d}': np.frombuffer(datos, dtype=np.uint8)
+                   for i, (_, datos) in enumerate(self._cuadros)}
+        np.savez(ruta, forma=np.array(self.forma), error_max=self.error_max, cada_clave=self.cada_clave,
+                 nivel=self.nivel, tipos=np.array([tipo for tipo, _ in self._cuadros], dtype='U4'),
+                 **cuadros)
+
+    @classmethod
+    def cargar(cls, ruta):
+        """Abre un historial guardado; los cuadros quedan en memoria tal como se comprimieron"""
+        with np.load(ruta) as archivo:
+            historial = cls(archivo['forma'], float(archivo['error_max']), int(archivo['cada_clave']),
+                            int(archivo['nivel']))
+            historial._cuadros = [(str(tipo), archivo[f'cuadro_{i:06d}'].tobytes())
+                                  for i, tipo in enumerate(archivo['tipos'])]
+        if len(historial):
+            historial._ultimo = historial._enteros(len(historial) - 1)
+        return historial
+
+
+def integrar_comprimido(solucionador, u0, pasos, error_max, cada=1, **opciones):
+    """Como resolver_*, pero guarda el historial comprimido en lugar de una lista de copias.
+    Args:
+        solucionador: SolucionadorCalor ya construido
+        u0: temperatura inicial
+        pasos: pasos de tiempo
+        error_max: error absoluto máximo por nodo del historial
+        cada: guarda uno de cada `cada` pasos (siempre incluye el inicial)
+        opciones: argumentos adicionales de HistorialComprimido
+    Returns:
+        HistorialComprimido con los campos guardados
+    """
+    solucionador.fijar_estado(u0)
+    historial = HistorialComprimido(solucionador.forma, error_max, **opciones)
+    historial.agregar(solucionador.u)
+    for n in range(1, pasos + 1):
+        solucionador.paso()
+        if n % cada == 0:
+            historial.agregar(solucionador.u)
+    return historial
@@ -0,0 +1,236 @@
+"""Operadores y sistemas lineales compartidos por los solucionadores de la ecuación de calor 2D"""
+
+import numpy as np
+from scipy.linalg.lapack import dgttrf, dgttrs
+
+
+class FactorTridiagonal:
+    """Factorización LU (LAPACK gttrf) de una matriz tridiagonal, reutilizable en cada paso.
+
+    Resuelve todas las líneas de un barrido en una sola llamada: el lado derecho
+    es una matriz (n, m) con una línea por columna.
+    """
+    __slots__ = ('n', '_factores')
+
+    def __init__(self, inferior, diagonal, superior):
+        diagonal = np.asarray(diagonal, dtype=float)
+        self.n = len(diagonal)
+        dl, d, du, du2, ipiv, info = dgttrf(np.asarray(inferior, dtype=float), diagonal,
+                                            np.asarray(superior, dtype=float))
+        if info != 0:
+            raise np.linalg.LinAlgError('Matriz tridiagonal singular.')
+        self._factores = (dl, d, du, du2, ipiv)
+
+    def resolver(self, b):
+        """Resuelve A x = b a lo largo del eje 0; si b es contiguo en Fortran se sobrescribe"""
+        x, info = dgttrs(*self._factores, b, overwrite_b=1)
+        return x
+
+
+class FactorCiclico:
+    """Sistema tridiagonal cíclico (esquinas A[0, n-1] y A[n-1, 0]) por Sherman-Morrison.
+
+    Reutiliza FactorTridiagonal: A = B + u vᵀ con B tridiagonal, así que cada
+    resolución son dos sustituciones con la misma factorización de B.
+    """
+    __slots__ = ('n', '_factor', '_z', '_v_fin', '_denominador')
+
+    def __init__(self, inferior, diagonal, superior, esquina_superior, esquina_inferior):
+        diagonal = np.array(diagonal, dtype=float)
+        self.n = len(diagonal)
+        gamma = -diagonal[0]
+        # u = (γ, 0, ..., c)ᵀ, v = (1, 0, ..., a/γ)ᵀ con a = A[0, n-1], c = A[n-1, 0]
+        self._v_fin = esquina_superior / gamma
+        diagonal[0] -= gamma
+        diagonal[-1] -= esquina_inferior * self._v_fin
+        self._factor = FactorTridiagonal(inferior, diagonal, superior)
+        u = np.zeros((self.n, 1), order='F')
+        u[0], u[-1] = gamma, esquina_inferior
+        self._z = self._factor.resolver(u)[:, 0].copy()
+        self._denominador = 1 + self._z[0] + self._v_fin * self._z[-1]
+
+    def resolver(self, b):
+        """Resuelve A x = b a lo largo del eje 0 (todas las columnas a la vez)"""
+        y = self._factor.resolver(b)
+        correccion = (y[0] + self._v_fin * y[-1]) / self._denominador
+        y -= np.multiply.outer(self._z, correccion)
+        return y
+
+
+def factorizar_linea(n, r):
+    """Factoriza la matriz de línea implícita tridiag(-r, 1+2r, -r) de tamaño n"""
+    return FactorTridiagonal(np.full(n - 1, -r), np.full(n, 1 + 2*r), np.full(n - 1, -r))
+
+
+def resolver_lineas(factor, b, eje):
+    """Resuelve un sistema tridiagonal por cada línea de b a lo largo de `eje` (0 o 1), en sitio
+
+    b debe ser contiguo en Fortran si eje == 0 y en C si eje == 1 para evitar copias.
+    """
+    if eje == 0:
+        x = factor.resolver(b)
+    else:
+        x = factor.resolver(b.T).T
+    if x is not b and not np.shares_memory(x, b):
+        b[...] = x
+    return b
+
+
+def laplaciano_disperso(nx, ny, dx, dy):
+    """Laplaciano de 5 puntos de los (nx-2)·(ny-2) nodos interiores (Dirichlet), formato CSR.
+
+    Las incógnitas se ordenan como u[1:-1, 1:-1].ravel() (orden C), con el eje 0
+    asociado a dx igual que en los solucionadores.
+    """
+    from scipy.sparse import diags, identity, kron
+    mx, my = nx - 2, ny - 2
+    d2x = diags([np.ones(mx - 1), np.full(mx, -2.0), np.ones(mx - 1)], [-1, 0, 1]) / dx**2
+    d2y = diags([np.ones(my - 1), np.full(my, -2.0), np.ones(my - 1)], [-1, 0, 1]) / dy**2
+    return (kron(d2x, identity(my)) + kron(identity(mx), d2y)).tocsr()
+
+
+def operador_enmascarado(mascara, dx, dy, tipo_frontera='dirichlet', valor_frontera=0.0):
+    """Laplaciano de 5 puntos restringido a los nodos activos de una máscara, formato CSR.
+
+    Las incógnitas son u.ravel()[activos] (orden C). Un vecino inactivo o fuera de la
+    malla es frontera interna: con 'dirichlet' vale valor_frontera y pasa al término
+    constante; con 'neumann' se elimina como punto fantasma u_f = u + h·valor_frontera
+    (valor_frontera = ∂u/∂n exterior, 0 para un agujero aislado).
+    Returns:
+        (A, c, activos): A·v + c aproxima δ²u en los nodos activos
+    """
+    from scipy.sparse import coo_matrix
+    if tipo_frontera not in ('dirichlet', 'neumann'):
+        raise ValueError('Tipo de frontera no soportado.')
+    mascara = np.asarray(mascara, dtype=bool)
+    nx, ny = mascara.shape
+    activos = np.flatnonzero(mascara)
+    n = len(activos)
+    indice = np.full(nx * ny, -1, dtype=np.intp)
+    indice[activos] = np.arange(n)
+    i, j = np.divmod(activos, ny)
+    filas, columnas, valores = [], [], []
+    diagonal = np.full(n, -2/dx**2 - 2/dy**2)
+    c = np.zeros(n)
+    for di, dj, h in ((-1, 0, dx), (1, 0, dx), (0, -1, dy), (0, 1, dy)):
+        vi, vj = i + di, j + dj
+        dentro = (vi >= 0) & (vi < nx) & (vj >= 0) & (vj < ny)
+        vecino = np.full(n, -1, dtype=np.intp)
+        vecino[dentro] = indice[vi[dentro] * ny + vj[dentro]]
+        vivo = vecino >= 0
+        filas.append(np.flatnonzero(vivo))
+        columnas.append(vecino[vivo])
+        valores.append(np.full(np.count_nonzero(vivo), 1/h**2))
+        muerto = ~vivo
+        if tipo_frontera == 'dirichlet':
+            c[muerto] += valor_frontera / h**2
+        else:
+            diagonal[muerto] += 1/h**2
+            c[muerto] += valor_frontera / h
+    filas.append(np.arange(n)); columnas.append(np.arange(n)); valores.append(diagonal)
+    A = coo_matrix((np.concatenate(valores), (np.concatenate(filas), np.concatenate(columnas))),
+                   shape=(n, n)).tocsr()
+    return A, c, activos
+
+
+def contribucion_frontera(u, dx, dy):
+    """Término de la frontera en el Laplaciano de 5 puntos: L·u_interior + b = δ²u en el interior"""
+    b = np.zeros((u.shape[0] - 2, u.shape[1] - 2))
+    b[0, :] += u[0, 1:-1] / dx**2
+    b[-1, :] += u[-1, 1:-1] / dx**2
+    b[:, 0] += u[1:-1, 0] / dy**2
+    b[:, -1] += u[1:-1, -1] / dy**2
+    return b
+
+
+def operador_linea(n, h, inicio, fin):
+    """Diagonales (inferior, diagonal, superior) y término constante de δ² en una línea completa.
+
+    inicio y fin son bordes normalizados (ver condiciones.normalizar_bordes). Un borde de
+    flujo ∂u/∂n + beta·u = g elimina el punto fantasma: δ²u_0 = 2u_1 - (2 + 2h·beta)u_0 + 2h·g.
+    Un borde Dirichlet deja su fila en cero (el nodo no cambia). Si ambos bordes son
+    periódicos la línea es cíclica: el último término es el coeficiente de las esquinas
+    T[0, n-1] = T[n-1, 0] (cero en líneas no cíclicas).
+    """
+    inferior = np.ones(n - 1)
+    diagonal = np.full(n, -2.0)
+    superior = np.ones(n - 1)
+    constante = np.zeros(n)
+    if (inicio[0] == 'periodica') != (fin[0] == 'periodica'):
+        raise ValueError('Los dos bordes opuestos deben ser periódicos a la vez.')
+    if inicio[0] == 'periodica':
+        return inferior, diagonal, superior, constante, 1.0
+    for fila, vecino, borde in ((0, superior, inicio), (n - 1, inferior, fin)):
+        k = 0 if fila == 0 else n - 2
+        if borde[0] == 'dirichlet':
+            diagonal[fila] = 0.0
+            vecino[k] = 0.0
+        else:
+            _, beta, g = borde
+            diagonal[fila] = -(2 + 2*h*beta)
+            vecino[k] = 2.0
+            constante[fila] = 2*h*g
+    return inferior, diagonal, superior, constante, 0.0
+
+
+def factorizar_operador(operador, r):
+    """Factoriza I - r·T para el operador de línea T = operador_linea(...)"""
+    inferior, diagonal, superior, _, esquina = operador
+    if esquina:
+        return FactorCiclico(-r * inferior, 1 - r * diagonal, -r * superior, -r * esquina, -r * esquina)
+    return FactorTridiagonal(-r * inferior, 1 - r * diagonal, -r * superior)
+
+
+def aplicar_operador(operador, u, eje, out):
+    """out = T u + c a lo largo de `eje` (0 o 1) para todas las líneas de u, sin copias de u"""
+    inferior, diagonal, superior, constante, esquina = operador
+    if eje == 1:
+        out, u = out.T, u.T
+    np.multiply(u, diagonal[:, None], out=out)
+    out[1:] += inferior[:, None] * u[:-1]
+    out[:-1] += superior[:, None] * u[1:]
+    out += constante[:, None]
+    if esquina:
+        # Extremos cíclicos: vecinos envueltos sin np.roll
+        out[0] += esquina * u[-1]
+        out[-1] += esquina * u[0]
+    return out
+
+
+def operador_malla(nx, ny, dx, dy, bordes):
+    """Laplaciano de la malla completa (A, c) con δ²u/h² ≈ A u + c, para u.ravel() en orden C.
+
+    Se ensambla con operador_linea en cada dirección, así que admite cualquier
+    combinación de bordes normalizados; las filas de nodos Dirichlet quedan en cero.
+    """
+    from scipy.sparse import diags, identity, kron
+    op_x = operador_linea(nx, dx, bordes['inferior'], bordes['superior'])
+    op_y = operador_linea(ny, dy, bordes['izquierdo'], bordes['derecho'])
+    t_x = _matriz_linea(op_x) / dx**2
+    t_y = _matriz_linea(op_y) / dy**2
+    A = (kron(t_x, identity(ny)) + kron(identity(nx), t_y)).tocsr()
+    c = (op_x[3][:, None] / dx**2 + op_y[3][None, :] / dy**2)
+    libres = np.ones((nx, ny))
+    for borde, indice in (('inferior', np.s_[0, :]), ('superior', np.s_[-1, :]),
+                          ('izquierdo', np.s_[:, 0]), ('derecho', np.s_[:, -1])):
+        if bordes[borde][0] == 'dirichlet':
+            libres[indice] = 0.0
+    libres = libres.ravel()
+    return (diags(libres) @ A).tocsr(), c.ravel() * libres
+
+
+def _matriz_linea(operador):
+    """Matriz dispersa de un operador de línea, con esquinas si es cíclico"""
+    from scipy.sparse import diags
+    inferior, diagonal, superior, _, esquina = operador
+    n = len(diagonal)
+    if esquina and n > 2:
+        return diags([inferior, diagonal, superior, [esquina], [esquina]], [-1, 0, 1, n - 1, -(n - 1)])
+    return diags([inferior, diagonal, superior], [-1, 0, 1])
+
+
+def factorizar_malla(A, coeficiente):
+    """Factorización LU dispersa (SuperLU) de I - coeficiente·A, reutilizable en cada paso"""
+    from scipy.sparse import identity
+    from scipy.sparse.linalg import splu
+    return splu((identity(A.shape[0], format='csc') - coeficiente * A).tocsc())
@@ -0,0 +1,142 @@
+"""Modelo de orden reducido POD para consultas repetidas sobre la misma placa
+
+Etapa fuera de línea: se recogen instantáneas de SolucionadorCalor para varios
+valores de frontera y condiciones iniciales, se extrae una base POD Φ con una SVD
+aleatorizada y se proyecta el operador de la malla: A_r = Φᵀ A Φ. Etapa en línea:
+el sistema reducido a' = A_r a se avanza exactamente con la exponencial de una
+matriz r×r, y un indicador de error barato decide si hace falta recurrir al
+solucionador completo. El indicador suma la parte cuasiestática del error,
+‖A⁻¹(I - ΦΦᵀ)AΦ a(t)‖ (una forma cuadrática r×r precalculada), y el error de
+proyección de u0 amortiguado por el modo más lento del problema.
+"""
+
+import numpy as np
+from scipy.linalg import expm
+from src.condiciones import aplicar_frontera_dirichlet, normalizar_bordes
+from src.operadores import laplaciano_disperso, operador_malla
+from src.solucionadores import SolucionadorCalor
+
+
+def svd_aleatoria(M, rango, sobremuestreo=10, iteraciones=2, semilla=0):
+    """SVD truncada aleatorizada (Halko, Martinsson y Tropp) de M (n, m).
+    Returns:
+        U (n, k), s (k,), Vt (k, m) con k = min(rango, n, m)
+    """
+    rng = np.random.default_rng(semilla)
+    k = min(rango, *M.shape)
+    Y = M @ rng.standard_normal((M.shape[1], min(k + sobremuestreo, M.shape[1])))
+    Q, _ = np.linalg.qr(Y)
+    for _ in range(iteraciones):  # iteración de potencia para espectros que decaen lento
+        Q, _ = np.linalg.qr(M.T @ Q)
+        Q, _ = np.linalg.qr(M @ Q)
+    U, s, Vt = np.linalg.svd(Q.T @ M, full_matrices=False)
+    return (Q @ U)[:, :k], s[:k], Vt[:k]
+
+
+class ModeloReducido:
+    """ROM POD de la ecuación de calor 2D con frontera Dirichlet constante.
+
+    Args:
+        forma: (nx, ny) de la malla
+        dx, dy: pasos espaciales
+        alpha: difusividad
+        metodo, dt: solucionador completo usado para las instantáneas y como respaldo; por
+            defecto 'trbdf2', que incorpora la frontera Dirichlet no nula en su sistema
+        energia: fracción de energía de las instantáneas que conserva la base
+        rango_max: tamaño máximo de la base
+    """
+
+    def __init__(self, forma, dx, dy, alpha=1.0, metodo='trbdf2', dt=1e-3, energia=0.999999, rango_max=60):
+        self.forma = tuple(forma)
+        self.dx, self.dy, self.alpha = dx, dy, alpha
+        self.metodo, self.dt = metodo, dt
+        self.energia, self.rango_max = energia, rango_max
+        # Filas de frontera nulas: los nodos Dirichlet conservan su valor inicial
+        self._A = alpha * operador_malla(*self.forma, dx, dy, normalizar_bordes('dirichlet'))[0]
+        self.base = None
+        self.valores_singulares = None
+        self._A_r = None
+        self._gram_residuo = None
+        nx, ny = self.forma
+        # Autovalor más lento del Laplaciano discreto con Dirichlet
+        self._decaimiento = alpha * (4/dx**2 * np.sin(np.pi / (2*(nx-1)))**2
+                                     + 4/dy**2 * np.sin(np.pi / (2*(ny-1)))**2)
+        self._exponenciales = {}  # exp(t·A_r) por tiempo de consulta
+        self._solucionador = None
+
+    def _completo(self, valor_frontera):
+        """Solucionador completo con la frontera Dirichlet dada (operadores construidos una vez)
+
+        Con Dirichlet en los cuatro bordes el operador y su factorización no dependen del
+        valor de frontera: SolucionadorCalor.fijar_frontera solo cambia los datos.
+        """
+        if self._solucionador is None:
+            self._solucionador = SolucionadorCalor(self.forma, self.dx, self.dy, self.dt, self.metodo,
+                                                   self.alpha, valor_frontera=valor_frontera)
+        self._solucionador.fijar_frontera(valor_frontera)
+        return self._solucionador
+
+    def entrenar(self, condiciones, tiempos):
+        """Etapa fuera de línea.
+        Args:
+            condiciones: lista de (u0, valor_frontera) de entrenamiento
+            tiempos: tiempos de las instantáneas de cada corrida
+        Returns:
+            Tamaño de la base POD
+        """
+        instantaneas = []
+        for u0, valor_frontera in condiciones:
+            solucionador = self._completo(valor_frontera)
+            u0 = np.array(u0, dtype=float)
+            aplicar_frontera_dirichlet(u0, valor_frontera)
+            solucionador.fijar_estado(u0)
+            instantaneas += [u.ravel() for u in solucionador.en_tiempos(tiempos)]
+        M = np.column_stack(instantaneas)
+        U, s, _ = svd_aleatoria(M, self.rango_max)
+        acumulada = np.cumsum(s**2) / np.sum(s**2)
+        r = int(np.searchsorted(acumulada, self.energia) + 1)
+        self.base = U[:, :min(r, len(s))]
+        self.valores_singulares = s
+        A_phi = self._A @ self.base
+        self._A_r = self.base.T @ A_phi
+        # Residuo fuera de la base R = AΦ - Φ A_r; su respuesta cuasiestática S = A⁻¹R en el
+        # interior da ‖S a‖² = aᵀ SᵀS a con una matriz r×r precalculada
+        from scipy.sparse.linalg import splu
+        nx, ny = self.forma
+        R = (A_phi - self.base @ self._A_r).reshape(nx, ny, -1)[1:-1, 1:-1].reshape(-1, self.base.shape[1])
+        S = splu((self.alpha * laplaciano_disperso(nx, ny, self.dx, self.dy)).tocsc()).solve(R)
+        self._gram_residuo = S.T @ S
+        self._exponenciales.clear()
+        return self.base.shape[1]
+
+    def consultar(self, u0, valor_frontera, t, tol=1e-2):
+        """Etapa en línea: campo en el tiempo t con respaldo automático al solucionador completo.
+        Args:
+            u0: temperatura inicial (su frontera se fija a valor_frontera)
+            valor_frontera: temperatura Dirichlet de la frontera
+            t: tiempo de salida
+            tol: indicador de error relativo máximo aceptado para el modelo reducido
+        Returns:
+            (u, indicador, reducido): campo, indicador de error relativo y si vino del ROM
+        """
+        if self.base is None:
+            raise RuntimeError('El modelo reducido no está entrenado; llame a entrenar().')
+        u0 = np.array(u0, dtype=float)
+        aplicar_frontera_dirichlet(u0, valor_frontera)
+        v0 = u0.ravel()
+        a0 = self.base.T @ v0
+        propagador = self._exponenciales.get(t)
+        if propagador is None:
+            if len(self._exponenciales) >= 64:
+                self._exponenciales.clear()
+            propagador = self._exponenciales[t] = expm(t * self._A_r)
+        a = propagador @ a0
+        norma = max(np.linalg.norm(a), 1e-300)
+        residuo = np.sqrt(max(a @ self._gram_residuo @ a, 0.0)) / norma
+        proyeccion = np.linalg.norm(v0 - self.base @ a0) / max(np.linalg.norm(v0), 1e-300)
+        indicador = residuo + proyeccion * np.exp(-self._decaimiento * t)
+        if indicador <= tol:
+            return (self.base @ a).reshape(self.forma), indicador, True
+        solucionador = self._completo(valor_frontera)
+        solucionador.fijar_estado(u0)
+        return solucionador.en_tiempos([t])[0], indicador, False
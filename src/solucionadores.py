@@ -1,10 +1,392 @@
 """Solucionadores para la ecuación de calor 2D: FTCS, Crank-Nicolson y ADI"""
 
 import numpy as np
-from src.condiciones import aplicar_frontera_dirichlet, aplicar_frontera_neumann
+from src.condiciones import (aplicar_bordes_dirichlet, aplicar_frontera_dirichlet, aplicar_frontera_neumann,
+                             normalizar_bordes)
+from src.iterativo import GradienteConjugado
+from src.operadores import (FactorTridiagonal, aplicar_operador, factorizar_linea, factorizar_malla,
+                            factorizar_operador, operador_linea, operador_malla, resolver_lineas)
 
+METODOS = ('ftcs', 'cn', 'adi', 'be', 'bdf2', 'trbdf2')
+L_ESTABLES = ('be', 'bdf2', 'trbdf2')
+# TR-BDF2: con γ = 2 - √2 la etapa trapezoidal y la BDF2 comparten la matriz I - (γ/2)·dt·αA
+GAMMA_TRBDF2 = 2 - np.sqrt(2)
+FRONTERAS = ('dirichlet', 'neumann', 'periodica', 'mixta')
+ORDENES = (2, 4)
 
-def resolver_ftcs(u0, dx, dy, dt, pasos, alpha=1.0, tipo_frontera='dirichlet', valor_frontera=0.0):
+
+class SolucionadorCalor:
+    """Solucionador reutilizable de la ecuación de calor 2D en una malla fija.
+
+    Los coeficientes, las factorizaciones de las matrices de línea y los
+    buffers de trabajo se construyen una sola vez; fijar_estado() permite
+    reutilizar el mismo objeto para muchas simulaciones sobre la misma malla.
+    Los objetos en `observadores` (p. ej. src.sondas.Sondas) reciben
+    registrar(u, t, paso) al fijar el estado y tras cada paso.
+
+    Args:
+        forma: (nx, ny) de la malla
+        dx, dy: pasos espaciales
+        dt: paso temporal
+        metodo: 'ftcs', 'cn' o 'adi' (mismos esquemas que resolver_*), o los L-estables
+            'be' (Euler implícito), 'bdf2' y 'trbdf2', que factorizan una sola vez
+            la matriz dispersa de toda la malla (el primer paso de 'bdf2' es Euler implícito)
+        alpha: difusividad
+        tipo_frontera: 'dirichlet', 'neumann', 'periodica' o 'mixta'
+        valor_frontera: valor para frontera
+        bordes: condición por borde con tipo_frontera='mixta' (ver normalizar_bordes)
+        orden: orden espacial, 2 (5 puntos) o 4 (compacto de Padé, solo Dirichlet).
+            Con orden=4 'cn' y 'adi' usan el mismo esquema Peaceman-Rachford compacto;
+            'ftcs' compacto es estable para α dt (1/dx² + 1/dy²) ≤ 1/3.
+        lineal: solo con los L-estables; None factoriza con SuperLU, un dict de opciones de
+            src.iterativo.GradienteConjugado (p. ej. {'precondicionador': 'adi', 'tol': 1e-6})
+            usa gradiente conjugado con arranque en caliente. Sus iteraciones y residuos
+            quedan en self.lineal; los del primer paso de 'bdf2' (Euler implícito, otra
+            matriz) en self.lineal_inicio.
+
+    Con 'mixta', y con 'neumann' en 'cn'/'adi', los bordes de flujo y Robin se
+    incorporan en las filas de las matrices de línea eliminando el punto fantasma;
+    en ese caso 'cn' y 'adi' usan el mismo barrido Peaceman-Rachford. Con bordes
+    periódicos el esténcil se envuelve y las líneas implícitas son cíclicas
+    (Sherman-Morrison); la malla no repite el último punto (inicializar_dominio_periodico).
+    """
+    __slots__ = ('metodo', 'forma', 'dx', 'dy', 'dt', 'alpha', 'tipo_frontera', 'valor_frontera',
+                 'bordes', 'orden', 'r_x', 'r_y', 'u', 't', 'pasos_dados', 'observadores',
+                 '_aux', '_rhs_x', '_rhs_y', '_tmp', '_factor_x', '_factor_y',
+                 '_pade_x', '_pade_y', '_v', '_op_x', '_op_y', '_A', '_c', '_lu', '_lu_inicio', 'lineal',
+                 'lineal_inicio', '_opciones_lineales')
+
+    def __init__(self, forma, dx, dy, dt, metodo='ftcs', alpha=1.0, tipo_frontera='dirichlet',
+                 valor_frontera=0.0, orden=2, bordes=None, lineal=None):
+        if metodo not in METODOS:
+            raise ValueError(f"Método '{metodo}' no reconocido")
+        if tipo_frontera not in FRONTERAS:
+            raise ValueError('Tipo de frontera no soportado.')
+        if orden not in ORDENES:
+            raise ValueError(f'Orden espacial {orden} no soportado.')
+        if lineal is not None and metodo not in L_ESTABLES:
+            raise ValueError("El solucionador lineal iterativo solo se usa con 'be', 'bdf2' o 'trbdf2'.")
+        if orden == 4 and (tipo_frontera != 'dirichlet' or metodo in L_ESTABLES):
+            raise ValueError('El esquema compacto de cuarto orden solo admite frontera Dirichlet '
+                             'con ftcs, cn o adi.')
+        nx, ny = forma
+        self.metodo = metodo
+        self.orden = orden
+        self.forma = (nx, ny)
+        self.dx, self.dy, self.dt, self.alpha = dx, dy, dt, alpha
+        self.tipo_frontera = tipo_frontera
+        self.valor_frontera = valor_frontera
+        self.bordes = normalizar_bordes(tipo_frontera, valor_frontera, bordes)
+        self.u = np.zeros((nx, ny))
+        self._aux = np.zeros((nx, ny))
+        self.t = 0.0
+        self.pasos_dados = 0
+        self.observadores = []
+        if metodo == 'ftcs' or metodo in L_ESTABLES:
+            self.r_x = alpha * dt / dx**2
+            self.r_y = alpha * dt / dy**2
+            self._tmp = np.empty((nx-2, ny-2))
+            self._rhs_x = self._rhs_y = self._factor_x = self._factor_y = None
+        else:
+            self.r_x = alpha * dt / (2*dx**2)
+            self.r_y = alpha * dt / (2*dy**2)
+            # Barrido en x: líneas a lo largo del eje 0 (Fortran); barrido en y: eje 1 (C)
+            self._rhs_x = np.empty((nx-2, ny-2), order='F')
+            self._rhs_y = np.empty((nx-2, ny-2))
+            self._tmp = np.empty((nx-2, ny-2))
+            self._factor_x = factorizar_linea(nx-2, self.r_x)
+            self._factor_y = factorizar_linea(ny-2, self.r_y)
+        self._pade_x = self._pade_y = self._v = None
+        if orden == 4:
+            # Padé: (δ²/12 + I) w = δ² u / h², con w = u'' nula en la frontera Dirichlet
+            self._pade_x = _matriz_pade(nx-2, 0.0)
+            self._pade_y = _matriz_pade(ny-2, 0.0)
+            self._rhs_x = np.empty((nx-2, ny-2), order='F')
+            self._rhs_y = np.empty((nx-2, ny-2))
+            if metodo != 'ftcs':
+                self._factor_x = _matriz_pade(nx-2, self.r_x)
+                self._factor_y = _matriz_pade(ny-2, self.r_y)
+                self._v = np.zeros((nx, ny))
+        self._op_x = self._op_y = self._A = self._c = self._lu = self._lu_inicio = None
+        self.lineal = self.lineal_inicio = None
+        self._opciones_lineales = lineal
+        if metodo in L_ESTABLES:
+            self._A, self._c = operador_malla(nx, ny, dx, dy, self.bordes)
+            self._A *= alpha
+            self._c *= alpha
+            beta = {'be': 1.0, 'bdf2': 2/3, 'trbdf2': GAMMA_TRBDF2 / 2}[metodo]
+            self._lu = self._factorizar(beta * dt, 2 if metodo == 'trbdf2' else 1)
+            if lineal is not None:
+                self.lineal = self._lu
+            self._tmp = np.empty(nx * ny)
+        elif tipo_frontera in ('mixta', 'periodica') or (tipo_frontera == 'neumann' and metodo != 'ftcs'):
+            # Líneas completas (incluida la frontera) con el punto fantasma eliminado
+            self._op_x = operador_linea(nx, dx, self.bordes['inferior'], self.bordes['superior'])
+            self._op_y = operador_linea(ny, dy, self.bordes['izquierdo'], self.bordes['derecho'])
+            self._tmp = np.empty((nx, ny))
+            if metodo != 'ftcs':
+                self._rhs_x = np.empty((nx, ny), order='F')
+                self._rhs_y = np.empty((nx, ny))
+                self._factor_x = factorizar_operador(self._op_x, self.r_x)
+                self._factor_y = factorizar_operador(self._op_y, self.r_y)
+
+    def fijar_estado(self, u0, t=0.0):
+        """Copia u0 como estado actual y reinicia el reloj sin reconstruir operadores"""
+        if np.shape(u0) != self.forma:
+            raise ValueError(f'Se esperaba un campo de forma {self.forma}, se recibió {np.shape(u0)}')
+        np.copyto(self.u, u0)
+        self.t = t
+        self.pasos_dados = 0
+        for observador in self.observadores:
+            observador.registrar(self.u, self.t, 0)
+
+    def fijar_frontera(self, valor_frontera, bordes=None):
+        """Cambia los valores de frontera sin refactorizar; rige desde el próximo paso.
+
+        Solo pueden cambiar los datos (temperaturas Dirichlet, flujos, valores exteriores
+        Robin): los tipos de borde y los coeficientes Robin están en las matrices
+        factorizadas y exigen construir otro solucionador. Los términos constantes que
+        dependen de los datos (c de la malla, constantes de las líneas) se recalculan.
+
+        Args:
+            valor_frontera: nuevo valor (ver tipo_frontera)
+            bordes: con tipo_frontera='mixta', los cuatro bordes con sus nuevos valores
+        """
+        nuevos = normalizar_bordes(self.tipo_frontera, valor_frontera, bordes)
+        for borde, espec in nuevos.items():
+            previo = self.bordes[borde]
+            if espec[0] != previo[0] or (espec[0] == 'flujo' and espec[1] != previo[1]):
+                raise ValueError(f"El borde '{borde}' cambia de tipo o de coeficiente; "
+                                 'construya un nuevo solucionador.')
+        nx, ny = self.forma
+        self.valor_frontera = valor_frontera
+        self.bordes = nuevos
+        if self._A is not None:
+            self._c = self.alpha * operador_malla(nx, ny, self.dx, self.dy, nuevos)[1]
+        if self._op_x is not None:
+            self._op_x = operador_linea(nx, self.dx, nuevos['inferior'], nuevos['superior'])
+            self._op_y = operador_linea(ny, self.dy, nuevos['izquierdo'], nuevos['derecho'])
+
+    def _frontera(self, u):
+        if self._op_x is not None or self._A is not None:
+            aplicar_bordes_dirichlet(u, self.bordes)
+        elif self.tipo_frontera == 'dirichlet':
+            aplicar_frontera_dirichlet(u, self.valor_frontera)
+        else:
+            aplicar_frontera_neumann(u, self.dx, self.dy, self.valor_frontera)
+
+    def _paso_ftcs(self, u, u_new):
+        r_x, r_y = self.r_x, self.r_y
+        interior = u_new[1:-1, 1:-1]
+        tmp = self._tmp
+        # Esquema FTCS en el interior, sin arreglos temporales
+        np.add(u[2:, 1:-1], u[0:-2, 1:-1], out=interior)
+        interior *= r_x
+        np.add(u[1:-1, 2:], u[1:-1, 0:-2], out=tmp)
+        tmp *= r_y
+        interior += tmp
+        np.multiply(u[1:-1, 1:-1], 1 - 2*r_x - 2*r_y, out=tmp)
+        interior += tmp
+
+    def _paso_ftcs_flujo(self, u, u_new):
+        aplicar_operador(self._op_x, u, 0, u_new)
+        u_new *= self.r_x
+        aplicar_operador(self._op_y, u, 1, self._tmp)
+        self._tmp *= self.r_y
+        u_new += self._tmp
+        u_new += u
+
+    def _rhs_flujo(self, v, op_explicito, r_explicito, eje, out):
+        """out = v + r·(T v + c) en la dirección explícita + r·c en la implícita"""
+        aplicar_operador(op_explicito, v, 1 - eje, out)
+        out *= r_explicito
+        out += v
+        if eje == 0:
+            out += self.r_x * self._op_x[3][:, None]
+        else:
+            out += self.r_y * self._op_y[3][None, :]
+        aplicar_bordes_dirichlet(out, self.bordes)
+
+    def _paso_lineas_flujo(self, u, u_new):
+        # Peaceman-Rachford sobre líneas completas: (I - r_x T_x) u* = (I + r_y T_y) u + c
+        self._rhs_flujo(u, self._op_y, self.r_y, 0, self._rhs_x)
+        resolver_lineas(self._factor_x, self._rhs_x, 0)
+        aplicar_bordes_dirichlet(self._rhs_x, self.bordes)
+        self._rhs_flujo(self._rhs_x, self._op_x, self.r_x, 1, self._rhs_y)
+        resolver_lineas(self._factor_y, self._rhs_y, 1)
+        u_new[...] = self._rhs_y
+
+    def _factorizar(self, coeficiente, etapas=1):
+        """Solucionador de I - coeficiente·A: SuperLU, o gradiente conjugado si se pidió 'lineal'"""
+        if self._opciones_lineales is None:
+            return factorizar_malla(self._A, coeficiente)
+        return GradienteConjugado(self._A, coeficiente, self.forma, self.dx, self.dy, self.bordes, self.alpha,
+                                  etapas=etapas, **self._opciones_lineales)
+
+    def _paso_l_estable(self, u, u_previo, u_new):
+        dt, A, c = self.dt, self._A, self._c
+        un = u.ravel()
+        rhs = self._tmp
+        if self.metodo == 'be' or (self.metodo == 'bdf2' and self.pasos_dados == 0):
+            if self._lu_inicio is None:
+                self._lu_inicio = self._lu if self.metodo == 'be' else self._factorizar(dt)
+                if self._opciones_lineales is not None and self.metodo == 'bdf2':
+                    self.lineal_inicio = self._lu_inicio
+            np.add(un, dt * c, out=rhs)
+            u_new.ravel()[:] = self._lu_inicio.solve(rhs)
+        elif self.metodo == 'bdf2':
+            # (I - 2/3 dt A) u^{n+1} = (4 u^n - u^{n-1})/3 + 2/3 dt c
+            np.add(4/3 * un, 2/3 * dt * c, out=rhs)
+            rhs -= u_previo.ravel() / 3
+            u_new.ravel()[:] = self._lu.solve(rhs)
+        else:
+            # Etapa trapezoidal hasta t + γ dt y etapa BDF2 hasta t + dt, misma matriz
+            g = GAMMA_TRBDF2
+            np.add(un + 0.5*g*dt * (A @ un), g*dt * c, out=rhs)
+            u_g = self._lu.solve(rhs)
+            rhs[:] = (u_g - (1 - g)**2 * un) / (g * (2 - g)) + 0.5*g*dt * c
+            u_new.ravel()[:] = self._lu.solve(rhs)
+
+    def _derivada_compacta(self, u, eje):
+        """Segunda derivada de cuarto orden en el interior: P⁻¹ δ² u / h² (Padé)"""
+        if eje == 0:
+            out = self._rhs_x
+            out[...] = (u[2:, 1:-1] - 2*u[1:-1, 1:-1] + u[0:-2, 1:-1]) / self.dx**2
+            return resolver_lineas(self._pade_x, out, 0)
+        out = self._rhs_y
+        out[...] = (u[1:-1, 2:] - 2*u[1:-1, 1:-1] + u[1:-1, 0:-2]) / self.dy**2
+        return resolver_lineas(self._pade_y, out, 1)
+
+    def _paso_ftcs_compacto(self, u, u_new):
+        u_xx = self._derivada_compacta(u, 0)
+        u_yy = self._derivada_compacta(u, 1)
+        u_new[1:-1, 1:-1] = u[1:-1, 1:-1] + self.alpha * self.dt * (u_xx + u_yy)
+
+    def _paso_lineas_compacto(self, u, u_new):
+        # Peaceman-Rachford con operadores de Padé multiplicado por P:
+        # (P_x - r_x δx²) u* = P_x (u + (α dt/2) L_y u), y análogo en y
+        medio = 0.5 * self.alpha * self.dt
+        v = self._v
+        v[...] = u
+        v[1:-1, 1:-1] += medio * self._derivada_compacta(u, 1)
+        rhs = self._rhs_x
+        rhs[...] = (v[2:, 1:-1] + 10*v[1:-1, 1:-1] + v[0:-2, 1:-1]) / 12
+        # Frontera al lado derecho: el coeficiente de la matriz es 1/12 - r_x y P·v ya aporta v₀/12
+        rhs[0, :] += (self.r_x - 1/12) * u[0, 1:-1]
+        rhs[-1, :] += (self.r_x - 1/12) * u[-1, 1:-1]
+        resolver_lineas(self._factor_x, rhs, 0)
+        u_new[...] = u
+        u_new[1:-1, 1:-1] = rhs
+        v[...] = u_new
+        v[1:-1, 1:-1] += medio * self._derivada_compacta(u_new, 0)
+        rhs = self._rhs_y
+        rhs[...] = (v[1:-1, 2:] + 10*v[1:-1, 1:-1] + v[1:-1, 0:-2]) / 12
+        rhs[:, 0] += (self.r_y - 1/12) * u_new[1:-1, 0]
+        rhs[:, -1] += (self.r_y - 1/12) * u_new[1:-1, -1]
+        resolver_lineas(self._factor_y, rhs, 1)
+        u_new[1:-1, 1:-1] = rhs
+
+    def _rhs_explicito(self, v, r, eje, out):
+        """out = r*(vecino_anterior + vecino_siguiente) + c*v en el interior, según el esquema"""
+        if eje == 1:
+            np.add(v[1:-1, 2:], v[1:-1, 0:-2], out=out)
+        else:
+            np.add(v[2:, 1:-1], v[0:-2, 1:-1], out=out)
+        out *= r
+        # CN: (1-2r)·v; ADI conserva su forma original r·δ²v + (1-2r)·v = r·(v+ + v-) + (1-4r)·v
+        centro = 1 - 2*r if self.metodo == 'cn' else 1 - 4*r
+        np.multiply(v[1:-1, 1:-1], centro, out=self._tmp)
+        out += self._tmp
+
+    def _paso_lineas(self, u, u_new):
+        # Barrido en x (implícito en x, explícito en y)
+        self._rhs_explicito(u, self.r_y, 1, self._rhs_x)
+        resolver_lineas(self._factor_x, self._rhs_x, 0)
+        u_new[...] = u
+        u_new[1:-1, 1:-1] = self._rhs_x
+        # Barrido en y (implícito en y, explícito en x)
+        self._rhs_explicito(u_new, self.r_x, 0, self._rhs_y)
+        resolver_lineas(self._factor_y, self._rhs_y, 1)
+        u_new[1:-1, 1:-1] = self._rhs_y
+
+    def paso(self):
+        """Avanza un paso de tiempo dt y devuelve el estado actual (sin copiar)"""
+        u, u_new = self.u, self._aux
+        if self._A is not None:
+            # _aux guarda el estado anterior, que BDF2 necesita antes de sobrescribirlo
+            self._paso_l_estable(u, u_new, u_new)
+        elif self._op_x is not None:
+            if self.metodo == 'ftcs':
+                self._paso_ftcs_flujo(u, u_new)
+            else:
+                self._paso_lineas_flujo(u, u_new)
+        elif self.orden == 4:
+            if self.metodo == 'ftcs':
+                self._paso_ftcs_compacto(u, u_new)
+            else:
+                self._paso_lineas_compacto(u, u_new)
+        elif self.metodo == 'ftcs':
+            self._paso_ftcs(u, u_new)
+        else:
+            self._paso_lineas(u, u_new)
+        self._frontera(u_new)
+        self.u, self._aux = u_new, u
+        self.t += self.dt
+        self.pasos_dados += 1
+        for observador in self.observadores:
+            observador.registrar(self.u, self.t, self.pasos_dados)
+        return self.u
+
+    def avanzar(self, n):
+        """Avanza n pasos de tiempo y devuelve el estado actual (sin copiar)"""
+        for _ in range(n):
+            self.paso()
+        return self.u
+
+    def avanzar_hasta(self, t):
+        """Avanza el número entero de pasos que llega a t sin sobrepasarlo"""
+        n = int(np.floor((t - self.t) / self.dt + 1e-9))
+        return self.avanzar(max(0, n))
+
+    def en_tiempos(self, tiempos):
+        """Campos en tiempos físicos crecientes, interpolando linealmente entre los pasos vecinos.
+
+        Solo se guardan los campos pedidos: la memoria es O(salidas), no O(pasos).
+        """
+        tol = 1e-9 * self.dt
+        salidas = []
+        for t in tiempos:
+            while self.t < t - tol:
+                self.paso()
+            atras = (self.t - t) / self.dt
+            if atras <= 1e-9:
+                salidas.append(self.u.copy())
+            elif self.pasos_dados > 0 and atras <= 1 + 1e-9:
+                # Tras paso(), _aux conserva el estado del paso anterior
+                salidas.append((1 - atras) * self.u + atras * self._aux)
+            else:
+                raise ValueError(f'Los tiempos de salida deben ser crecientes y no anteriores a t={self.t}')
+        return salidas
+
+
+def _matriz_pade(n, r):
+    """Factoriza tridiag(1/12 - r, 10/12 + 2r, 1/12 - r): P - r δ² del esquema compacto"""
+    return FactorTridiagonal(np.full(n - 1, 1/12 - r), np.full(n, 10/12 + 2*r), np.full(n - 1, 1/12 - r))
+
+
+def _integrar(solucionador, u0, pasos, tiempos_salida=None):
+    """Ejecuta pasos y devuelve la lista de soluciones (incluida la inicial), o solo las pedidas"""
+    solucionador.fijar_estado(u0)
+    if tiempos_salida is not None:
+        return solucionador.en_tiempos(tiempos_salida)
+    soluciones = [solucionador.u.copy()]
+    for n in range(pasos):
+        soluciones.append(solucionador.paso().copy())
+    return soluciones
+
+
+def resolver_ftcs(u0, dx, dy, dt, pasos, alpha=1.0, tipo_frontera='dirichlet', valor_frontera=0.0,
+                  orden=2, bordes=None, tiempos_salida=None):
     """Resuelve la ecuación de calor 2D usando FTCS explícito.
     Args:
         u0: temperatura inicial np.ndarray
@@ -12,93 +394,45 @@ def resolver_ftcs(u0, dx, dy, dt, pasos, alpha=1.0, tipo_frontera='dirichlet', v
         dt: paso temporal
         pasos: pasos de tiempo
         alpha: difusividad
-        tipo_frontera: 'dirichlet' o 'neumann'
+        tipo_frontera: 'dirichlet', 'neumann', 'periodica' o 'mixta'
         valor_frontera: valor para frontera
+        orden: orden espacial, 2 o 4 (compacto, solo Dirichlet)
+        bordes: condición por borde con tipo_frontera='mixta' (ver normalizar_bordes)
+        tiempos_salida: tiempos crecientes; si se dan, se ignora pasos y solo se devuelven
+            esos campos (interpolados linealmente entre los pasos que los rodean)
     Returns:
-        Lista de soluciones por cada paso
+        Lista de soluciones por cada paso, o una por cada tiempo de salida
     """
-    u = u0.copy()
-    nx, ny = u.shape
-    r_x = alpha * dt / dx**2
-    r_y = alpha * dt / dy**2
-    soluciones = [u.copy()]
-    for n in range(pasos):
-        u_new = u.copy()
-        # Esquema FTCS en el interior
-        u_new[1:-1,1:-1] = (
-            u[1:-1,1:-1] +
-            r_x * (u[2:,1:-1] - 2*u[1:-1,1:-1] + u[0:-2,1:-1]) +
-            r_y * (u[1:-1,2:] - 2*u[1:-1,1:-1] + u[1:-1,0:-2])
-        )
-        # Frontera
-        if tipo_frontera == 'dirichlet':
-            aplicar_frontera_dirichlet(u_new, valor_frontera)
-        elif tipo_frontera == 'neumann':
-            aplicar_frontera_neumann(u_new, dx, dy, valor_frontera)
-        else:
-            raise ValueError('Tipo de frontera no soportado.')
-        u = u_new
-        soluciones.append(u.copy())
-    return soluciones
+    solucionador = SolucionadorCalor(u0.shape, dx, dy, dt, 'ftcs', alpha, tipo_frontera, valor_frontera,
+                                     orden, bordes)
+    return _integrar(solucionador, u0, pasos, tiempos_salida)
 
 
-def resolver_cn(u0, dx, dy, dt, pasos, alpha=1.0, tipo_frontera='dirichlet', valor_frontera=0.0):
-    """Resuelve la ecuación de calor 2D usando Crank-Nicolson implícito (simple, para mallas pequeñas).
+def resolver_cn(u0, dx, dy, dt, pasos, alpha=1.0, tipo_frontera='dirichlet', valor_frontera=0.0,
+                orden=2, bordes=None, tiempos_salida=None):
+    """Resuelve la ecuación de calor 2D usando Crank-Nicolson implícito por líneas alternas.
     Args:
         u0: temperatura inicial np.ndarray
         dx, dy: pasos espaciales
         dt: paso temporal
         pasos: pasos de tiempo
         alpha: difusividad
-        tipo_frontera: 'dirichlet' o 'neumann'
+        tipo_frontera: 'dirichlet', 'neumann', 'periodica' o 'mixta'
         valor_frontera: valor para frontera
+        orden: orden espacial, 2 o 4 (compacto, solo Dirichlet)
+        bordes: condición por borde con tipo_frontera='mixta' (ver normalizar_bordes)
+        tiempos_salida: tiempos crecientes; si se dan, se ignora pasos y solo se devuelven
+            esos campos (interpolados linealmente entre los pasos que los rodean)
     Returns:
-        Lista de soluciones por cada paso
+        Lista de soluciones por cada paso, o una por cada tiempo de salida
     """
-    from scipy.sparse import diags
-    from scipy.sparse.linalg import spsolve
-
-    u = u0.copy()
-    nx, ny = u.shape
-    r_x = alpha * dt / (2*dx**2)
-    r_y = alpha * dt / (2*dy**2)
-    I = np.eye(nx-2)
-    soluciones = [u.copy()]
-    for n in range(pasos):
-        # Paso intermedio (método de línea alterna para eficiencia)
-        u_med = u.copy()
-        # Barrido en x
-        for j in range(1, ny-1):
-            A = diags([-r_x, 1+2*r_x, -r_x], [-1,0,1], shape=(nx-2, nx-2)).tocsc()
-            b = (
-                r_y * u[1:-1, j+1] +
-                (1-2*r_y)*u[1:-1, j] +
-                r_y * u[1:-1, j-1]
-            )
-            u_med[1:-1, j] = spsolve(A, b)
-        # Barrido en y
-        u_new = u_med.copy()
-        for i in range(1, nx-1):
-            A = diags([-r_y, 1+2*r_y, -r_y], [-1,0,1], shape=(ny-2, ny-2)).tocsc()
-            b = (
-                r_x * u_med[i+1, 1:-1] +
-                (1-2*r_x)*u_med[i, 1:-1] +
-                r_x * u_med[i-1, 1:-1]
-            )
-            u_new[i, 1:-1] = spsolve(A, b)
-        # Frontera
-        if tipo_frontera == 'dirichlet':
-            aplicar_frontera_dirichlet(u_new, valor_frontera)
-        elif tipo_frontera == 'neumann':
-            aplicar_frontera_neumann(u_new, dx, dy, valor_frontera)
-        else:
-            raise ValueError('Tipo de frontera no soportado.')
-        u = u_new
-        soluciones.append(u.copy())
-    return soluciones
+    solucionador = SolucionadorCalor(u0.shape, dx, dy, dt, 'cn', alpha, tipo_frontera, valor_frontera,
+                                     orden, bordes)
+    return _integrar(solucionador, u0, pasos, tiempos_salida)
 
 
-def resolver_adi(u0, dx, dy, dt, pasos, alpha=1.0, tipo_frontera='dirichlet', valor_frontera=0.0):
+def resolver_adi(u0, dx, dy, dt, pasos, alpha=1.0, tipo_frontera='dirichlet', valor_frontera=0.0,
+                 orden=2, bordes=None, tiempos_salida=None):
     """Resuelve la ecuación de calor 2D usando el método ADI (Peaceman-Rachford).
     Args:
         u0: temperatura inicial np.ndarray
@@ -106,45 +440,41 @@ def resolver_adi(u0, dx, dy, dt, pasos, alpha=1.0, tipo_frontera='dirichlet', va
         dt: paso temporal
         pasos: pasos de tiempo
         alpha: difusividad
-        tipo_frontera: 'dirichlet' o 'neumann'
+        tipo_frontera: 'dirichlet', 'neumann', 'periodica' o 'mixta'
         valor_frontera: valor para frontera
+        orden: orden espacial, 2 o 4 (compacto, solo Dirichlet)
+        bordes: condición por borde con tipo_frontera='mixta' (ver normalizar_bordes)
+        tiempos_salida: tiempos crecientes; si se dan, se ignora pasos y solo se devuelven
+            esos campos (interpolados linealmente entre los pasos que los rodean)
     Returns:
-        Lista de soluciones por cada paso
+        Lista de soluciones por cada paso, o una por cada tiempo de salida
     """
-    from scipy.sparse import diags
-    from scipy.sparse.linalg import spsolve
-
-    u = u0.copy()
-    nx, ny = u.shape
-    r_x = alpha * dt / (2*dx**2)
-    r_y = alpha * dt / (2*dy**2)
-    soluciones = [u.copy()]
-    for n in range(pasos):
-        # Paso en x
-        u_med = u.copy()
-        for j in range(1, ny-1):
-            A = diags([-r_x, 1+2*r_x, -r_x], [-1,0,1], shape=(nx-2, nx-2)).tocsc()
-            b = (
-                r_y*(u[1:-1, j+1] - 2*u[1:-1, j] + u[1:-1, j-1]) +
-                (1-2*r_y)*u[1:-1, j]
-            )
-            u_med[1:-1, j] = spsolve(A, b)
-        # Paso en y
-        u_new = u_med.copy()
-        for i in range(1, nx-1):
-            A = diags([-r_y, 1+2*r_y, -r_y], [-1,0,1], shape=(ny-2, ny-2)).tocsc()
-            b = (
-                r_x*(u_med[i+1,1:-1] - 2*u_med[i,1:-1] + u_med[i-1,1:-1]) +
-                (1-2*r_x)*u_med[i,1:-1]
-            )
-            u_new[i, 1:-1] = spsolve(A, b)
-        # Frontera
-        if tipo_frontera == 'dirichlet':
-            aplicar_frontera_dirichlet(u_new, valor_frontera)
-        elif tipo_frontera == 'neumann':
-            aplicar_frontera_neumann(u_new, dx, dy, valor_frontera)
-        else:
-            raise ValueError('Tipo de frontera no soportado.')
-        u = u_new
-        soluciones.append(u.copy())
-    return soluciones
+    solucionador = SolucionadorCalor(u0.shape, dx, dy, dt, 'adi', alpha, tipo_frontera, valor_frontera,
+                                     orden, bordes)
+    return _integrar(solucionador, u0, pasos, tiempos_salida)
+
+
+def resolver_l_estable(u0, dx, dy, dt, pasos, metodo='trbdf2', alpha=1.0, tipo_frontera='dirichlet',
+                       valor_frontera=0.0, bordes=None, tiempos_salida=None, lineal=None):
+    """Resuelve la ecuación de calor 2D con un integrador L-estable para pasos grandes.
+    Args:
+        u0: temperatura inicial np.ndarray
+        dx, dy: pasos espaciales
+        dt: paso temporal (puede superar en órdenes de magnitud el límite de FTCS)
+        pasos: pasos de tiempo
+        metodo: 'be' (orden 1), 'bdf2' o 'trbdf2' (orden 2, amortiguamiento fuerte)
+        alpha: difusividad
+        tipo_frontera: 'dirichlet', 'neumann', 'periodica' o 'mixta'
+        valor_frontera: valor para frontera
+        bordes: condición por borde con tipo_frontera='mixta' (ver normalizar_bordes)
+        tiempos_salida: tiempos crecientes; si se dan, se ignora pasos y solo se devuelven
+            esos campos (interpolados linealmente entre los pasos que los rodean)
+        lineal: opciones del gradiente conjugado (ver SolucionadorCalor); None = SuperLU
+    Returns:
+        Lista de soluciones por cada paso, o una por cada tiempo de salida
+    """
+    if metodo not in L_ESTABLES:
+        raise ValueError(f"Método L-estable '{metodo}' no reconocido")
+    solucionador = SolucionadorCalor(u0.shape, dx, dy, dt, metodo, alpha, tipo_frontera, valor_frontera,
+                                     bordes=bordes, lineal=lineal)
+    return _integrar(solucionador, u0, pasos, tiempos_salida)
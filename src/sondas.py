@@ -0,0 +1,106 @@
+"""Sondas puntuales y de línea registradas durante la integración, sin guardar campos completos
+
+Los índices y pesos de interpolación bilineal de todas las sondas se calculan una
+sola vez al registrarlas; en cada paso registrado solo se leen 4 nodos por punto
+y el resultado se escribe en un arreglo preasignado.
+"""
+
+import numpy as np
+
+
+class Sondas:
+    """Conjunto de sondas sobre una malla (mismo convenio que np.meshgrid(x, y): u[j, i] ↔ (x[i], y[j])).
+
+    Se conecta a un SolucionadorCalor agregándola a solucionador.observadores; cada
+    `cada` pasos (y al fijar el estado) registra el tiempo y los valores de las sondas.
+
+    Args:
+        x, y: arreglos 1D de coordenadas
+        cada: registra uno de cada `cada` pasos
+        capacidad: registros preasignados (crece al doble si se agota)
+    """
+
+    def __init__(self, x, y, cada=1, capacidad=1024):
+        self.x = np.asarray(x, dtype=float)
+        self.y = np.asarray(y, dtype=float)
+        self.cada = int(cada)
+        self._capacidad = int(capacidad)
+        self._nombres = {}  # nombre -> (inicio, fin, es_linea)
+        self._indices = np.empty((0, 4), dtype=np.intp)
+        self._pesos = np.empty((0, 4))
+        self._buffer = None
+        self._datos = None
+        self._tiempos = None
+        self.n = 0
+
+    def _pesos_bilineales(self, xp, yp):
+        """Índices planos (m, 4) de los nodos de la celda y sus pesos bilineales"""
+        xp, yp = np.atleast_1d(xp).astype(float), np.atleast_1d(yp).astype(float)
+        if np.any((xp < self.x[0]) | (xp > self.x[-1]) | (yp < self.y[0]) | (yp > self.y[-1])):
+            raise ValueError('Sonda fuera del dominio.')
+        nx = len(self.x)
+        i = np.clip(np.searchsorted(self.x, xp, side='right') - 1, 0, nx - 2)
+        j = np.clip(np.searchsorted(self.y, yp, side='right') - 1, 0, len(self.y) - 2)
+        fx = (xp - self.x[i]) / (self.x[i + 1] - self.x[i])
+        fy = (yp - self.y[j]) / (self.y[j + 1] - self.y[j])
+        indices = np.stack([j*nx + i, j*nx + i + 1, (j+1)*nx + i, (j+1)*nx + i + 1], axis=1)
+        pesos = np.stack([(1-fx)*(1-fy), fx*(1-fy), (1-fx)*fy, fx*fy], axis=1)
+        return indices, pesos
+
+    def _agregar(self, nombre, xp, yp, es_linea):
+        if nombre in self._nombres:
+            raise ValueError(f"Ya existe una sonda llamada '{nombre}'")
+        if self.n:
+            raise RuntimeError('Las sondas deben registrarse antes de empezar a grabar.')
+        indices, pesos = self._pesos_bilineales(xp, yp)
+        inicio = len(self._indices)
+        self._indices = np.vstack([self._indices, indices])
+        self._pesos = np.vstack([self._pesos, pesos])
+        self._nombres[nombre] = (inicio, len(self._indices), es_linea)
+
+    def agregar_punto(self, nombre, xp, yp):
+        """Termopar en (xp, yp)"""
+        self._agregar(nombre, xp, yp, False)
+
+    def agregar_linea(self, nombre, inicio, fin, puntos):
+        """Perfil de `puntos` sondas equiespaciadas entre inicio=(x0, y0) y fin=(x1, y1)"""
+        s = np.linspace(0.0, 1.0, puntos)
+        self._agregar(nombre, inicio[0] + s*(fin[0] - inicio[0]), inicio[1] + s*(fin[1] - inicio[1]), True)
+
+    def reiniciar(self):
+        """Descarta los registros conservando las sondas y los pesos"""
+        self.n = 0
+
+    def _reservar(self):
+        m = len(self._indices)
+        if self._datos is None:
+            self._datos = np.empty((self._capacidad, m))
+            self._tiempos = np.empty(self._capacidad)
+            self._buffer = np.empty((m, 4))
+        elif self.n == len(self._tiempos):
+            self._datos = np.concatenate([self._datos, np.empty_like(self._datos)])
+            self._tiempos = np.concatenate([self._tiempos, np.empty_like(self._tiempos)])
+
+    def registrar(self, u, t, paso=0):
+        """Graba las sondas si `paso` cae en la cadencia; lo llama el solucionador"""
+        if paso % self.cada:
+            return
+        self._reservar()
+        np.take(u.reshape(-1), self._indices, out=self._buffer)
+        self._buffer *= self._pesos
+        self._buffer.sum(axis=1, out=self._datos[self.n])
+        self._tiempos[self.n] = t
+        self.n += 1
+
+    @property
+    def tiempos(self):
+        """Tiempos de los registros grabados"""
+        return self._tiempos[:self.n] if self.n else np.empty(0)
+
+    def lecturas(self, nombre):
+        """Historia de una sonda: (registros,) para un punto, (registros, puntos) para una línea"""
+        inicio, fin, es_linea = self._nombres[nombre]
+        if not self.n:
+            return np.empty((0, fin - inicio) if es_linea else 0)
+        datos = self._datos[:self.n, inicio:fin]
+        return datos if es_linea else datos[:, 0]
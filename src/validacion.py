@@ -2,22 +2,118 @@
 
 import numpy as np
 
-def solucion_analitica(x, y, t, tipo='senoidal'):
+# Perfiles espaciales ya evaluados, indexados por las coordenadas de la malla
+_perfiles = {}
+_MAX_PERFILES = 8
+
+
+def perfil_senoidal(x, y):
+    """Perfil sin(πX)·sin(πY) evaluado como producto externo y guardado en caché.
+    Args:
+        x, y: arreglos 1D de coordenadas
+    Returns:
+        Matriz (len(y), len(x)) de solo lectura, igual que con np.meshgrid(x, y)
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    clave = (x.tobytes(), y.tobytes())
+    perfil = _perfiles.get(clave)
+    if perfil is None:
+        perfil = np.outer(np.sin(np.pi * y), np.sin(np.pi * x))
+        perfil.setflags(write=False)
+        if len(_perfiles) >= _MAX_PERFILES:
+            _perfiles.pop(next(iter(_perfiles)))
+        _perfiles[clave] = perfil
+    return perfil
+
+
+def solucion_analitica(x, y, t, tipo='senoidal', alpha=1.0):
     """Solución analítica para pruebas (placa unidad, sencillas).
     Args:
         x, y: arreglos 1D de coordenadas
-        t: tiempo
+        t: tiempo, o arreglo 1D de tiempos
         tipo: 'senoidal', 'gaussiana', etc.
+        alpha: difusividad
     Returns:
-        u: matriz solución analítica
+        u: matriz solución analítica; si t es un arreglo, pila (len(t), ny, nx)
     """
-    X, Y = np.meshgrid(x, y)
     if tipo == 'senoidal':
-        return np.exp(-2*np.pi**2*t) * np.sin(np.pi * X) * np.sin(np.pi * Y)
+        decaimiento = np.exp(-2*np.pi**2*alpha*np.asarray(t, dtype=float))
+        return np.multiply.outer(decaimiento, perfil_senoidal(x, y))
     else:
-        raise NotImplementedError('Solo seno disponible.')
+        raise NotImplementedError('Solo seno disponible; para datos arbitrarios usar solucion_fourier.')
+
+
+def coeficientes_fourier(u0):
+    """Coeficientes de la serie de senos de u0 (frontera cero) mediante DST-I.
+    Args:
+        u0: temperatura inicial en la malla completa (se ignora la frontera)
+    Returns:
+        Matriz de coeficientes de los modos interiores (normalización ortonormal)
+    """
+    from scipy.fft import dstn
+    return dstn(np.asarray(u0, dtype=float)[1:-1, 1:-1], type=1, norm='ortho')
+
+
+def solucion_fourier(coeficientes, x, y, t, alpha=1.0):
+    """Solución exacta en serie de Fourier para datos iniciales arbitrarios.
+
+    Cada modo sin(kπx/Lx)·sin(lπy/Ly) decae como exp(-α π² (k²/Lx² + l²/Ly²) t);
+    la síntesis es una DST-I inversa, O(N² log N) por tiempo.
+    Args:
+        coeficientes: salida de coeficientes_fourier
+        x, y: arreglos 1D de coordenadas (mismo convenio que np.meshgrid(x, y))
+        t: tiempo, o arreglo 1D de tiempos
+        alpha: difusividad
+    Returns:
+        u: matriz (ny, nx) con frontera cero; si t es un arreglo, pila (len(t), ny, nx)
+    """
+    from scipy.fft import idstn
+    ly, lx = y[-1] - y[0], x[-1] - x[0]
+    ky = np.arange(1, coeficientes.shape[0] + 1) / ly
+    kx = np.arange(1, coeficientes.shape[1] + 1) / lx
+    tasa = np.pi**2 * alpha * (ky[:, None]**2 + kx[None, :]**2)
+    t = np.asarray(t, dtype=float)
+    modos = np.exp(-np.multiply.outer(t, tasa)) * coeficientes
+    u = np.zeros(t.shape + (len(y), len(x)))
+    u[..., 1:-1, 1:-1] = idstn(modos, type=1, norm='ortho', axes=(-2, -1))
+    return u
+
 
 def error_l2(u_num, u_exact):
     """Calcula el error relativo L2 entre solución numérica y exacta"""
     return np.linalg.norm(u_num - u_exact) / np.linalg.norm(u_exact)
 
+
+def error_linf(u_num, u_exact):
+    """Calcula el error relativo L∞ entre solución numérica y exacta"""
+    return np.max(np.abs(u_num - u_exact)) / np.max(np.abs(u_exact))
+
+
+def errores_lote(u_num, u_exact):
+    """Errores relativos L2 y L∞ de muchas instantáneas en una sola llamada.
+    Args:
+        u_num: lista o pila (pasos, ny, nx) de soluciones numéricas
+        u_exact: pila de la misma forma, o una sola matriz para todas
+    Returns:
+        (errores_l2, errores_linf): arreglos 1D, uno por instantánea
+    """
+    u_num = np.asarray(u_num)
+    u_exact = np.asarray(u_exact)
+    diferencia = u_num - u_exact
+    ejes = (-2, -1)
+    l2 = np.sqrt(np.sum(diferencia**2, axis=ejes) / np.sum(u_exact**2, axis=ejes))
+    linf = np.max(np.abs(diferencia), axis=ejes) / np.max(np.abs(u_exact), axis=ejes)
+    return l2, linf
+
+
+def orden_observado(hs, errores):
+    """Orden de convergencia observado: pendiente log-log por mínimos cuadrados.
+    Args:
+        hs: pasos espaciales (o temporales) de cada corrida
+        errores: error de cada corrida, p. ej. error_l2
+    Returns:
+        p tal que error ≈ C·h^p (≈2 con el esquema de 5 puntos, ≈4 con el compacto)
+    """
+    pendiente, _ = np.polyfit(np.log(hs), np.log(errores), 1)
+    return pendiente
@@ -0,0 +1,72 @@
+"""Test del refinamiento adaptativo por bloques: precisión de la malla fina con menos nodos."""
+import sys
+sys.path.append('./')
+import numpy as np
+from src.adaptativo import MallaAdaptativa, _media_trapecio
+from src.condiciones import inicializar_dominio
+from src.solucionadores import resolver_ftcs
+
+def _gaussiana(X, Y, sigma=0.04):
+    return np.exp(-((X - 0.5)**2 + (Y - 0.5)**2) / (2 * sigma**2))
+
+def test_adaptativo():
+    nc, razon, pasos = 33, 4, 8
+    x, y, dx, dy = inicializar_dominio(nc, nc)
+    u0 = _gaussiana(*np.meshgrid(x, y, indexing='ij'))
+    dt = 0.2 * dx**2
+    nf = (nc - 1) * razon + 1
+    xf, yf, dxf, dyf = inicializar_dominio(nf, nf)
+    fina = resolver_ftcs(_gaussiana(*np.meshgrid(xf, yf, indexing='ij')), dxf, dyf, dt / razon**2,
+                         pasos * razon**2)[-1]
+    gruesa = resolver_ftcs(u0, dx, dy, dt, pasos)[-1]
+    for subciclos in (True, False):
+        m = MallaAdaptativa(u0, dx, dy, dt, bloque=4, razon=razon, umbral=0.02, subciclos=subciclos,
+                            inicial=_gaussiana)
+        m.avanzar(pasos)
+        error = np.max(np.abs(m.campo_fino() - fina))
+        print(f"subciclos={subciclos}: {len(m.parches)} parches, {m.nodos()} nodos (uniforme {nf**2}), "
+              f"error {error:.2e} (solo gruesa {np.max(np.abs(gruesa - fina[::razon, ::razon])):.2e})")
+        assert m.nodos() < 0.5 * nf**2
+        assert error < 0.25 * np.max(np.abs(gruesa - fina[::razon, ::razon]))
+        # El campo grueso compuesto también mejora a la malla gruesa sola
+        assert np.max(np.abs(m.u - fina[::razon, ::razon])) < 0.25 * np.max(np.abs(gruesa - fina[::razon, ::razon]))
+
+def test_adaptativo_prolongacion():
+    # Sin condición inicial exacta los parches se prolongan desde la malla gruesa
+    nc, razon, pasos = 33, 4, 8
+    x, y, dx, dy = inicializar_dominio(nc, nc)
+    u0 = _gaussiana(*np.meshgrid(x, y, indexing='ij'))
+    dt = 0.2 * dx**2
+    nf = (nc - 1) * razon + 1
+    xf, yf, dxf, dyf = inicializar_dominio(nf, nf)
+    fina = resolver_ftcs(_gaussiana(*np.meshgrid(xf, yf, indexing='ij')), dxf, dyf, dt / razon**2,
+                         pasos * razon**2)[-1]
+    error_gruesa = np.max(np.abs(resolver_ftcs(u0, dx, dy, dt, pasos)[-1] - fina[::razon, ::razon]))
+    m = MallaAdaptativa(u0, dx, dy, dt, bloque=4, razon=razon, umbral=0.02)
+    m.avanzar(pasos)
+    error_fino = np.max(np.abs(m.campo_fino() - fina))
+    error_compuesto = np.max(np.abs(m.u - fina[::razon, ::razon]))
+    print(f"prolongación: error fino {error_fino:.2e}, compuesto {error_compuesto:.2e}, "
+          f"solo gruesa {error_gruesa:.2e}")
+    assert error_fino < 0.5 * error_gruesa
+    assert error_compuesto < 0.5 * error_gruesa
+
+def test_regrid_conservativo():
+    x, y, dx, dy = inicializar_dominio(33, 33)
+    u0 = _gaussiana(*np.meshgrid(x, y, indexing='ij'), sigma=0.08)
+    m = MallaAdaptativa(u0, dx, dy, 0.2 * dx**2, bloque=4, razon=2, umbral=0.05)
+    assert m.parches
+    for (bi, bj), parche in m.parches.items():
+        bloque = m.u[bi*4:bi*4 + 5, bj*4:bj*4 + 5]
+        assert np.isclose(_media_trapecio(parche.u[1:-1, 1:-1]), _media_trapecio(bloque), rtol=1e-12)
+    # Al difundirse la mancha los bloques se engrosan
+    maximo = len(m.parches)
+    for _ in range(25):
+        m.avanzar(8)
+        maximo = max(maximo, len(m.parches))
+    assert len(m.parches) < maximo
+
+if __name__ == "__main__":
+    test_adaptativo()
+    test_adaptativo_prolongacion()
+    test_regrid_conservativo()
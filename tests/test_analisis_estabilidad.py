@@ -0,0 +1,63 @@
+"""Test del análisis de estabilidad: formas cerradas contra autovalores densos en mallas pequeñas."""
+import sys
+sys.path.append('./')
+import numpy as np
+from src.analisis_estabilidad import (FACTORES_AMPLIFICACION, amplificacion_maxima, autovalores_tridiagonal,
+                                      es_estable, matriz_coeficiente_variable, numero_condicion_cn,
+                                      numero_condicion_disperso, numero_condicion_tridiagonal)
+
+def _laplaciano_1d(n):
+    return np.diag(-2.0 * np.ones(n)) + np.diag(np.ones(n - 1), 1) + np.diag(np.ones(n - 1), -1)
+
+def test_autovalores_y_condicion():
+    n = 9
+    densa = np.diag(3.0 * np.ones(n)) + np.diag(-0.7 * np.ones(n - 1), 1) + np.diag(-0.7 * np.ones(n - 1), -1)
+    assert np.allclose(np.sort(autovalores_tridiagonal(n, 3.0, -0.7)), np.sort(np.linalg.eigvals(densa).real))
+    # Vectorizado: una fila de autovalores por par (diagonal, fuera)
+    assert autovalores_tridiagonal(n, [3.0, 2.0], [-0.7, 0.5]).shape == (2, n)
+    assert np.isclose(numero_condicion_tridiagonal(n, 3.0, -0.7), np.linalg.cond(densa))
+    nx, alpha, dx = 12, 1.3, 1 / 11
+    dts = np.array([1e-4, 1e-3, 1e-2])
+    for dt, cond in zip(dts, numero_condicion_cn(nx, alpha, dts, dx)):
+        r = alpha * dt / (2 * dx**2)
+        linea = np.eye(nx - 2) - r * _laplaciano_1d(nx - 2)
+        assert np.isclose(cond, np.linalg.cond(linea))
+    variable = matriz_coeficiente_variable(np.linspace(0.5, 3.0, 15), 1e-2, 0.1)
+    assert np.isclose(numero_condicion_disperso(variable), np.linalg.cond(variable.toarray()), rtol=1e-6)
+
+def test_factores_amplificacion():
+    # Dirichlet en una malla n×m: los modos sin(kπx) dan θ = kπ/(n+1) y G es autovalor del paso
+    n, m, alpha, dx, dy = 6, 5, 0.8, 0.1, 0.15
+    Lx = np.kron(_laplaciano_1d(n), np.eye(m)) / dx**2
+    Ly = np.kron(np.eye(n), _laplaciano_1d(m)) / dy**2
+    I = np.eye(n * m)
+    tx, ty = np.meshgrid(np.arange(1, n + 1) * np.pi / (n + 1), np.arange(1, m + 1) * np.pi / (m + 1), indexing='ij')
+    for dt in (1e-3, 4e-3, 5e-2):
+        a = alpha * dt
+        pasos = {
+            'ftcs': I + a * (Lx + Ly),
+            'cn': np.linalg.solve(I - a / 2 * (Lx + Ly), I + a / 2 * (Lx + Ly)),
+            'adi': np.linalg.solve(I - a / 2 * Ly, I + a / 2 * Lx) @ np.linalg.solve(I - a / 2 * Lx, I + a / 2 * Ly),
+        }
+        for metodo, paso in pasos.items():
+            G = FACTORES_AMPLIFICACION[metodo](alpha, dt, dx, dy, tx, ty)
+            assert np.allclose(np.sort(G.ravel()), np.sort(np.linalg.eigvals(paso).real)), (metodo, dt)
+
+    # max |G| vectorizado contra una malla fina de frecuencias; FTCS estable hasta el límite CFL
+    dts = np.array([[1e-4], [5e-3], [1e-1]])
+    dxs = np.array([0.05, 0.1])
+    theta = np.linspace(0, np.pi, 101)
+    TX, TY = np.meshgrid(theta, theta)
+    for metodo, factor in FACTORES_AMPLIFICACION.items():
+        maximos = amplificacion_maxima(metodo, alpha, dts, dxs, dxs)
+        assert maximos.shape == (3, 2)
+        for i, j in np.ndindex(maximos.shape):
+            fina = np.abs(factor(alpha, dts[i, 0], dxs[j], dxs[j], TX, TY)).max()
+            assert np.isclose(maximos[i, j], fina)
+    limite = 0.25 * dx**2 / alpha
+    assert es_estable('ftcs', alpha, limite, dx, dx) and not es_estable('ftcs', alpha, 1.01 * limite, dx, dx)
+    assert np.all(es_estable('cn', alpha, dts, dxs, dxs)) and np.all(es_estable('adi', alpha, dts, dxs, dxs))
+
+if __name__ == "__main__":
+    test_autovalores_y_condicion()
+    test_factores_amplificacion()
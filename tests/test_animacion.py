@@ -0,0 +1,37 @@
+"""Test de la exportación de animaciones: paleta, coloreado con NaN/inf y secuencia PNG sin cambiar el backend."""
+import sys
+sys.path.append('./')
+import os
+import numpy as np
+import matplotlib
+from utils.animacion import colorear, exportar_animacion, tabla_colores
+
+def test_colorear():
+    tabla = tabla_colores('viridis', niveles=16)
+    assert tabla.shape == (16, 3) and tabla.dtype == np.uint8
+    assert np.array_equal(tabla[0], (np.array(matplotlib.colormaps['viridis'](0.0))[:3] * 255).astype(np.uint8))
+    u = np.array([[0.0, 0.5, 1.0],
+                  [-np.inf, np.nan, np.inf]])
+    imagen = colorear(u, tabla, 0.0, 1.0)
+    assert imagen.shape == (2, 3, 3) and imagen.dtype == np.uint8
+    # Origen abajo: la fila 0 del campo es la última de la imagen
+    assert np.array_equal(imagen[1, 0], tabla[0]) and np.array_equal(imagen[1, 2], tabla[-1])
+    assert np.array_equal(imagen[1, 1], tabla[7])
+    # ±inf se saturan; NaN toma el color de inválido
+    assert np.array_equal(imagen[0, 0], tabla[0]) and np.array_equal(imagen[0, 2], tabla[-1])
+    assert np.array_equal(imagen[0, 1], [0, 0, 0])
+    assert np.array_equal(colorear(u, tabla, 0.0, 1.0, color_invalido=(255, 0, 255))[0, 1], [255, 0, 255])
+    assert colorear(u, tabla, 0.0, 1.0, escala=3).shape == (6, 9, 3)
+
+def test_exportar_png(tmp_path):
+    backend = matplotlib.get_backend()
+    campos = (np.full((4, 5), k / 9) for k in range(10))
+    n = exportar_animacion(campos, str(tmp_path / 'cuadros'), cada=3, procesos=0)
+    assert n == 4
+    assert sorted(os.listdir(tmp_path / 'cuadros')) == [f'cuadro_{i:06d}.png' for i in range(4)]
+    assert matplotlib.get_backend() == backend
+
+if __name__ == "__main__":
+    import tempfile, pathlib
+    test_colorear()
+    test_exportar_png(pathlib.Path(tempfile.mkdtemp()))
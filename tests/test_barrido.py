@@ -0,0 +1,58 @@
+"""Test del barrido con caché: claves estables con escalares de numpy, aciertos de caché y poda LRU."""
+import sys
+sys.path.append('./')
+import os
+import numpy as np
+from utils.barrido import clave_caso, ejecutar_barrido, guardar_cache, leer_cache, podar_cache
+
+def test_clave_caso():
+    caso = {'metodo': 'ADI', 'N': 10, 'dt': 1e-4, 'pasos': 5}
+    assert clave_caso(caso) == clave_caso(dict(caso, N=np.int64(10), dt=np.float64(1e-4), pasos=np.int32(5)))
+    assert clave_caso(caso) != clave_caso(dict(caso, N=11))
+
+def test_cache_y_poda(tmp_path):
+    directorio = str(tmp_path / 'cache')
+    casos = [{'metodo': 'ADI', 'N': 12, 'dt': 1e-4, 'pasos': 5},
+             {'metodo': 'FTCS', 'N': 12, 'dt': 1e-4, 'pasos': 5}]
+    primero = ejecutar_barrido(casos, directorio, procesos=1)
+    assert not any(r['cache'] for r in primero)
+    # El mismo caso con escalares de numpy acierta en el caché
+    repetidos = casos + [dict(casos[0], N=np.int64(12))]
+    segundo = ejecutar_barrido(repetidos, directorio, procesos=1)
+    assert all(r['cache'] for r in segundo)
+    assert np.array_equal(segundo[2]['u'], primero[0]['u'])
+
+    # Poda: se eliminan primero los menos usados (leer_cache renueva la marca de uso)
+    directorio = str(tmp_path / 'poda')
+    for i, clave in enumerate('abc'):
+        guardar_cache(directorio, clave, {'u': np.zeros(1000), 'tiempo': 0.0, 'pasos': 1})
+        os.utime(os.path.join(directorio, clave + '.npz'), (1000 + i, 1000 + i))
+    assert leer_cache(directorio, 'a') is not None
+    tam = os.path.getsize(os.path.join(directorio, 'a.npz'))
+    assert podar_cache(directorio, 2 * tam) == 1
+    assert sorted(os.listdir(directorio)) == ['a.npz', 'c.npz']
+
+def test_cache_danado(tmp_path):
+    # Un .npz truncado (p. ej. de un proceso terminado) cuenta como fallo de caché y se recalcula
+    directorio = str(tmp_path / 'cache')
+    caso = {'metodo': 'FTCS', 'N': 12, 'dt': 1e-4, 'pasos': 5}
+    primero, = ejecutar_barrido([caso], directorio, procesos=1)
+    ruta = os.path.join(directorio, clave_caso(caso) + '.npz')
+    with open(ruta, 'rb') as f:
+        contenido = f.read()
+    for danado in (contenido[:len(contenido) // 2], b''):
+        with open(ruta, 'wb') as f:
+            f.write(danado)
+        assert leer_cache(directorio, clave_caso(caso)) is None
+        assert not os.path.exists(ruta)
+    with open(ruta, 'wb') as f:
+        f.write(contenido[:100])
+    repetido, = ejecutar_barrido([caso], directorio, procesos=1)
+    assert not repetido['cache'] and np.array_equal(repetido['u'], primero['u'])
+    assert leer_cache(directorio, clave_caso(caso)) is not None
+
+if __name__ == "__main__":
+    import tempfile, pathlib
+    test_clave_caso()
+    test_cache_y_poda(pathlib.Path(tempfile.mkdtemp()))
+    test_cache_danado(pathlib.Path(tempfile.mkdtemp()))
@@ -0,0 +1,68 @@
+"""Test del estudio de escalado: reporte JSON con casos, exponentes y recomendación por presupuesto."""
+import sys
+sys.path.append('./')
+import json
+from concurrent.futures.process import BrokenProcessPool
+import utils.benchmarking as benchmarking
+from utils.benchmarking import elegir_configuracion, estudio_escalado
+
+def test_estudio_escalado(tmp_path):
+    ruta = tmp_path / 'escalado.json'
+    metodos = {'FTCS': 'ftcs', 'ADI': 'adi'}
+    reporte = estudio_escalado(metodos, tamaños=(16, 32, 64, 2**15), presupuesto=5.0, tiempo_min=0.01,
+                               aislado=False, ruta=str(ruta))
+    cargado = json.loads(ruta.read_text())
+    for nombre in metodos:
+        casos = cargado['metodos'][nombre]['casos']
+        # El presupuesto corta antes de la malla de 32768²
+        assert [c['N'] for c in casos] == [16, 32, 64]
+        assert all(c['t_paso'] > 0 and c['pasos_medidos'] >= 3 for c in casos)
+        assert casos[-1]['tracemalloc_construccion'] > casos[0]['tracemalloc_construccion']
+        p = cargado['metodos'][nombre]['ajustes']['tracemalloc_construccion']['p']
+        assert 0.7 < p < 1.3  # la memoria de trabajo crece como el número de nodos
+
+    opciones = elegir_configuracion(cargado, tiempo_total=1.0, pasos=100)
+    assert {o['metodo'] for o in opciones} == set(metodos)
+    assert all(o['tiempo_estimado'] <= 1.0 for o in opciones)
+    # Sin procesos aislados solo hay tracemalloc, y el reporte lo dice
+    assert cargado['memoria']['metrica'] == 'tracemalloc_construccion'
+    # Con menos memoria disponible la malla elegida no puede crecer
+    limitadas = elegir_configuracion(reporte, tiempo_total=1.0, pasos=100, memoria_max=2**20)
+    for o, l in zip(sorted(opciones, key=lambda o: o['metodo']), sorted(limitadas, key=lambda o: o['metodo'])):
+        assert l['N'] <= o['N'] and l['memoria_estimada'] <= 2**20
+
+def test_memoria_rss_aislada():
+    # tracemalloc no ve los factores de SuperLU; con casos aislados el límite usa el RSS
+    reporte = estudio_escalado({'TR-BDF2': 'trbdf2'}, tamaños=(128, 256), presupuesto=60.0, tiempo_min=0.01)
+    assert reporte['memoria']['metrica'] == 'rss_incremento'
+    casos = reporte['metodos']['TR-BDF2']['casos']
+    # El pico de las importaciones del proceso no oculta el crecimiento de la malla menor
+    assert all(c['rss_incremento'] > 0 for c in casos)
+    assert casos[-1]['rss_incremento'] > casos[-1]['tracemalloc_construccion']
+    memoria_max = 256 * 2**20
+    opcion, = elegir_configuracion(reporte, tiempo_total=1e6, pasos=1, memoria_max=memoria_max)
+    assert opcion['metrica_memoria'] == 'rss_incremento' and opcion['memoria_estimada'] <= memoria_max
+
+def test_estudio_proceso_terminado(tmp_path, monkeypatch):
+    # Un proceso aislado muerto por falta de memoria no pierde los casos ya medidos
+    perfilar = benchmarking.perfilar_caso
+
+    def perfilar_con_fallo(metodo, N, *args):
+        if N == 64:
+            raise BrokenProcessPool('proceso terminado')
+        return perfilar(metodo, N, *args)
+    monkeypatch.setattr(benchmarking, 'perfilar_caso', perfilar_con_fallo)
+    ruta = tmp_path / 'parcial.json'
+    reporte = estudio_escalado({'FTCS': 'ftcs'}, tamaños=(16, 32, 64, 128), presupuesto=30.0, tiempo_min=0.01,
+                               aislado=False, ruta=str(ruta))
+    datos = json.loads(ruta.read_text())['metodos']['FTCS']
+    assert [c['N'] for c in datos['casos']] == [16, 32]
+    assert datos['fallo'] == {'N': 64, 'error': 'BrokenProcessPool'}
+    # La recomendación no propone mallas en las que el estudio se quedó sin memoria
+    assert elegir_configuracion(reporte, tiempo_total=1e6, pasos=1)[0]['N'] < 64
+
+if __name__ == "__main__":
+    import tempfile, pathlib
+    test_estudio_escalado(pathlib.Path(tempfile.mkdtemp()))
+    test_memoria_rss_aislada()
+    print("OK")
@@ -0,0 +1,40 @@
+"""Test de FTCS por teselas con bloqueo temporal: idéntico a resolver_ftcs para cualquier tesela y k."""
+import sys
+sys.path.append('./')
+import time
+import numpy as np
+from src.condiciones import inicializar_dominio, temperatura_inicial
+from src.bloqueado import resolver_ftcs_bloqueado, autoajustar_bloques
+from src.solucionadores import resolver_ftcs
+
+def test_ftcs_bloqueado():
+    x, y, dx, dy = inicializar_dominio(47, 53)
+    u0 = temperatura_inicial(x, y, tipo='gaussiana')
+    dt, pasos = 0.2 * dx**2, 23
+    for tipo, valor in [('dirichlet', 0.0), ('neumann', 0.5)]:
+        referencia = resolver_ftcs(u0, dx, dy, dt, pasos, tipo_frontera=tipo, valor_frontera=valor)[-1]
+        for tesela, k in [((16, 16), 4), ((10, 30), 7), ((64, 64), 1), ((8, 8), 23)]:
+            u = resolver_ftcs_bloqueado(u0, dx, dy, dt, pasos, tipo_frontera=tipo, valor_frontera=valor,
+                                        tesela=tesela, pasos_por_bloque=k)
+            assert np.allclose(u, referencia, atol=1e-14), (tipo, tesela, k)
+    tesela, k = autoajustar_bloques(u0.shape, candidatos_tesela=(16, 32), candidatos_k=(1, 4))
+    print(f"Autoajuste: tesela={tesela}, k={k}")
+    assert tesela in ((16, 16), (32, 32)) and k in (1, 4)
+    # Los candidatos forman parte de la clave: una llamada por defecto no hereda la elección anterior
+    tesela, k = autoajustar_bloques(u0.shape)
+    assert tesela[0] in (32, 64, 128, 256) and k in (1, 2, 4, 8)
+
+def test_autoajuste_acotado():
+    # En mallas grandes se mide sobre una submalla y con tope de tiempo
+    inicio = time.perf_counter()
+    tesela, k = autoajustar_bloques((4096, 4096), lado_muestra=256, tiempo_max=0.5)
+    assert time.perf_counter() - inicio < 2.0
+    assert tesela[0] in (32, 64, 128, 256) and k in (1, 2, 4, 8)
+    # La misma submalla y candidatos reutilizan la medición
+    inicio = time.perf_counter()
+    assert autoajustar_bloques((3000, 5000), lado_muestra=256, tiempo_max=0.5) == (tesela, k)
+    assert time.perf_counter() - inicio < 1e-3
+
+if __name__ == "__main__":
+    test_ftcs_bloqueado()
+    test_autoajuste_acotado()
@@ -0,0 +1,41 @@
+"""Test de la ecuación de calor 3D: FTCS y Douglas-Gunn frente a la solución analítica senoidal."""
+import sys
+sys.path.append('./')
+import numpy as np
+from src.calor3d import (SolucionadorCalor3D, inicializar_dominio_3d, resolver_adi_3d, resolver_ftcs_3d,
+                         temperatura_inicial_3d)
+from src.validacion import error_l2
+
+def _exacta(x, y, z, t):
+    return temperatura_inicial_3d(x, y, z, 'senoidal') * np.exp(-3*np.pi**2*t)
+
+def test_calor3d():
+    x, y, z, dx, dy, dz = inicializar_dominio_3d(21, 17, 19)
+    u0 = temperatura_inicial_3d(x, y, z, 'senoidal')
+    T = 0.02
+    dt = 0.15 * dx**2
+    pasos = int(round(T / dt))
+    u = resolver_ftcs_3d(u0, dx, dy, dz, dt, pasos)[-1]
+    assert error_l2(u, _exacta(x, y, z, pasos*dt)) < 1e-2
+    errores = []
+    for pasos in (10, 20):
+        u = resolver_adi_3d(u0, dx, dy, dz, T / pasos, pasos, solo_final=True)[-1]
+        errores.append(error_l2(u, _exacta(x, y, z, T)))
+    assert errores[-1] < 1e-2
+    # Segundo orden en el tiempo: el error apenas cambia con dt (domina el espacial), sin oscilaciones
+    assert errores[1] <= errores[0] * 1.05
+
+def test_dirichlet_no_nula():
+    x, y, z, dx, dy, dz = inicializar_dominio_3d(12, 13, 14)
+    s = SolucionadorCalor3D((12, 13, 14), dx, dy, dz, 0.05, 'adi', valor_frontera=2.5)
+    s.fijar_estado(np.full((12, 13, 14), 2.5))
+    assert np.allclose(s.avanzar(5), 2.5)
+    s.fijar_estado(np.zeros((12, 13, 14)))
+    u = s.avanzar(3)
+    assert np.all((u >= -1e-12) & (u <= 2.5 + 1e-12)) and u[6, 6, 7] < u[6, 6, 1]
+    s.avanzar(200)
+    assert np.allclose(s.u, 2.5, atol=1e-6)
+
+if __name__ == "__main__":
+    test_calor3d()
+    test_dirichlet_no_nula()
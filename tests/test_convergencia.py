@@ -3,8 +3,8 @@ import sys
 sys.path.append('./')
 import numpy as np
 from src.condiciones import inicializar_dominio, temperatura_inicial
-from src.solucionadores import resolver_ftcs
-from src.validacion import solucion_analitica, error_l2
+from src.solucionadores import resolver_adi, resolver_ftcs, resolver_cn
+from src.validacion import solucion_analitica, error_l2, orden_observado
 
 def test_convergencia_ftcs():
     resultados = []
@@ -21,5 +21,59 @@ def test_convergencia_ftcs():
         print(f"nx={nx}, Error L2={err:.2e}")
     return resultados
 
+def test_convergencia_compacta_cn():
+    # Esquema compacto de cuarto orden: mismo error que 5 puntos con una malla 4 veces más gruesa
+    t_final = 0.05
+    hs, errores = [], []
+    for nx, orden in [(11, 4), (21, 4), (41, 4), (41, 2)]:
+        x, y, dx, dy = inicializar_dominio(nx, nx, lx=1.0, ly=1.0)
+        u0 = temperatura_inicial(x, y, tipo='senoidal')
+        pasos = int(round(t_final / (0.1 * dx**2)))
+        soluciones = resolver_cn(u0, dx, dy, t_final / pasos, pasos, orden=orden)
+        err = error_l2(soluciones[-1], solucion_analitica(x, y, t_final, tipo='senoidal'))
+        print(f"nx={nx}, orden={orden}, Error L2={err:.2e}")
+        if orden == 4:
+            hs.append(dx)
+            errores.append(err)
+    assert orden_observado(hs, errores) > 3.8
+    assert errores[0] < err
+
+def test_convergencia_compacta_ftcs_adi():
+    # Orden espacial 4 también en los caminos compactos de FTCS y ADI
+    t_final = 0.05
+    for nombre, resolver, c in [('ftcs', resolver_ftcs, 0.1), ('adi', resolver_adi, 0.5)]:
+        hs, errores = [], []
+        for nx in (11, 21, 41):
+            x, y, dx, dy = inicializar_dominio(nx, nx, lx=1.0, ly=1.0)
+            u0 = temperatura_inicial(x, y, tipo='senoidal')
+            pasos = int(round(t_final / (c * dx**2)))
+            dt = t_final / pasos
+            u = resolver(u0, dx, dy, dt, pasos, orden=4)[-1]
+            if nombre == 'ftcs':
+                # El error temporal O(dt) = O(h²) de Euler explícito taparía el espacial: el seno es
+                # modo propio del esquema, así que se compara con el avance exacto en espacio y
+                # Euler explícito en tiempo, (1 - 2π²dt)^pasos
+                referencia = solucion_analitica(x, y, 0.0, tipo='senoidal') * (1 - 2*np.pi**2*dt)**pasos
+            else:
+                referencia = solucion_analitica(x, y, t_final, tipo='senoidal')
+            hs.append(dx)
+            errores.append(error_l2(u, referencia))
+        print(f"{nombre}: errores {errores}, orden {orden_observado(hs, errores):.2f}")
+        assert orden_observado(hs, errores) > 3.8, nombre
+
+def test_compacta_frontera_no_nula():
+    # Con Dirichlet no nulo un campo uniforme es estacionario y el transitorio tiende a él
+    x, y, dx, dy = inicializar_dominio(21, 21, lx=1.0, ly=1.0)
+    uniforme = np.ones((21, 21))
+    u = resolver_cn(uniforme, dx, dy, 1e-3, 20, valor_frontera=1.0, orden=4)[-1]
+    assert np.allclose(u, 1.0, atol=1e-12)
+    u0 = np.zeros((21, 21))
+    u0[[0, -1], :] = u0[:, [0, -1]] = 1.0
+    u = resolver_cn(u0, dx, dy, 1e-2, 200, valor_frontera=1.0, orden=4)[-1]
+    assert np.allclose(u, 1.0, atol=1e-6)
+
 if __name__ == "__main__":
     test_convergencia_ftcs()
+    test_convergencia_compacta_cn()
+    test_convergencia_compacta_ftcs_adi()
+    test_compacta_frontera_no_nula()
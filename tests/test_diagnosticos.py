@@ -0,0 +1,38 @@
+"""Test de diagnósticos en línea: conservación con Neumann, balance energía-flujo y error contra referencia."""
+import sys
+sys.path.append('./')
+import numpy as np
+from src.condiciones import inicializar_dominio, temperatura_inicial
+from src.diagnosticos import Diagnosticos
+from src.solucionadores import SolucionadorCalor, resolver_cn
+from src.validacion import solucion_analitica, error_l2
+
+def test_diagnosticos_en_linea():
+    x, y, dx, dy = inicializar_dominio(41, 41)
+    u0 = temperatura_inicial(x, y, tipo='gaussiana')
+    # Neumann homogénea implícita: la energía trapezoidal se conserva y el flujo es casi nulo
+    solucionador = SolucionadorCalor(u0.shape, dx, dy, 0.01, 'cn', tipo_frontera='neumann')
+    diag = Diagnosticos(dx, dy, cada=5)
+    solucionador.observadores.append(diag)
+    solucionador.fijar_estado(u0)
+    solucionador.avanzar(50)
+    assert diag.n == 11
+    assert np.allclose(diag['energia'], diag['energia'][0], rtol=1e-12)
+    assert np.all(np.abs(diag['flujo_frontera']) < 1e-3)  # solo error de truncamiento
+    # Dirichlet: d(energía)/dt ≈ flujo por la frontera, y error contra la solución analítica
+    u0 = temperatura_inicial(x, y, tipo='senoidal')
+    dt = 1e-4
+    referencia = lambda t: solucion_analitica(x, y, t)
+    solucionador = SolucionadorCalor(u0.shape, dx, dy, dt, 'cn')
+    diag = Diagnosticos(dx, dy, referencia=referencia)
+    solucionador.observadores.append(diag)
+    solucionador.fijar_estado(u0)
+    solucionador.avanzar(100)
+    derivada = np.gradient(diag['energia'], diag['t'])
+    assert np.allclose(derivada[1:-1], diag['flujo_frontera'][1:-1], rtol=1e-2)
+    final = resolver_cn(u0, dx, dy, dt, 100)[-1]
+    assert np.isclose(diag['error_l2'][-1], error_l2(final, referencia(100 * dt)))
+    assert np.isclose(diag['maximo'][-1], final.max())
+
+if __name__ == "__main__":
+    test_diagnosticos_en_linea()
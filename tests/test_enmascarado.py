@@ -0,0 +1,46 @@
+"""Test de dominios enmascarados: rectángulo completo = solucionadores rectangulares, agujero aislado conserva calor."""
+import sys
+sys.path.append('./')
+import numpy as np
+from src.condiciones import aplicar_frontera_dirichlet, inicializar_dominio, temperatura_inicial
+from src.enmascarado import SolucionadorEnmascarado, mascara_agujeros, mascara_l, resolver_enmascarado
+from src.solucionadores import resolver_ftcs, resolver_l_estable
+
+def test_rectangulo_equivale():
+    x, y, dx, dy = inicializar_dominio(25, 25)
+    u0 = temperatura_inicial(x, y, tipo='gaussiana')
+    aplicar_frontera_dirichlet(u0, 0.3)
+    mascara = np.zeros(u0.shape, dtype=bool)
+    mascara[1:-1, 1:-1] = True
+    dt, pasos = 0.2 * dx**2, 30
+    u = resolver_enmascarado(u0, mascara, dx, dy, dt, pasos, valor_frontera=0.3)[-1]
+    assert np.allclose(u, resolver_ftcs(u0, dx, dy, dt, pasos, valor_frontera=0.3)[-1], atol=1e-12)
+    u = resolver_enmascarado(u0, mascara, dx, dy, 1e-2, 10, metodo='be', valor_frontera=0.3)[-1]
+    referencia = resolver_l_estable(u0, dx, dy, 1e-2, 10, metodo='be', valor_frontera=0.3)[-1]
+    assert np.allclose(u, referencia, atol=1e-10)
+
+def test_geometrias():
+    x, y, dx, dy = inicializar_dominio(41, 41)
+    u0 = temperatura_inicial(x, y, tipo='gaussiana')
+    # Forma en L: el costo (no ceros del operador) escala con el área activa
+    l = SolucionadorEnmascarado(mascara_l(41, 41), dx, dy, 1e-3, 'cn')
+    assert len(l.activos) == np.count_nonzero(mascara_l(41, 41)) < 0.8 * 39**2
+    assert l._A.nnz <= 5 * len(l.activos)
+    l.fijar_estado(u0)
+    u = l.avanzar(20)
+    assert np.all(u[~l.mascara] == 0.0) and np.all(np.abs(u) <= 1.0)
+    # Placa aislada con un agujero aislado: FTCS conserva la suma de los nodos activos
+    mascara = mascara_agujeros(41, 41, dx, dy, [(0.5, 0.5, 0.15)])
+    mascara[[0, -1], :] = True
+    mascara[:, [0, -1]] = True
+    s = SolucionadorEnmascarado(mascara, dx, dy, 0.2 * dx**2, tipo_frontera='neumann')
+    s.fijar_estado(u0)
+    total = s.v.sum()
+    s.avanzar(200)
+    assert np.isclose(s.v.sum(), total, rtol=1e-12)
+    assert np.all(np.isnan(s.u[~mascara]))
+    assert s.v.std() < np.take(u0.ravel(), s.activos).std()
+
+if __name__ == "__main__":
+    test_rectangulo_equivale()
+    test_geometrias()
@@ -0,0 +1,46 @@
+"""Test del integrador exponencial: tiempos grandes sin paso de tiempo y fuente vía funciones φ."""
+import sys
+sys.path.append('./')
+import time
+import numpy as np
+from src.condiciones import inicializar_dominio, temperatura_inicial
+from src.exponencial import resolver_exponencial
+from src.validacion import solucion_analitica, error_l2
+
+def test_exponencial_seno():
+    x, y, dx, dy = inicializar_dominio(41, 41)
+    u0 = temperatura_inicial(x, y, tipo='senoidal')
+    tiempos = [0.01, 0.1, 0.3]
+    sols = resolver_exponencial(u0, dx, dy, tiempos)
+    for t, u in zip(tiempos, sols):
+        err = error_l2(u, solucion_analitica(x, y, t, tipo='senoidal'))
+        print(f"t={t}, Error L2={err:.2e}")
+        assert err < 5e-3  # solo error espacial O(h²)
+
+def test_exponencial_fuente():
+    # Modo seno con autovalor discreto λ: u' = λu + f0 + f1 t tiene solución cerrada
+    x, y, dx, dy = inicializar_dominio(21, 21)
+    perfil = temperatura_inicial(x, y, tipo='senoidal')
+    lam = -4 * np.sin(np.pi * dx / 2)**2 / dx**2 - 4 * np.sin(np.pi * dy / 2)**2 / dy**2
+    a0, a1, t = 2.0, 3.0, 0.2
+    u = resolver_exponencial(np.zeros_like(perfil), dx, dy, [t], fuente=[a0 * perfil, a1 * perfil])[-1]
+    e = np.exp(lam * t)
+    c = a0 * (e - 1) / lam + a1 * ((e - 1) / lam**2 - t / lam)
+    assert np.allclose(u, c * perfil, atol=1e-10)
+
+def test_exponencial_horizonte_largo():
+    # El costo no crece con el horizonte: t = 10⁴ cuesta como t = 10⁻³ y llega al estado estacionario
+    x, y, dx, dy = inicializar_dominio(129, 97)
+    u0 = temperatura_inicial(x, y, tipo='gaussiana').T
+    duraciones = {}
+    for t in (1e-3, 1e4):
+        inicio = time.perf_counter()
+        u = resolver_exponencial(u0, dx, dy, [t], valor_frontera=0.4)[-1]
+        duraciones[t] = time.perf_counter() - inicio
+    assert np.allclose(u, 0.4, atol=1e-12)
+    assert duraciones[1e4] < 0.5 and duraciones[1e4] < 20 * duraciones[1e-3] + 0.05
+
+if __name__ == "__main__":
+    test_exponencial_seno()
+    test_exponencial_fuente()
+    test_exponencial_horizonte_largo()
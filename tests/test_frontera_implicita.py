@@ -0,0 +1,37 @@
+"""Test de fronteras de flujo implícitas en CN/ADI: conservación con Neumann y estado estacionario mixto/Robin."""
+import sys
+sys.path.append('./')
+import numpy as np
+from src.condiciones import inicializar_dominio, temperatura_inicial
+from src.solucionadores import resolver_cn, resolver_adi
+
+def energia_trapecio(u, dx, dy):
+    w_x = np.ones(u.shape[0]); w_x[[0, -1]] = 0.5
+    w_y = np.ones(u.shape[1]); w_y[[0, -1]] = 0.5
+    return np.sum(np.outer(w_x, w_y) * u) * dx * dy
+
+def test_neumann_conserva_energia_dt_grande():
+    x, y, dx, dy = inicializar_dominio(31, 31)
+    u0 = temperatura_inicial(x, y, tipo='gaussiana')
+    for resolver in (resolver_cn, resolver_adi):
+        sols = resolver(u0, dx, dy, 0.01, 50, tipo_frontera='neumann')  # dt ≈ 90 veces el límite FTCS
+        e0, e1 = energia_trapecio(sols[0], dx, dy), energia_trapecio(sols[-1], dx, dy)
+        print(f"{resolver.__name__}: energía {e0:.6f} -> {e1:.6f}")
+        assert abs(e1 - e0) / e0 < 1e-12
+
+def test_estado_estacionario_mixto_y_robin():
+    x, y, dx, dy = inicializar_dominio(31, 31)
+    u0 = temperatura_inicial(x, y, tipo='gaussiana')
+    aislado = {'izquierdo': ('neumann', 0.0), 'derecho': ('neumann', 0.0)}
+    # Flujo impuesto 2 en el borde superior: u = 2·x
+    bordes = dict(aislado, inferior=('dirichlet', 0.0), superior=('neumann', 2.0))
+    u = resolver_cn(u0, dx, dy, 0.05, 400, tipo_frontera='mixta', bordes=bordes)[-1]
+    assert np.allclose(u, 2 * x[:, None], atol=1e-5)
+    # Robin ∂u/∂n = -3(u - 1): u = a·x con a = 3(1 - a), a = 3/4
+    bordes = dict(aislado, inferior=('dirichlet', 0.0), superior=('robin', 3.0, 1.0))
+    u = resolver_adi(u0, dx, dy, 0.05, 400, tipo_frontera='mixta', bordes=bordes)[-1]
+    assert np.allclose(u, 0.75 * x[:, None], atol=1e-5)
+
+if __name__ == "__main__":
+    test_neumann_conserva_energia_dt_grande()
+    test_estado_estacionario_mixto_y_robin()
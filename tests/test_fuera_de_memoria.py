@@ -0,0 +1,56 @@
+"""Test de FTCS fuera de memoria: coincide con resolver_ftcs y no deja archivos temporales."""
+import sys
+sys.path.append('./')
+import gc
+import glob
+import os
+import tempfile
+import tracemalloc
+import numpy as np
+from src.condiciones import inicializar_dominio, temperatura_inicial
+from src.solucionadores import resolver_ftcs
+from src.fuera_de_memoria import resolver_ftcs_memmap
+
+def test_memmap_igual_a_ftcs(tmp_path):
+    x, y, dx, dy = inicializar_dominio(40, 33)
+    u0 = temperatura_inicial(x, y, tipo='gaussiana')
+    dt = 0.2 * min(dx, dy)**2
+    # memoria_max pequeña: varios bloques de filas con halo y pasadas de k pasos
+    memoria = 3 * u0.shape[1] * 8 * 20
+    for tipo, valor in (('dirichlet', 0.3), ('neumann', 0.5)):
+        referencia = resolver_ftcs(u0, dx, dy, dt, 13, tipo_frontera=tipo, valor_frontera=valor)[-1]
+        u = resolver_ftcs_memmap(u0, dx, dy, dt, 13, tipo_frontera=tipo, valor_frontera=valor,
+                                 directorio=str(tmp_path / tipo), memoria_max=memoria, pasos_por_bloque=4)
+        assert np.allclose(u, referencia, atol=1e-13), tipo
+
+    # Desde un .npy y con carpeta temporal: al liberar la solución no quedan archivos
+    ruta = tmp_path / 'u0.npy'
+    np.save(ruta, u0)
+    antes = set(glob.glob(os.path.join(tempfile.gettempdir(), 'ftcs_memmap_*')))
+    u = resolver_ftcs_memmap(str(ruta), dx, dy, dt, 13, memoria_max=memoria, pasos_por_bloque=4)
+    assert np.allclose(u, resolver_ftcs(u0, dx, dy, dt, 13)[-1], atol=1e-13)
+    nuevas = set(glob.glob(os.path.join(tempfile.gettempdir(), 'ftcs_memmap_*'))) - antes
+    assert len(nuevas) == 1 and os.listdir(nuevas.pop()) == ['u_a.dat']
+    del u
+    gc.collect()
+    assert set(glob.glob(os.path.join(tempfile.gettempdir(), 'ftcs_memmap_*'))) == antes
+
+def test_memmap_memoria_acotada(tmp_path):
+    # Los arreglos de trabajo (los únicos que ve tracemalloc; el memmap no) caben en memoria_max,
+    # más los buffers de tamaño fijo de los ufuncs de NumPy (unos 64 KiB por operando)
+    u0 = np.random.default_rng(0).random((1200, 300))
+    memoria = 4 * 2**20
+    tracemalloc.start()
+    try:
+        u = resolver_ftcs_memmap(u0, 1.0, 1.0, 0.2, 10, directorio=str(tmp_path), memoria_max=memoria,
+                                 pasos_por_bloque=4)
+        pico = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    assert pico <= memoria + 2**18
+    assert np.allclose(u, resolver_ftcs(u0, 1.0, 1.0, 0.2, 10)[-1], atol=1e-13)
+
+if __name__ == "__main__":
+    import pathlib
+    test_memmap_igual_a_ftcs(pathlib.Path(tempfile.mkdtemp()))
+    test_memmap_memoria_acotada(pathlib.Path(tempfile.mkdtemp()))
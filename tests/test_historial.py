@@ -0,0 +1,34 @@
+"""Test del historial comprimido: error acotado, acceso aleatorio, razón de compresión y disco."""
+import sys
+sys.path.append('./')
+import os
+import tempfile
+import numpy as np
+from src.condiciones import inicializar_dominio, temperatura_inicial
+from src.historial import HistorialComprimido, integrar_comprimido
+from src.solucionadores import SolucionadorCalor, resolver_ftcs
+
+def test_historial_comprimido():
+    x, y, dx, dy = inicializar_dominio(64, 64)
+    u0 = temperatura_inicial(x, y, tipo='gaussiana')
+    dt, pasos, error_max = 0.2 * dx**2, 200, 1e-4
+    referencia = resolver_ftcs(u0, dx, dy, dt, pasos)
+    historial = integrar_comprimido(SolucionadorCalor(u0.shape, dx, dy, dt), u0, pasos, error_max)
+    assert len(historial) == pasos + 1
+    for i in [150, 3, 0, 64, 65, pasos]:  # acceso aleatorio en cualquier orden
+        assert np.max(np.abs(historial[i] - referencia[i])) <= error_max * (1 + 1e-12)
+    print(f"Razón de compresión: {historial.razon_compresion():.1f}")
+    assert historial.razon_compresion() > 10
+    with tempfile.TemporaryDirectory() as carpeta:
+        ruta = os.path.join(carpeta, 'historial.npz')
+        historial.guardar(ruta)
+        en_disco = HistorialComprimido.cargar(ruta)
+        os.remove(ruta)  # cargar() no deja el archivo abierto
+        assert len(en_disco) == len(historial)
+        assert np.array_equal(en_disco[3], historial[3])
+        assert np.array_equal(en_disco[-1], historial[-1])
+        en_disco.agregar(referencia[-1])
+        assert np.max(np.abs(en_disco[-1] - referencia[-1])) <= error_max * (1 + 1e-12)
+
+if __name__ == "__main__":
+    test_historial_comprimido()
@@ -0,0 +1,83 @@
+"""Test del gradiente conjugado precondicionado: coincide con SuperLU y el arranque en caliente ahorra iteraciones."""
+import sys
+sys.path.append('./')
+import warnings
+import numpy as np
+import pytest
+from src.condiciones import inicializar_dominio, temperatura_inicial
+from src.solucionadores import SolucionadorCalor, resolver_l_estable
+
+BORDES = {'inferior': ('dirichlet', 1.0), 'superior': ('neumann', 0.5),
+          'izquierdo': ('robin', 2.0, 0.3), 'derecho': ('dirichlet', 0.0)}
+
+def test_gradiente_conjugado():
+    x, y, dx, dy = inicializar_dominio(31, 27)
+    u0 = temperatura_inicial(x, y, tipo='gaussiana').T
+    for tipo, bordes in [('dirichlet', None), ('neumann', None), ('mixta', BORDES), ('periodica', None)]:
+        for metodo in ('be', 'trbdf2'):
+            directa = resolver_l_estable(u0, dx, dy, 5e-3, 6, metodo, tipo_frontera=tipo, bordes=bordes)[-1]
+            for precondicionador in ('ichol', 'jacobi', 'adi'):
+                u = resolver_l_estable(u0, dx, dy, 5e-3, 6, metodo, tipo_frontera=tipo, bordes=bordes,
+                                       lineal={'precondicionador': precondicionador, 'tol': 1e-11})[-1]
+                assert np.allclose(u, directa, atol=1e-8), (tipo, metodo, precondicionador)
+
+def test_arranque_en_caliente():
+    x, y, dx, dy = inicializar_dominio(41, 41)
+    u0 = temperatura_inicial(x, y, tipo='gaussiana')
+    iteraciones = {}
+    for arranque in ('cero', 'anterior', 'extrapolacion'):
+        s = SolucionadorCalor(u0.shape, dx, dy, 1e-3, 'bdf2', valor_frontera=0.2,
+                              lineal={'precondicionador': 'jacobi', 'tol': 1e-8, 'arranque': arranque})
+        s.fijar_estado(u0)
+        s.avanzar(20)
+        assert all(r[-1] <= 1e-8 for r in s.lineal.residuos)
+        iteraciones[arranque] = sum(s.lineal.iteraciones)
+    print(iteraciones)
+    assert iteraciones['extrapolacion'] <= iteraciones['anterior'] < iteraciones['cero']
+    # Relajar la tolerancia reduce las iteraciones por paso
+    s.lineal.tol = 1e-4
+    s.lineal.iteraciones.clear()
+    s.avanzar(20)
+    assert sum(s.lineal.iteraciones) < iteraciones['extrapolacion']
+    # El primer paso de BDF2 usa otra matriz; sus estadísticas quedan en lineal_inicio
+    assert len(s.lineal_inicio.iteraciones) == 1 and s.lineal_inicio.residuos[0][-1] <= 1e-8
+    assert len(s.lineal.iteraciones) == 20
+
+def test_ichol_malla_grande():
+    # IC(0) simétrico: el gradiente conjugado converge en pocas iteraciones en 257²
+    x, y, dx, dy = inicializar_dominio(257, 257)
+    u0 = temperatura_inicial(x, y, tipo='gaussiana')
+    s = SolucionadorCalor(u0.shape, dx, dy, 1e-3, 'be', valor_frontera=0.5,
+                          lineal={'precondicionador': 'ichol', 'max_iter': 60})
+    s.fijar_estado(u0)
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        u = s.avanzar(2).copy()
+    assert max(s.lineal.iteraciones) < 60
+    assert np.allclose(u, resolver_l_estable(u0, dx, dy, 1e-3, 2, 'be', valor_frontera=0.5)[-1], atol=1e-7)
+    # Sin converger dentro de max_iter se avisa en lugar de devolver x en silencio
+    s.lineal.max_iter = 3
+    with pytest.warns(RuntimeWarning):
+        s.paso()
+
+def test_precondicionador_por_defecto():
+    # El barrido ADI desplazado es el predeterminado y necesita menos iteraciones que IC(0)
+    x, y, dx, dy = inicializar_dominio(257, 257)
+    u0 = temperatura_inicial(x, y, tipo='gaussiana')
+    iteraciones = {}
+    for nombre, opciones in (('adi', {}), ('ichol', {'precondicionador': 'ichol'})):
+        s = SolucionadorCalor(u0.shape, dx, dy, 1e-3, 'be', valor_frontera=0.5, lineal=opciones)
+        s.fijar_estado(u0)
+        s.avanzar(3)
+        assert s.lineal.precondicionador == nombre
+        iteraciones[nombre] = s.lineal.iteraciones
+    print(iteraciones)
+    # Sin el desplazamiento, los pasos tras el primero necesitaban unas 90 iteraciones
+    assert max(iteraciones['adi']) < 40
+    assert sum(iteraciones['adi']) < sum(iteraciones['ichol']) / 1.5
+
+if __name__ == "__main__":
+    test_gradiente_conjugado()
+    test_arranque_en_caliente()
+    test_ichol_malla_grande()
+    test_precondicionador_por_defecto()
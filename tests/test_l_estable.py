@@ -0,0 +1,40 @@
+"""Test de integradores L-estables: orden temporal y amortiguamiento con datos discontinuos y dt grande."""
+import sys
+sys.path.append('./')
+import numpy as np
+from src.condiciones import inicializar_dominio, temperatura_inicial
+from src.exponencial import resolver_exponencial
+from src.solucionadores import resolver_l_estable, resolver_cn
+from src.validacion import error_l2, orden_observado
+
+def test_orden_temporal():
+    x, y, dx, dy = inicializar_dominio(41, 41)
+    u0 = temperatura_inicial(x, y, tipo='senoidal')
+    t_final = 0.2
+    referencia = resolver_exponencial(u0, dx, dy, [t_final])[-1]  # exacta en el tiempo
+    for metodo, orden in [('be', 1), ('bdf2', 2), ('trbdf2', 2)]:
+        pasos = [5, 10, 20, 40]
+        errores = [error_l2(resolver_l_estable(u0, dx, dy, t_final / n, n, metodo)[-1], referencia)
+                   for n in pasos]
+        p = orden_observado([t_final / n for n in pasos], errores)
+        print(f"{metodo}: orden observado {p:.2f}")
+        assert abs(p - orden) < 0.2
+
+def test_sin_oscilaciones_dt_grande():
+    # Placa con borde superior caliente: dt ≈ 800 veces el límite FTCS
+    x, y, dx, dy = inicializar_dominio(41, 41)
+    u0 = np.zeros((41, 41))
+    u0[-1, :] = 1.0
+    bordes = {'inferior': ('dirichlet', 0.0), 'superior': ('dirichlet', 1.0),
+              'izquierdo': ('dirichlet', 0.0), 'derecho': ('dirichlet', 0.0)}
+    u_cn = resolver_cn(u0, dx, dy, 0.05, 1, tipo_frontera='mixta', bordes=bordes)[-1]
+    assert u_cn.max() > 1.2  # CN no amortigua los modos rígidos
+    for metodo in ('be', 'bdf2'):
+        u = resolver_l_estable(u0, dx, dy, 0.05, 3, metodo, tipo_frontera='mixta', bordes=bordes)[-1]
+        assert u.min() >= -1e-12 and u.max() <= 1 + 1e-12
+    u = resolver_l_estable(u0, dx, dy, 0.05, 3, 'trbdf2', tipo_frontera='mixta', bordes=bordes)[-1]
+    assert u.max() < 1.05
+
+if __name__ == "__main__":
+    test_orden_temporal()
+    test_sin_oscilaciones_dt_grande()
@@ -0,0 +1,53 @@
+"""Test de la ejecución por lotes: especificación declarativa -> .npz/.json sin importar matplotlib."""
+import sys
+sys.path.append('./')
+import json
+import subprocess
+import numpy as np
+from src.condiciones import inicializar_dominio, temperatura_inicial
+from src.solucionadores import resolver_cn
+import pytest
+from utils.lote import ejecutar_especificacion, ejecutar_lote
+
+def test_lote(tmp_path):
+    base = {'metodo': 'cn', 'malla': {'nx': 21}, 'dt': 1e-3, 'pasos': 20, 'condicion_inicial': 'senoidal',
+            'salidas': {'tiempos': [0.005], 'sondas': {'centro': [0.5, 0.5]}, 'diagnosticos': {'cada': 2}}}
+    especificaciones = [dict(base, nombre='cn'), dict(base, nombre='adi', metodo='adi'),
+                        dict(base, nombre='roto', metodo='desconocido')]
+    resultados = ejecutar_lote(especificaciones, str(tmp_path), procesos=2)
+    assert 'error' in resultados[2]
+
+    x, y, dx, dy = inicializar_dominio(21, 21)
+    referencia = resolver_cn(temperatura_inicial(x, y, 'senoidal'), dx, dy, 1e-3, 20)[-1]
+    with np.load(tmp_path / 'cn.npz') as datos:
+        assert np.allclose(datos['u'], referencia)
+        assert datos['campos'].shape == (1, 21, 21)
+        assert len(datos['sonda_centro']) == 21
+        assert len(datos['diagnostico_energia']) == 11
+    resumen = json.loads((tmp_path / 'adi.json').read_text())
+    assert resumen['resumen']['pasos'] == 20 and resumen['tiempos']['integracion'] > 0
+
+    # La línea de comandos no importa matplotlib si no se piden gráficas
+    ruta = tmp_path / 'cn.json'
+    ruta.write_text(json.dumps(dict(base, nombre='cli')))
+    codigo = ("import sys; from utils.lote import principal; "
+              f"assert principal([{str(ruta)!r}, '-o', {str(tmp_path)!r}]) == 0; "
+              "assert 'matplotlib' not in sys.modules")
+    subprocess.run([sys.executable, '-c', codigo], check=True)
+    assert (tmp_path / 'cli.npz').exists()
+
+def test_tiempos_de_salida(tmp_path):
+    # El tiempo final pasos·dt es una salida válida; los tiempos fuera de rango son un error
+    espec = {'nombre': 'final', 'metodo': 'adi', 'malla': {'nx': 15}, 'dt': 1e-3, 'pasos': 20,
+             'salidas': {'tiempos': [0.01, 0.02]}}
+    ejecutar_especificacion(espec, str(tmp_path))
+    with np.load(tmp_path / 'final.npz') as datos:
+        assert datos['campos'].shape == (2, 15, 15)
+        assert np.array_equal(datos['campos'][-1], datos['u'])
+    with pytest.raises(ValueError, match='fuera de'):
+        ejecutar_especificacion(dict(espec, salidas={'tiempos': [0.01, 0.03]}), str(tmp_path))
+
+if __name__ == "__main__":
+    import pathlib, tempfile
+    test_lote(pathlib.Path(tempfile.mkdtemp()))
+    test_tiempos_de_salida(pathlib.Path(tempfile.mkdtemp()))
@@ -0,0 +1,38 @@
+"""Test de Parareal: converge a la integración fina secuencial en menos iteraciones que rebanadas."""
+import sys
+sys.path.append('./')
+import numpy as np
+from src.condiciones import inicializar_dominio, temperatura_inicial
+from src.parareal import resolver_parareal
+from src.solucionadores import resolver_cn
+
+def test_parareal_converge_a_fina():
+    x, y, dx, dy = inicializar_dominio(25, 25)
+    u0 = temperatura_inicial(x, y, tipo='gaussiana')
+    t_final, rebanadas = 0.08, 8
+    gruesa = {'metodo': 'trbdf2', 'dt': 0.01}
+    fina = {'metodo': 'cn', 'dt': 5e-4}
+    soluciones, iteraciones = resolver_parareal(u0, dx, dy, t_final, rebanadas, gruesa, fina,
+                                                tol=1e-5, procesos=2)
+    referencia = resolver_cn(u0, dx, dy, 5e-4, 160)
+    print(f"Iteraciones: {iteraciones} de {rebanadas} rebanadas")
+    assert len(soluciones) == rebanadas + 1
+    assert iteraciones < rebanadas
+    for n in (4, 8):
+        assert np.allclose(soluciones[n], referencia[20 * n], atol=1e-4)
+
+def test_parareal_grueso_l_estable():
+    # Un grueso tipo Crank-Nicolson no amortigua los modos rígidos: agota las rebanadas
+    x, y, dx, dy = inicializar_dominio(25, 25)
+    u0 = temperatura_inicial(x, y, tipo='gaussiana')
+    fina = {'metodo': 'cn', 'dt': 5e-4}
+    iteraciones = {metodo: resolver_parareal(u0, dx, dy, 0.08, 8, {'metodo': metodo, 'dt': 0.01}, fina,
+                                             tol=1e-5, procesos=0)[1]
+                   for metodo in ('adi', 'trbdf2')}
+    print(iteraciones)
+    assert iteraciones['trbdf2'] < 8
+    assert iteraciones['trbdf2'] < iteraciones['adi']
+
+if __name__ == "__main__":
+    test_parareal_converge_a_fina()
+    test_parareal_grueso_l_estable()
@@ -0,0 +1,33 @@
+"""Test de frontera periódica: esténcil envuelto, líneas cíclicas y solucionador FFT exacto."""
+import sys
+sys.path.append('./')
+import numpy as np
+from src.condiciones import inicializar_dominio_periodico
+from src.periodico import resolver_periodico_fft
+from src.solucionadores import resolver_ftcs, resolver_cn, resolver_adi, resolver_l_estable
+from src.validacion import error_l2
+
+def test_periodico():
+    nx, ny = 32, 24
+    x, y, dx, dy = inicializar_dominio_periodico(nx, ny, 1.0, 2.0)
+    X, Y = np.meshgrid(x, y, indexing='ij')  # eje 0 ↔ x, como en los solucionadores
+    u0 = 1.0 + np.cos(2*np.pi*X) * np.sin(np.pi*Y) + 0.3*np.sin(4*np.pi*X)
+    t_final = 0.02
+    # Solución exacta de la EDP: cada modo decae con exp(-α|k|²t)
+    exacta = (1.0 + np.exp(-5*np.pi**2*t_final) * np.cos(2*np.pi*X) * np.sin(np.pi*Y)
+              + 0.3*np.exp(-16*np.pi**2*t_final) * np.sin(4*np.pi*X))
+    assert np.allclose(resolver_periodico_fft(u0, dx, dy, [t_final])[-1], exacta, atol=1e-12)
+    discreta = resolver_periodico_fft(u0, dx, dy, [t_final], espectro='discreto')[-1]
+    dt = 0.2 * dx**2
+    pasos = int(round(t_final / dt))
+    dt = t_final / pasos
+    for resolver in (resolver_ftcs, resolver_cn, resolver_adi):
+        u = resolver(u0, dx, dy, dt, pasos, tipo_frontera='periodica')[-1]
+        print(f"{resolver.__name__}: error contra semidiscreta {error_l2(u, discreta):.2e}")
+        assert error_l2(u, discreta) < 2e-3  # FTCS: error temporal O(dt)
+        assert np.isclose(u.mean(), u0.mean())  # conservación de la media
+    u = resolver_l_estable(u0, dx, dy, dt, pasos, 'trbdf2', tipo_frontera='periodica')[-1]
+    assert error_l2(u, discreta) < 1e-4
+
+if __name__ == "__main__":
+    test_periodico()
@@ -0,0 +1,45 @@
+"""Test del modelo reducido POD: consultas dentro del rango entrenado y respaldo al solucionador completo."""
+import sys
+sys.path.append('./')
+import numpy as np
+from src.condiciones import inicializar_dominio, temperatura_inicial
+from src.reducido import ModeloReducido
+from src.solucionadores import SolucionadorCalor
+from src.validacion import error_l2
+
+def test_modelo_reducido():
+    x, y, dx, dy = inicializar_dominio(30, 30)
+    perfil = temperatura_inicial(x, y, tipo='gaussiana')
+    dt = 1e-3
+    modelo = ModeloReducido(perfil.shape, dx, dy, dt=dt)
+    tiempos = np.linspace(0, 0.05, 26)
+    rango = modelo.entrenar([(a * perfil, g) for a in (0.5, 1.0) for g in (0.0, 1.0)], tiempos)
+    print(f"Base POD: {rango} modos para {perfil.size} incógnitas")
+    assert rango < 60
+    completo = SolucionadorCalor(perfil.shape, dx, dy, dt, 'trbdf2', valor_frontera=0.3)
+    u0 = 0.7 * perfil
+    u0[[0, -1], :] = u0[:, [0, -1]] = 0.3
+    completo.fijar_estado(u0)
+    referencia = completo.en_tiempos([0.03])[0]
+    u, indicador, reducido = modelo.consultar(0.7 * perfil, 0.3, 0.03)
+    assert reducido and indicador < 1e-2
+    assert error_l2(u, referencia) < 1e-3
+    # Condición inicial fuera del espacio entrenado: el indicador obliga al respaldo
+    X, Y = np.meshgrid(x, y)
+    ajena = np.sin(5*np.pi*X) * np.sin(3*np.pi*Y)
+    u, indicador, reducido = modelo.consultar(ajena, 0.0, 0.01)
+    assert not reducido and indicador > 1e-2
+    completo = SolucionadorCalor(perfil.shape, dx, dy, dt, 'trbdf2')
+    completo.fijar_estado(ajena)
+    assert np.allclose(u, completo.en_tiempos([0.01])[0])
+    # Otro valor de frontera reutiliza el mismo solucionador completo (una sola factorización)
+    previo = modelo._solucionador
+    u, _, reducido = modelo.consultar(ajena, 0.6, 0.01)
+    assert not reducido and modelo._solucionador is previo
+    completo = SolucionadorCalor(perfil.shape, dx, dy, dt, 'trbdf2', valor_frontera=0.6)
+    ajena[[0, -1], :] = ajena[:, [0, -1]] = 0.6
+    completo.fijar_estado(ajena)
+    assert np.allclose(u, completo.en_tiempos([0.01])[0])
+
+if __name__ == "__main__":
+    test_modelo_reducido()
@@ -0,0 +1,83 @@
+"""Test del servicio local: un trabajo por el socket coincide con el barrido y publica progreso y métricas."""
+import sys
+sys.path.append('./')
+import asyncio
+import json
+import socket
+import threading
+import numpy as np
+from utils.barrido import ejecutar_caso
+from utils.servicio import VENTANA_METRICAS, ServicioSimulacion, enviar_trabajo, consultar_metricas
+
+def test_servicio_trabajos():
+    servicio = ServicioSimulacion(procesos=2, puerto=0)
+    loop = asyncio.new_event_loop()
+    hilo = threading.Thread(target=loop.run_forever, daemon=True)
+    hilo.start()
+    puerto = asyncio.run_coroutine_threadsafe(servicio.iniciar(), loop).result(timeout=30)
+    try:
+        caso = {'metodo': 'Crank-Nicolson', 'N': 20, 'dt': 1e-3, 'pasos': 20}
+        for _ in range(2):  # el segundo trabajo reutiliza el solucionador del proceso
+            eventos = list(enviar_trabajo(caso, puerto=puerto))
+            assert eventos[0]['evento'] == 'aceptado'
+            assert eventos[-1]['evento'] == 'resultado'
+            assert np.allclose(eventos[-1]['u'], ejecutar_caso(caso)['u'])
+        print([e['fraccion'] for e in eventos if e['evento'] == 'progreso'])
+        errores = list(enviar_trabajo({'metodo': 'Euler', 'N': 20, 'dt': 1e-3, 'pasos': 5}, puerto=puerto))
+        assert errores[-1]['evento'] == 'error'
+        metricas = consultar_metricas(puerto=puerto)
+        assert metricas['completados'] == 2 and metricas['en_cola'] == 0
+        assert metricas['latencia']['media'] > 0
+    finally:
+        asyncio.run_coroutine_threadsafe(servicio.detener(), loop).result(timeout=30)
+        loop.call_soon_threadsafe(loop.stop)
+
+def test_cliente_desconectado():
+    # Un cliente que se va a mitad de un trabajo no debe tumbar al despachador ni al reenvío de progreso
+    servicio = ServicioSimulacion(procesos=1, puerto=0)
+    loop = asyncio.new_event_loop()
+    hilo = threading.Thread(target=loop.run_forever, daemon=True)
+    hilo.start()
+    puerto = asyncio.run_coroutine_threadsafe(servicio.iniciar(), loop).result(timeout=30)
+    try:
+        conexion = socket.create_connection(('127.0.0.1', puerto))
+        largo = {'metodo': 'FTCS', 'N': 200, 'dt': 1e-7, 'pasos': 10000}
+        conexion.sendall((json.dumps({'tipo': 'trabajo', 'caso': largo}) + '\n').encode())
+        lector = conexion.makefile('r', encoding='utf-8')
+        assert json.loads(lector.readline())['evento'] == 'aceptado'
+        # El cliente cierra mientras el trabajo sigue: los envíos de progreso y del resultado
+        # fallan con EPIPE/ECONNRESET
+        lector.close()
+        conexion.close()
+        # Peticiones que no son objetos JSON reciben un error en lugar de cortar la conexión
+        with socket.create_connection(('127.0.0.1', puerto), timeout=30) as otra:
+            otra.sendall(b'[1, 2]\n3\n')
+            respuestas = otra.makefile('r', encoding='utf-8')
+            assert [json.loads(respuestas.readline())['evento'] for _ in range(2)] == ['error', 'error']
+        caso = {'metodo': 'ADI', 'N': 20, 'dt': 1e-3, 'pasos': 10}
+        eventos = []
+        hilo_cliente = threading.Thread(target=lambda: eventos.extend(enviar_trabajo(caso, puerto=puerto)),
+                                        daemon=True)
+        hilo_cliente.start()
+        hilo_cliente.join(timeout=60)
+        assert eventos and eventos[-1]['evento'] == 'resultado'
+        assert all(not tarea.done() for tarea in servicio._tareas)
+    finally:
+        asyncio.run_coroutine_threadsafe(servicio.detener(), loop).result(timeout=60)
+        loop.call_soon_threadsafe(loop.stop)
+
+def test_metricas_acotadas():
+    # Espera y latencia se resumen sobre una ventana: la memoria no crece con cada trabajo
+    servicio = ServicioSimulacion(procesos=1)
+    for i in range(VENTANA_METRICAS + 500):
+        servicio._esperas.append(float(i))
+        servicio._latencias.append(1.0)
+    assert len(servicio._esperas) == len(servicio._latencias) == VENTANA_METRICAS
+    metricas = servicio.metricas()
+    assert metricas['espera']['media'] == 500 + (VENTANA_METRICAS - 1) / 2
+    assert metricas['latencia'] == {'media': 1.0, 'p95': 1.0}
+
+if __name__ == "__main__":
+    test_servicio_trabajos()
+    test_cliente_desconectado()
+    test_metricas_acotadas()
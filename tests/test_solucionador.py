@@ -0,0 +1,61 @@
+"""Test del solucionador reutilizable: mismos resultados que resolver_* y reutilización del estado."""
+import sys
+sys.path.append('./')
+import numpy as np
+import pytest
+from src.condiciones import inicializar_dominio, temperatura_inicial
+from src.solucionadores import SolucionadorCalor, resolver_ftcs, resolver_cn, resolver_adi
+
+def test_solucionador_reutilizable():
+    x, y, dx, dy = inicializar_dominio(30, 30)
+    u0 = temperatura_inicial(x, y, tipo='senoidal')
+    dt = 0.2 * dx**2
+    for metodo, resolver in [('ftcs', resolver_ftcs), ('cn', resolver_cn), ('adi', resolver_adi)]:
+        solucionador = SolucionadorCalor(u0.shape, dx, dy, dt, metodo)
+        referencia = resolver(u0, dx, dy, dt, 12)[-1]
+        for _ in range(2):  # la segunda corrida reutiliza operadores y buffers
+            solucionador.fijar_estado(u0)
+            u = solucionador.avanzar_hasta(12 * dt)
+            assert solucionador.pasos_dados == 12
+            assert np.allclose(u, referencia, atol=1e-13)
+        print(f"{metodo}: t={solucionador.t:.5f}, max={u.max():.5f}")
+
+def test_tiempos_salida():
+    x, y, dx, dy = inicializar_dominio(30, 30)
+    u0 = temperatura_inicial(x, y, tipo='senoidal')
+    dt = 0.2 * dx**2
+    completas = resolver_ftcs(u0, dx, dy, dt, 10)
+    tiempos = [0.0, 3 * dt, 4.25 * dt, 4.5 * dt, 10 * dt]
+    salidas = resolver_ftcs(u0, dx, dy, dt, None, tiempos_salida=tiempos)
+    assert len(salidas) == len(tiempos)
+    assert np.array_equal(salidas[1], completas[3])
+    assert np.allclose(salidas[2], 0.75 * completas[4] + 0.25 * completas[5])
+    assert np.allclose(salidas[3], 0.5 * completas[4] + 0.5 * completas[5])
+    assert np.array_equal(salidas[-1], completas[10])
+
+def test_fijar_frontera():
+    # Cambiar los valores de frontera equivale a construir el solucionador con ellos
+    x, y, dx, dy = inicializar_dominio(24, 24)
+    u0 = temperatura_inicial(x, y, tipo='gaussiana')
+    dt = 0.2 * dx**2
+    mixta = {'inferior': ('dirichlet', 1.0), 'superior': ('neumann', 0.5),
+             'izquierdo': ('robin', 2.0, 0.3), 'derecho': ('dirichlet', 0.0)}
+    nueva = dict(mixta, inferior=('dirichlet', -0.5), izquierdo=('robin', 2.0, 0.8))
+    for metodo in ('ftcs', 'cn', 'trbdf2'):
+        for tipo, bordes, cambio in [('dirichlet', None, None), ('neumann', None, None), ('mixta', mixta, nueva)]:
+            solucionador = SolucionadorCalor(u0.shape, dx, dy, dt, metodo, tipo_frontera=tipo, valor_frontera=0.2,
+                                             bordes=bordes)
+            solucionador.fijar_frontera(0.7, cambio)
+            directo = SolucionadorCalor(u0.shape, dx, dy, dt, metodo, tipo_frontera=tipo, valor_frontera=0.7,
+                                        bordes=cambio)
+            for s in (solucionador, directo):
+                s.fijar_estado(u0)
+            assert np.allclose(solucionador.avanzar(10), directo.avanzar(10), atol=1e-13), (metodo, tipo)
+    # Un coeficiente Robin distinto cambia la matriz factorizada
+    with pytest.raises(ValueError):
+        solucionador.fijar_frontera(0.0, dict(mixta, izquierdo=('robin', 1.0, 0.3)))
+
+if __name__ == "__main__":
+    test_solucionador_reutilizable()
+    test_tiempos_salida()
+    test_fijar_frontera()
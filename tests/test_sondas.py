@@ -0,0 +1,34 @@
+"""Test de sondas: puntos y líneas interpoladas coinciden con los campos completos sin guardarlos."""
+import sys
+sys.path.append('./')
+import numpy as np
+from src.condiciones import inicializar_dominio, temperatura_inicial
+from src.solucionadores import SolucionadorCalor, resolver_cn
+from src.sondas import Sondas
+
+def test_sondas_punto_y_linea():
+    N = 31
+    x, y, dx, dy = inicializar_dominio(N, N)
+    u0 = temperatura_inicial(x, y, tipo='gaussiana')
+    dt, pasos = 1e-3, 40
+    completas = resolver_cn(u0, dx, dy, dt, pasos)
+    sondas = Sondas(x, y, cada=4, capacidad=4)  # capacidad chica: obliga a crecer
+    sondas.agregar_punto('centro', 0.5, 0.5)
+    sondas.agregar_punto('termopar', 0.31, 0.72)
+    sondas.agregar_linea('perfil', (0.0, 0.5), (1.0, 0.5), N)
+    solucionador = SolucionadorCalor(u0.shape, dx, dy, dt, 'cn')
+    solucionador.observadores.append(sondas)
+    solucionador.fijar_estado(u0)
+    solucionador.avanzar(pasos)
+    registrados = list(range(0, pasos + 1, 4))
+    assert np.allclose(sondas.tiempos, dt * np.array(registrados))
+    assert np.allclose(sondas.lecturas('centro'), [completas[n][N // 2, N // 2] for n in registrados])
+    assert np.allclose(sondas.lecturas('perfil'), [completas[n][N // 2, :] for n in registrados])
+    # Interpolación bilineal exacta para un campo lineal
+    X, Y = np.meshgrid(x, y)
+    sondas.reiniciar()
+    sondas.registrar(2*X + 3*Y, 0.0)
+    assert np.isclose(sondas.lecturas('termopar')[0], 2*0.31 + 3*0.72)
+
+if __name__ == "__main__":
+    test_sondas_punto_y_linea()
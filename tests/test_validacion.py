@@ -0,0 +1,35 @@
+"""Test de validación: solución separable en caché, serie de Fourier y errores por lotes."""
+import sys
+sys.path.append('./')
+import numpy as np
+from src.condiciones import inicializar_dominio, temperatura_inicial
+from src.solucionadores import resolver_ftcs
+from src.validacion import (solucion_analitica, coeficientes_fourier, solucion_fourier,
+                            error_l2, error_linf, errores_lote)
+
+def test_fourier_reproduce_seno():
+    x, y, dx, dy = inicializar_dominio(33, 33)
+    u0 = temperatura_inicial(x, y, tipo='senoidal')
+    tiempos = np.array([0.0, 0.01, 0.05])
+    exacta = solucion_analitica(x, y, tiempos)
+    fourier = solucion_fourier(coeficientes_fourier(u0), x, y, tiempos)
+    X, Y = np.meshgrid(x, y)
+    directa = np.exp(-2*np.pi**2*0.05) * np.sin(np.pi*X) * np.sin(np.pi*Y)
+    assert exacta.shape == (3, 33, 33)
+    assert np.allclose(exacta[-1], directa)
+    assert np.allclose(fourier, exacta, atol=1e-12)
+
+def test_errores_lote():
+    x, y, dx, dy = inicializar_dominio(20, 20)
+    u0 = temperatura_inicial(x, y, tipo='senoidal')
+    dt, pasos = 0.2 * dx**2, 10
+    sols = resolver_ftcs(u0, dx, dy, dt, pasos)
+    exactas = solucion_analitica(x, y, dt*np.arange(pasos+1))
+    l2, linf = errores_lote(sols, exactas)
+    assert np.isclose(l2[-1], error_l2(sols[-1], exactas[-1]))
+    assert np.isclose(linf[-1], error_linf(sols[-1], exactas[-1]))
+    print(f"Error L2 por paso: {l2}")
+
+if __name__ == "__main__":
+    test_fourier_reproduce_seno()
+    test_errores_lote()
@@ -0,0 +1,159 @@
+"""Exportación de animaciones sin interfaz gráfica a partir de instantáneas de los solucionadores
+
+Consume las instantáneas como un flujo (lista o generador), toma una de cada
+`cada`, las colorea con normalización fija (vmin, vmax) y escribe una secuencia
+PNG o un video mediante ffmpeg. El coloreado se reparte en lotes entre
+procesos; nunca se guardan todos los cuadros en memoria.
+"""
+
+import sys
+sys.path.append('./')
+
+import os
+import shutil
+import subprocess
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+EXTENSIONES_VIDEO = ('.mp4', '.avi', '.mkv', '.webm', '.gif')
+
+
+def tabla_colores(cmap='plasma', niveles=256):
+    """Tabla (niveles, 3) uint8 del mapa de color de matplotlib"""
+    # Solo la tabla de colores: no hace falta (ni se cambia) el backend de quien llama
+    from matplotlib import colormaps
+    mapa = colormaps[cmap]
+    return (mapa(np.linspace(0, 1, niveles))[:, :3] * 255).astype(np.uint8)
+
+
+COLOR_INVALIDO = (0, 0, 0)
+
+
+def colorear(u, tabla, vmin, vmax, escala=1, color_invalido=COLOR_INVALIDO):
+    """Convierte un campo 2D en una imagen RGB uint8 (origen abajo, como imshow origin='lower')
+
+    Los valores fuera de [vmin, vmax] (incluidos ±inf) se saturan a los extremos de la
+    tabla; los NaN (p. ej. nodos inactivos de un dominio enmascarado) toman color_invalido.
+    """
+    niveles = len(tabla) - 1
+    u = np.asarray(u, dtype=float)
+    invalidos = np.isnan(u)
+    indices = np.clip((u - vmin) * (niveles / (vmax - vmin)), 0, niveles)
+    indices[invalidos] = 0
+    indices = indices.astype(np.intp)
+    imagen = tabla[indices[::-1]]
+    if invalidos.any():
+        imagen[invalidos[::-1]] = color_invalido
+    if escala > 1:
+        imagen = imagen.repeat(escala, axis=0).repeat(escala, axis=1)
+    return imagen
+
+
+def _renderizar_lote(lote, tabla, vmin, vmax, escala, carpeta):
+    """Colorea un lote de (índice, campo); escribe PNG si hay carpeta, si no devuelve los bytes"""
+    if carpeta is None:
+        return b''.join(colorear(u, tabla, vmin, vmax, escala).tobytes() for _, u in lote)
+    import matplotlib.image as mpimg
+    for indice, u in lote:
+        mpimg.imsave(os.path.join(carpeta, f'cuadro_{indice:06d}.png'),
+                     colorear(u, tabla, vmin, vmax, escala))
+    return b''
+
+
+def _abrir_ffmpeg(destino, forma, fps):
+    """Proceso ffmpeg que recibe cuadros RGB crudos por stdin"""
+    ejecutable = shutil.which('ffmpeg')
+    if ejecutable is None:
+        raise RuntimeError('ffmpeg no está disponible; exporte una secuencia PNG (destino = carpeta).')
+    alto, ancho = forma
+    comando = [ejecutable, '-y', '-loglevel', 'error',
+               '-f', 'rawvideo', '-pix_fmt', 'rgb24', '-s', f'{ancho}x{alto}', '-r', str(fps),
+               '-i', '-']
+    if not destino.endswith('.gif'):
+        # yuv420p exige dimensiones pares
+        comando += ['-vf', 'pad=ceil(iw/2)*2:ceil(ih/2)*2', '-pix_fmt', 'yuv420p']
+    return subprocess.Popen(comando + [destino], stdin=subprocess.PIPE)
+
+
+def exportar_animacion(instantaneas, destino, cada=1, vmin=0.0, vmax=1.0, cmap='plasma',
+                       escala=1, fps=25, procesos=None, tam_lote=32):
+    """Exporta instantáneas a una secuencia PNG o a un video sin abrir ventanas.
+
+    Args:
+        instantaneas: iterable de campos 2D (p. ej. la lista de resolver_adi o un generador)
+        destino: carpeta para PNG, o archivo .mp4/.avi/.mkv/.webm/.gif para video
+        cada: decimación, se exporta uno de cada `cada` cuadros
+        vmin, vmax: normalización fija del color para todos los cuadros
+        cmap: mapa de color de matplotlib
+        escala: factor entero de ampliación de píxeles
+        fps: cuadros por segundo del video
+        procesos: procesos para colorear (None = núcleos disponibles, 0 = sin pool)
+        tam_lote: cuadros por tarea enviada a cada proceso
+
+    Returns:
+        Número de cuadros exportados
+    """
+    es_video = destino.lower().endswith(EXTENSIONES_VIDEO)
+    carpeta = None if es_video else destino
+    if carpeta is not None:
+        os.makedirs(carpeta, exist_ok=True)
+    tabla = tabla_colores(cmap)
+
+    def lotes():
+        lote = []
+        for i, u in enumerate(instantaneas):
+            if i % cada == 0:
+                lote.append((i // cada, np.array(u, copy=True)))
+                if len(lote) == tam_lote:
+                    yield lote
+                    lote = []
+        if lote:
+            yield lote
+
+    video = None
+    total = 0
+    pool = ProcessPoolExecutor(max_workers=procesos) if procesos != 0 else None
+    pendientes = []
+    max_pendientes = 2 * (procesos or os.cpu_count() or 1)
+
+    def recoger(futuro):
+        datos = futuro.result() if pool else futuro
+        if video is not None:
+            video.stdin.write(datos)
+
+    try:
+        for lote in lotes():
+            if es_video and video is None:
+                forma = (lote[0][1].shape[0] * escala, lote[0][1].shape[1] * escala)
+                video = _abrir_ffmpeg(destino, forma, fps)
+            total += len(lote)
+            if pool:
+                pendientes.append(pool.submit(_renderizar_lote, lote, tabla, vmin, vmax, escala, carpeta))
+                # Cola acotada: no se acumulan cuadros si el flujo es más rápido que el coloreado
+                while len(pendientes) >= max_pendientes:
+                    recoger(pendientes.pop(0))
+            else:
+                recoger(_renderizar_lote(lote, tabla, vmin, vmax, escala, carpeta))
+        while pendientes:
+            recoger(pendientes.pop(0))
+    finally:
+        if pool:
+            pool.shutdown()
+        if video is not None:
+            video.stdin.close()
+            video.wait()
+    if video is not None and video.returncode != 0:
+        raise RuntimeError(f'ffmpeg terminó con código {video.returncode} al escribir {destino}.')
+    return total
+
+
+if __name__ == "__main__":
+    from src.condiciones import inicializar_dominio, temperatura_inicial
+    from src.solucionadores import resolver_ftcs
+
+    x, y, dx, dy = inicializar_dominio(64, 64)
+    u0 = temperatura_inicial(x, y, tipo='gaussiana')
+    sols = resolver_ftcs(u0, dx, dy, 0.2 * dx**2, 400)
+    n = exportar_animacion(sols, 'animacion_ftcs', cada=5, escala=4)
+    print(f"Cuadros exportados: {n} (carpeta animacion_ftcs/)")
@@ -0,0 +1,215 @@
+"""Barrido de parámetros en paralelo con caché de resultados en disco
+
+Cada caso (método, N, dt, alpha, condición inicial, ...) se identifica por un
+hash de sus parámetros y de la versión del código en src/ y de este módulo. Los resultados se
+guardan como .npz en un directorio de caché acotado en tamaño (se eliminan
+primero los menos usados), de modo que al repetir un barrido solo se calculan
+los casos nuevos o los afectados por cambios en los solucionadores.
+"""
+
+import sys
+sys.path.append('./')
+
+import functools
+import hashlib
+import itertools
+import json
+import os
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+import src
+from src.condiciones import inicializar_dominio, temperatura_inicial
+from src.solucionadores import resolver_ftcs, resolver_cn, resolver_adi
+
+METODOS = {
+    'FTCS': resolver_ftcs,
+    'Crank-Nicolson': resolver_cn,
+    'ADI': resolver_adi,
+}
+
+DIRECTORIO_CACHE = '.cache_barrido'
+
+
+@functools.lru_cache(maxsize=None)
+def version_codigo():
+    """Hash de la versión del paquete, del código fuente de src/ y de este módulo (arma los casos)"""
+    h = hashlib.sha256(src.__version__.encode())
+    carpeta = os.path.dirname(os.path.abspath(src.__file__))
+    rutas = [os.path.join(carpeta, nombre) for nombre in sorted(os.listdir(carpeta)) if nombre.endswith('.py')]
+    for ruta in rutas + [os.path.abspath(__file__)]:
+        with open(ruta, 'rb') as f:
+            h.update(os.path.basename(ruta).encode())
+            h.update(f.read())
+    return h.hexdigest()
+
+
+def normalizar_caso(caso):
+    """Completa un caso con los valores por defecto de los solucionadores"""
+    completo = {
+        'alpha': 1.0,
+        'condicion_inicial': 'senoidal',
+        'tipo_frontera': 'dirichlet',
+        'valor_frontera': 0.0,
+    }
+    completo.update(caso)
+    if completo['metodo'] not in METODOS:
+        raise ValueError(f"Método '{completo['metodo']}' no reconocido")
+    if 'pasos' not in completo:
+        if 'T_final' not in completo:
+            raise ValueError("El caso debe indicar 'pasos' o 'T_final'")
+        completo['pasos'] = int(completo['T_final'] / completo['dt'])
+    return completo
+
+
+def _nativo(valor):
+    """Escalares y arreglos de numpy como tipos de Python, para que np.int64(10) y 10 den la misma clave"""
+    if isinstance(valor, np.generic):
+        return valor.item()
+    if isinstance(valor, np.ndarray):
+        return valor.tolist()
+    raise TypeError(f'Parámetro no serializable: {valor!r}')
+
+
+def clave_caso(caso):
+    """Clave de caché: hash de los parámetros del caso y de la versión del código"""
+    texto = json.dumps(normalizar_caso(caso), sort_keys=True, default=_nativo)
+    return hashlib.sha256((texto + version_codigo()).encode()).hexdigest()
+
+
+def ejecutar_caso(caso):
+    """Ejecuta un caso y devuelve la solución final y el tiempo de cómputo
+
+    Args:
+        caso: dict con 'metodo', 'N', 'dt' y 'pasos' o 'T_final'; opcionales
+            'alpha', 'condicion_inicial', 'tipo_frontera', 'valor_frontera'
+
+    Returns:
+        dict con 'u' (campo final), 'tiempo' (s) y 'pasos'
+    """
+    caso = normalizar_caso(caso)
+    N = caso['N']
+    x, y, dx, dy = inicializar_dominio(N, N)
+    u0 = temperatura_inicial(x, y, tipo=caso['condicion_inicial'])
+    resolver = METODOS[caso['metodo']]
+    t_inicio = time.perf_counter()
+    sols = resolver(u0, dx, dy, caso['dt'], caso['pasos'], caso['alpha'],
+                    tipo_frontera=caso['tipo_frontera'], valor_frontera=caso['valor_frontera'])
+    t_total = time.perf_counter() - t_inicio
+    return {'u': sols[-1], 'tiempo': t_total, 'pasos': caso['pasos']}
+
+
+def leer_cache(directorio, clave):
+    """Devuelve el resultado guardado para la clave, o None si no existe o está dañado"""
+    ruta = os.path.join(directorio, clave + '.npz')
+    try:
+        with np.load(ruta) as datos:
+            resultado = {k: datos[k] for k in datos.files}
+        resultado['tiempo'] = float(resultado['tiempo'])
+        resultado['pasos'] = int(resultado['pasos'])
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, EOFError, KeyError, zipfile.BadZipFile):
+        # Entrada truncada o corrupta (p. ej. de un proceso terminado): se borra y el caso se recalcula
+        try:
+            os.remove(ruta)
+        except OSError:
+            pass
+        return None
+    os.utime(ruta)  # marca de uso reciente para la política de eliminación
+    return resultado
+
+
+def guardar_cache(directorio, clave, resultado):
+    """Guarda un resultado de forma atómica (archivo temporal + rename)"""
+    os.makedirs(directorio, exist_ok=True)
+    ruta = os.path.join(directorio, clave + '.npz')
+    tmp = os.path.join(directorio, f'.{clave}.{os.getpid()}.tmp.npz')
+    np.savez(tmp, **resultado)
+    os.replace(tmp, ruta)
+
+
+def podar_cache(directorio, max_bytes):
+    """Elimina los resultados menos usados hasta que el caché ocupe <= max_bytes
+
+    Returns:
+        Número de archivos eliminados
+    """
+    if not os.path.isdir(directorio):
+        return 0
+    entradas = []
+    for nombre in os.listdir(directorio):
+        if nombre.endswith('.npz') and not nombre.startswith('.'):
+            info = os.stat(os.path.join(directorio, nombre))
+            entradas.append((info.st_mtime, info.st_size, nombre))
+    total = sum(e[1] for e in entradas)
+    eliminados = 0
+    for _, tam, nombre in sorted(entradas):
+        if total <= max_bytes:
+            break
+        os.remove(os.path.join(directorio, nombre))
+        total -= tam
+        eliminados += 1
+    return eliminados
+
+
+def casos_producto(**parametros):
+    """Producto cartesiano de listas de parámetros
+
+    Ejemplo:
+        casos_producto(metodo=['FTCS', 'ADI'], N=[20, 40], dt=[1e-4], pasos=[50])
+    """
+    nombres = list(parametros)
+    return [dict(zip(nombres, valores)) for valores in itertools.product(*parametros.values())]
+
+
+def ejecutar_barrido(casos, directorio_cache=DIRECTORIO_CACHE, max_bytes=1 << 30, procesos=None):
+    """Ejecuta un barrido de casos en un pool de procesos con caché en disco
+
+    Args:
+        casos: lista de dicts (ver ejecutar_caso)
+        directorio_cache: carpeta de resultados; None desactiva el caché
+        max_bytes: tamaño máximo del caché en disco
+        procesos: número de procesos (None = núcleos disponibles)
+
+    Returns:
+        Lista de resultados en el mismo orden que casos; cada uno incluye
+        'caso', 'u', 'tiempo', 'pasos' y 'cache' (True si no se recalculó)
+    """
+    claves = [clave_caso(c) for c in casos]
+    resultados = [None] * len(casos)
+    pendientes = {}
+    for i, clave in enumerate(claves):
+        previo = leer_cache(directorio_cache, clave) if directorio_cache else None
+        if previo is not None:
+            resultados[i] = dict(previo, caso=casos[i], cache=True)
+        else:
+            pendientes.setdefault(clave, []).append(i)
+
+    print(f"Barrido: {len(casos)} casos, {len(casos) - sum(map(len, pendientes.values()))} en caché")
+    if pendientes:
+        with ProcessPoolExecutor(max_workers=procesos) as pool:
+            futuros = {pool.submit(ejecutar_caso, casos[indices[0]]): clave
+                       for clave, indices in pendientes.items()}
+            for futuro in as_completed(futuros):
+                clave = futuros[futuro]
+                resultado = futuro.result()
+                # Solo el proceso principal escribe en el caché
+                if directorio_cache:
+                    guardar_cache(directorio_cache, clave, resultado)
+                for i in pendientes[clave]:
+                    resultados[i] = dict(resultado, caso=casos[i], cache=False)
+        if directorio_cache:
+            podar_cache(directorio_cache, max_bytes)
+    return resultados
+
+
+if __name__ == "__main__":
+    casos = casos_producto(metodo=['FTCS', 'Crank-Nicolson', 'ADI'], N=[20, 40],
+                           dt=[5e-5], T_final=[0.01])
+    for r in ejecutar_barrido(casos):
+        c = r['caso']
+        origen = 'caché' if r['cache'] else 'calculado'
+        print(f"  {c['metodo']:>15} N={c['N']:>3}: {r['tiempo']:.4f} s ({origen})")
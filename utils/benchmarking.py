@@ -1,12 +1,25 @@
-"""Benchmarking y análisis de escalabilidad para FTCS, Crank-Nicolson y ADI"""
+"""Benchmarking y análisis de escalabilidad para FTCS, Crank-Nicolson y ADI
+
+estudio_escalado() extiende analisis_escalabilidad(): mallas grandes con
+presupuesto de tiempo, exponentes de complejidad ajustados por método, costo de
+construcción separado del costo por paso en régimen, memoria (RSS pico y
+asignaciones de tracemalloc) y un reporte JSON para elegir método y malla.
+"""
 
 import sys
 sys.path.append('./')
 
-import numpy as np
-import matplotlib.pyplot as plt
+import json
+import os
+import platform
 import time
-from src.solucionadores import resolver_ftcs, resolver_cn, resolver_adi
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import multiprocessing
+
+import numpy as np
+from src.solucionadores import SolucionadorCalor, resolver_ftcs, resolver_cn, resolver_adi
 
 
 def condicion_inicial_seno(X, Y):
@@ -213,6 +226,7 @@ def graficar_resultados(resultados, escalabilidad, guardar=True):
         escalabilidad: datos de escalabilidad
         guardar: si True, guarda las figuras
     """
+    import matplotlib.pyplot as plt
     fig, axes = plt.subplots(2, 2, figsize=(14, 10))
     
     # Gráfico 1: Tiempo vs Tamaño de malla
@@ -281,6 +295,278 @@ def graficar_resultados(resultados, escalabilidad, guardar=True):
         print("\nGráficos guardados: benchmarking_resultados.png")
     plt.show()
 
+METODOS_ESCALADO = {'FTCS': 'ftcs', 'Crank-Nicolson': 'cn', 'ADI': 'adi', 'TR-BDF2': 'trbdf2'}
+TAMAÑOS_ESCALADO = (32, 64, 128, 256, 512, 1024, 2048)
+
+
+def _rss_pico():
+    """RSS pico del proceso en bytes (None si la plataforma no lo informa)"""
+    try:
+        # Linux: VmHWM, que _reiniciar_rss_pico() puede llevar al RSS actual
+        with open('/proc/self/status') as f:
+            for linea in f:
+                if linea.startswith('VmHWM:'):
+                    return int(linea.split()[1]) * 1024
+    except OSError:
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return pico if sys.platform == 'darwin' else pico * 1024
+
+
+def _reiniciar_rss_pico():
+    """Lleva el RSS pico al RSS actual (Linux ≥ 4.0), para que el pico de las importaciones
+    no oculte el crecimiento de un caso; en otras plataformas no hace nada"""
+    try:
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+    except OSError:
+        pass
+
+
+def perfilar_caso(metodo, N, alpha=1.0, tiempo_min=0.2, pasos_max=200, pasos_memoria=3):
+    """Mide un método en una malla NxN separando construcción, primer paso y régimen
+
+    Los tiempos se toman sin tracemalloc (su rastreo encarece cada asignación); la
+    memoria se mide después en una segunda pasada rastreada con otro solucionador.
+
+    Args:
+        metodo: clave de SolucionadorCalor ('ftcs', 'cn', 'adi', 'trbdf2', ...)
+        N: puntos por lado
+        tiempo_min: tiempo mínimo de medición del régimen (s)
+        pasos_max: tope de pasos medidos en régimen
+        pasos_memoria: pasos de régimen de la pasada rastreada
+
+    Returns:
+        dict con tiempos (s), pasos medidos, bytes de tracemalloc y RSS
+    """
+    dx = dy = 1.0 / (N - 1)
+    dt = 0.2 * dx**2 / alpha
+    x = np.linspace(0, 1, N)
+    u0 = condicion_inicial_seno(*np.meshgrid(x, x))
+    _reiniciar_rss_pico()
+    rss_base = _rss_pico()
+
+    # Pasada cronometrada
+    t_inicio = time.perf_counter()
+    solucionador = SolucionadorCalor((N, N), dx, dy, dt, metodo, alpha)
+    solucionador.fijar_estado(u0)
+    t_construccion = time.perf_counter() - t_inicio
+    t_inicio = time.perf_counter()
+    solucionador.paso()
+    t_primer_paso = time.perf_counter() - t_inicio
+    # Régimen: pasos sueltos hasta tiempo_min; la mediana descarta interrupciones
+    tiempos = []
+    inicio_regimen = time.perf_counter()
+    while len(tiempos) < pasos_max and (len(tiempos) < 3 or time.perf_counter() - inicio_regimen < tiempo_min):
+        t_inicio = time.perf_counter()
+        solucionador.paso()
+        tiempos.append(time.perf_counter() - t_inicio)
+    del solucionador
+
+    # Pasada rastreada: memoria de construcción y asignaciones transitorias por paso
+    tracemalloc.start()
+    try:
+        solucionador = SolucionadorCalor((N, N), dx, dy, dt, metodo, alpha)
+        solucionador.fijar_estado(u0)
+        memoria_construccion = tracemalloc.get_traced_memory()[1]
+        solucionador.paso()
+        vivo = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        for _ in range(pasos_memoria):
+            solucionador.paso()
+        actual, pico = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    rss_pico = _rss_pico()
+    return {
+        'N': N, 'puntos': N * N,
+        't_construccion': t_construccion,
+        't_primer_paso': t_primer_paso,
+        't_paso': float(np.median(tiempos)),
+        'pasos_medidos': len(tiempos),
+        'tracemalloc_construccion': memoria_construccion,
+        # Asignaciones transitorias por paso (pico sobre lo que ya estaba vivo)
+        'tracemalloc_paso': max(pico - vivo, 0),
+        'tracemalloc_vivo': actual,
+        'rss_base': rss_base,
+        'rss_pico': rss_pico,
+        # Memoria real del caso, incluida la que tracemalloc no ve (factores de SuperLU, LAPACK)
+        'rss_incremento': rss_pico - rss_base if rss_pico is not None else None,
+    }
+
+
+def _ajustar_potencia(x, y):
+    """Ajuste y ≈ c·x^p por mínimos cuadrados en escala log-log; devuelve (c, p)"""
+    x, y = np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+    validos = (x > 0) & (y > 0)
+    if np.count_nonzero(validos) < 2:
+        return None, None
+    p, log_c = np.polyfit(np.log(x[validos]), np.log(y[validos]), 1)
+    return float(np.exp(log_c)), float(p)
+
+
+def _ajustes_casos(casos):
+    """Ajustes y ≈ c·(N²)^p de tiempos y memoria sobre los casos medidos de un método"""
+    puntos = [c['puntos'] for c in casos]
+    ajustes = {}
+    for clave in ('t_construccion', 't_paso', 'tracemalloc_construccion', 'rss_pico', 'rss_incremento'):
+        valores = [c[clave] for c in casos]
+        if None in valores:
+            continue
+        c, p = _ajustar_potencia(puntos, valores)
+        ajustes[clave] = {'c': c, 'p': p}
+    return ajustes
+
+
+def estudio_escalado(metodos=None, tamaños=TAMAÑOS_ESCALADO, presupuesto=60.0, alpha=1.0,
+                     tiempo_min=0.2, aislado=True, ruta=None):
+    """Estudio de complejidad empírica y memoria por método con presupuesto de tiempo
+
+    Cada caso se ejecuta en un proceso nuevo (aislado=True) para que el RSS pico
+    sea el de ese caso. Para cada método se avanza por tamaños crecientes y se
+    omite el siguiente si la extrapolación de su costo excede lo que queda del
+    presupuesto del método.
+
+    Args:
+        metodos: dict nombre -> método de SolucionadorCalor (por defecto METODOS_ESCALADO)
+        tamaños: valores de N (malla NxN) en orden creciente
+        presupuesto: segundos por método
+        alpha: difusividad
+        tiempo_min: tiempo mínimo de medición del régimen por caso (s)
+        aislado: si es True cada caso corre en un proceso nuevo (spawn)
+        ruta: si se da, el reporte se guarda como JSON en esa ruta, también tras cada caso,
+            de modo que un estudio interrumpido conserva lo medido
+
+    Returns:
+        dict con 'sistema' y, por método, 'casos', 'ajustes' (c, p) de y ≈ c·(N²)^p para
+        t_construccion, t_paso, tracemalloc_construccion y rss_pico, y 'fallo' (el N que se
+        quedó sin memoria o cuyo proceso terminó abruptamente, o None)
+    """
+    metodos = metodos or METODOS_ESCALADO
+    reporte = {
+        'sistema': {'plataforma': platform.platform(), 'python': platform.python_version(),
+                    'numpy': np.__version__, 'nucleos': os.cpu_count()},
+        'presupuesto': presupuesto,
+        # Métrica con la que elegir_configuracion() acota la memoria. Solo con procesos aislados
+        # el incremento de RSS es propio de cada caso; tracemalloc no ve la memoria de C
+        # (factores de SuperLU, LAPACK) y subestima mucho a los métodos implícitos
+        'memoria': {'metrica': 'rss_incremento' if aislado else 'tracemalloc_construccion',
+                    'descripcion': 'incremento de RSS pico por caso aislado' if aislado else
+                    'pico de tracemalloc al construir (no incluye memoria de C; solo orientativo)'},
+        'metodos': {},
+    }
+    contexto = multiprocessing.get_context('spawn')
+    print("\nEjecutando estudio de escalado...")
+    print("-" * 60)
+    for nombre, metodo in metodos.items():
+        casos = []
+        datos = reporte['metodos'][nombre] = {'metodo': metodo, 'casos': casos, 'ajustes': {}, 'fallo': None}
+        gastado = 0.0
+        for N in tamaños:
+            if casos:
+                # Costo del caso siguiente: construcción + pasos de régimen extrapolados
+                previo = casos[-1]
+                escala = (N / previo['N'])**2
+                _, p = _ajustar_potencia([c['puntos'] for c in casos], [c['t_paso'] for c in casos])
+                p = max(p if p is not None else 1.0, 1.0)
+                estimado = (previo['t_construccion'] + previo['t_primer_paso']) * escala**p \
+                    + max(tiempo_min, 3 * previo['t_paso'] * escala**p)
+                if gastado + estimado > presupuesto:
+                    print(f"  {nombre}: N={N} omitido (estimado {estimado:.1f} s excede el presupuesto)")
+                    break
+            t_inicio = time.perf_counter()
+            try:
+                if aislado:
+                    with ProcessPoolExecutor(max_workers=1, mp_context=contexto) as pool:
+                        caso = pool.submit(perfilar_caso, metodo, N, alpha, tiempo_min).result()
+                else:
+                    caso = perfilar_caso(metodo, N, alpha, tiempo_min)
+            except (MemoryError, BrokenProcessPool) as error:
+                # Un proceso aislado que el sistema mata por memoria llega como BrokenProcessPool
+                print(f"  {nombre}: N={N} sin memoria o proceso terminado ({type(error).__name__})")
+                datos['fallo'] = {'N': N, 'error': type(error).__name__}
+                break
+            finally:
+                gastado += time.perf_counter() - t_inicio
+            casos.append(caso)
+            print(f"  {nombre}: N={N} construcción {caso['t_construccion']:.4f} s, "
+                  f"paso {caso['t_paso']:.2e} s, tracemalloc {caso['tracemalloc_construccion'] / 2**20:.1f} MiB")
+            datos['ajustes'] = _ajustes_casos(casos)
+            if ruta:
+                guardar_reporte(reporte, ruta)
+        if datos['ajustes'].get('t_paso', {}).get('p') is not None:
+            print(f"  {nombre}: t_paso ∝ (N²)^{datos['ajustes']['t_paso']['p']:.2f}")
+    if ruta:
+        guardar_reporte(reporte, ruta)
+    return reporte
+
+
+def guardar_reporte(reporte, ruta):
+    """Guarda un reporte de estudio_escalado() como JSON"""
+    with open(ruta, 'w', encoding='utf-8') as f:
+        json.dump(reporte, f, indent=2, default=float)
+
+
+def elegir_configuracion(reporte, tiempo_total, pasos, memoria_max=None):
+    """Mayor malla que cabe en un presupuesto para cada método, según los ajustes del reporte
+
+    Args:
+        reporte: resultado de estudio_escalado() (o el JSON cargado)
+        tiempo_total: segundos disponibles para construcción más pasos
+        pasos: pasos de tiempo necesarios, o dict nombre -> pasos (p. ej. FTCS necesita
+            más pasos que los implícitos para el mismo tiempo físico)
+        memoria_max: bytes de memoria disponibles, opcional; se comparan con el ajuste de la
+            métrica indicada en reporte['memoria'] (incremento de RSS con casos aislados)
+
+    Returns:
+        Lista de dicts {'metodo', 'N', 'tiempo_estimado', 'memoria_estimada', 'metrica_memoria'}
+        ordenada de mayor a menor N
+    """
+    metrica = reporte.get('memoria', {}).get('metrica', 'rss_incremento')
+    opciones = []
+    for nombre, datos in reporte['metodos'].items():
+        ajustes = datos['ajustes']
+        if any(ajustes.get(clave, {}).get('p') is None for clave in ('t_paso', 't_construccion')):
+            continue
+        n_pasos = pasos[nombre] if isinstance(pasos, dict) else pasos
+
+        def tiempo(N):
+            n2 = float(N) * N
+            return (ajustes['t_construccion']['c'] * n2**ajustes['t_construccion']['p']
+                    + n_pasos * ajustes['t_paso']['c'] * n2**ajustes['t_paso']['p'])
+
+        # Sin ajuste de RSS (p. ej. la plataforma no lo informa) se recurre a tracemalloc
+        metrica_metodo = metrica if ajustes.get(metrica, {}).get('p') is not None else 'tracemalloc_construccion'
+        ajuste_memoria = ajustes.get(metrica_metodo, {})
+
+        def memoria(N):
+            if ajuste_memoria.get('p') is None:
+                return 0.0
+            return ajuste_memoria['c'] * (float(N) * N)**ajuste_memoria['p']
+
+        # Búsqueda por bisección del mayor N que cumple ambos límites (costos crecientes en N);
+        # un N que agotó la memoria en el estudio acota la búsqueda
+        tope = datos['fallo']['N'] if datos.get('fallo') else 1 << 20
+        bajo, alto = 3, 3
+        while alto < tope and tiempo(alto) <= tiempo_total and (memoria_max is None or memoria(alto) <= memoria_max):
+            bajo, alto = alto, alto * 2
+        alto = min(alto, tope)
+        while alto - bajo > 1:
+            medio = (bajo + alto) // 2
+            if tiempo(medio) <= tiempo_total and (memoria_max is None or memoria(medio) <= memoria_max):
+                bajo = medio
+            else:
+                alto = medio
+        if tiempo(bajo) <= tiempo_total and (memoria_max is None or memoria(bajo) <= memoria_max):
+            opciones.append({'metodo': nombre, 'N': bajo, 'tiempo_estimado': tiempo(bajo),
+                             'memoria_estimada': memoria(bajo), 'metrica_memoria': metrica_metodo})
+    return sorted(opciones, key=lambda o: -o['N'])
+
+
 def ejecutar_benchmarking_completo():
     """Ejecuta benchmarking completo y genera reportes"""
     tamaños_benchmarking = [10, 20, 30, 40, 50]
@@ -303,4 +589,13 @@ def ejecutar_benchmarking_completo():
     print("\n" + "=" * 60)
 
 if __name__ == "__main__":
-    ejecutar_benchmarking_completo()
+    if len(sys.argv) > 1 and sys.argv[1] == 'escalado':
+        # python utils/benchmarking.py escalado [presupuesto_s] [reporte.json]
+        presupuesto = float(sys.argv[2]) if len(sys.argv) > 2 else 60.0
+        ruta = sys.argv[3] if len(sys.argv) > 3 else 'escalado.json'
+        reporte = estudio_escalado(presupuesto=presupuesto, ruta=ruta)
+        print(f"\nReporte guardado: {ruta}")
+        for opcion in elegir_configuracion(reporte, tiempo_total=60.0, pasos=1000):
+            print(f"  {opcion['metodo']}: N <= {opcion['N']} para 1000 pasos en 60 s")
+    else:
+        ejecutar_benchmarking_completo()
@@ -0,0 +1,267 @@
+"""Ejecución por lotes sin interfaz gráfica a partir de especificaciones declarativas
+
+Uso:
+    python -m utils.lote especificacion.toml [otra.json ...] [-o resultados] [-j procesos]
+
+Cada especificación (JSON, TOML o YAML si PyYAML está instalado) describe una
+corrida completa:
+
+    nombre = "placa"
+    metodo = "adi"                 # cualquiera de src.solucionadores.METODOS
+    dt = 0.002
+    pasos = 10                     # o T_final
+    alpha = 1.0
+    orden = 2
+    condicion_inicial = "cero"     # 'cero', 'gaussiana', 'senoidal' o {archivo = "u0.npy"}
+    [malla]
+    nx = 60
+    ny = 60                        # lx, ly opcionales
+    [frontera]
+    tipo = "mixta"                 # valor = ... para 'dirichlet'/'neumann'
+    bordes = {superior = ["dirichlet", 1.0], inferior = ["dirichlet", 0.0], ...}
+    [salidas]
+    tiempos = [0.005, 0.01]        # campos intermedios guardados
+    sondas = {centro = [0.5, 0.5], perfil = {inicio = [0, 0.5], fin = [1, 0.5], puntos = 20}}
+    diagnosticos = {cada = 1}
+    graficas = false               # matplotlib solo se importa si es true
+
+Por cada corrida se escriben <nombre>.npz (campo final, campos intermedios,
+sondas y diagnósticos) y <nombre>.json (especificación completa, tiempos de
+construcción e integración y un resumen). Varias especificaciones se ejecutan
+a la vez en un pool de procesos.
+"""
+
+import sys
+sys.path.append('./')
+
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from src.condiciones import inicializar_dominio, inicializar_dominio_periodico, temperatura_inicial
+from src.diagnosticos import Diagnosticos
+from src.solucionadores import SolucionadorCalor
+from src.sondas import Sondas
+
+DIRECTORIO_SALIDA = 'resultados'
+
+
+def leer_especificacion(ruta):
+    """Lee una especificación JSON, TOML o YAML según la extensión del archivo"""
+    extension = os.path.splitext(ruta)[1].lower()
+    if extension == '.json':
+        with open(ruta, encoding='utf-8') as f:
+            espec = json.load(f)
+    elif extension == '.toml':
+        import tomllib
+        with open(ruta, 'rb') as f:
+            espec = tomllib.load(f)
+    elif extension in ('.yaml', '.yml'):
+        try:
+            import yaml
+        except ImportError:
+            raise ImportError('Las especificaciones YAML requieren PyYAML (pip install pyyaml).') from None
+        with open(ruta, encoding='utf-8') as f:
+            espec = yaml.safe_load(f)
+    else:
+        raise ValueError(f"Formato de especificación '{extension}' no reconocido (.json, .toml, .yaml)")
+    espec.setdefault('nombre', os.path.splitext(os.path.basename(ruta))[0])
+    # Las rutas relativas de la especificación (p. ej. condicion_inicial.archivo) parten de su carpeta
+    espec.setdefault('_carpeta', os.path.dirname(os.path.abspath(ruta)))
+    return espec
+
+
+def normalizar_especificacion(espec):
+    """Completa una especificación con los valores por defecto y la valida"""
+    completa = {
+        'metodo': 'ftcs',
+        'alpha': 1.0,
+        'orden': 2,
+        'condicion_inicial': 'senoidal',
+        'frontera': {},
+        'salidas': {},
+    }
+    completa.update(espec)
+    if 'nombre' not in completa:
+        raise ValueError("La especificación debe tener 'nombre'")
+    if 'dt' not in completa:
+        raise ValueError("La especificación debe indicar 'dt'")
+    malla = dict({'lx': 1.0, 'ly': 1.0}, **completa.get('malla', {}))
+    if 'nx' not in malla:
+        raise ValueError("La malla debe indicar 'nx'")
+    malla.setdefault('ny', malla['nx'])
+    completa['malla'] = malla
+    completa['frontera'] = dict({'tipo': 'dirichlet', 'valor': 0.0, 'bordes': None}, **completa['frontera'])
+    if 'pasos' not in completa:
+        if 'T_final' not in completa:
+            raise ValueError("La especificación debe indicar 'pasos' o 'T_final'")
+        completa['pasos'] = int(round(completa['T_final'] / completa['dt']))
+    # Tiempos de salida dentro de [0, pasos·dt]; el tiempo final se admite con la misma
+    # tolerancia que SolucionadorCalor.en_tiempos
+    t_final = completa['pasos'] * completa['dt']
+    tol = 1e-9 * completa['dt']
+    fuera = [t for t in completa['salidas'].get('tiempos', []) if t < -tol or t > t_final + tol]
+    if fuera:
+        raise ValueError(f'Tiempos de salida fuera de [0, {t_final:g}]: {fuera}')
+    return completa
+
+
+def _condicion_inicial(espec, x, y):
+    ci = espec['condicion_inicial']
+    if isinstance(ci, dict) and 'archivo' in ci:
+        return np.load(os.path.join(espec.get('_carpeta', '.'), ci['archivo']))
+    return temperatura_inicial(x, y, tipo=ci['tipo'] if isinstance(ci, dict) else ci)
+
+
+def ejecutar_especificacion(espec, directorio=DIRECTORIO_SALIDA):
+    """Ejecuta una corrida y escribe sus resultados en directorio
+
+    Returns:
+        dict con el resumen escrito en <nombre>.json
+    """
+    espec = normalizar_especificacion(espec)
+    malla, frontera, salidas = espec['malla'], espec['frontera'], espec['salidas']
+    t_inicio = time.perf_counter()
+    if frontera['tipo'] == 'periodica':
+        x, y, dx, dy = inicializar_dominio_periodico(malla['nx'], malla['ny'], malla['lx'], malla['ly'])
+    else:
+        x, y, dx, dy = inicializar_dominio(malla['nx'], malla['ny'], malla['lx'], malla['ly'])
+    u0 = _condicion_inicial(espec, x, y)
+    # Los campos siguen np.meshgrid (eje 0 ↔ y), y el solucionador toma el paso del eje 0 primero
+    solucionador = SolucionadorCalor(u0.shape, dy, dx, espec['dt'], espec['metodo'], espec['alpha'],
+                                     frontera['tipo'], frontera['valor'], espec['orden'], frontera['bordes'])
+    sondas = None
+    if salidas.get('sondas'):
+        sondas = Sondas(x, y)
+        for nombre, lugar in salidas['sondas'].items():
+            if isinstance(lugar, dict):
+                sondas.agregar_linea(nombre, lugar['inicio'], lugar['fin'], lugar['puntos'])
+            else:
+                sondas.agregar_punto(nombre, *lugar)
+        solucionador.observadores.append(sondas)
+    diagnosticos = None
+    if salidas.get('diagnosticos'):
+        opciones = salidas['diagnosticos'] if isinstance(salidas['diagnosticos'], dict) else {}
+        diagnosticos = Diagnosticos(dy, dx, espec['alpha'], cada=opciones.get('cada', 1))
+        solucionador.observadores.append(diagnosticos)
+    t_construccion = time.perf_counter() - t_inicio
+
+    t_inicio = time.perf_counter()
+    solucionador.fijar_estado(u0)
+    tiempos = list(salidas.get('tiempos', []))
+    campos = solucionador.en_tiempos(tiempos) if tiempos else []
+    solucionador.avanzar(espec['pasos'] - solucionador.pasos_dados)
+    t_integracion = time.perf_counter() - t_inicio
+
+    datos = {'u': solucionador.u, 'x': x, 'y': y}
+    if campos:
+        datos['tiempos'] = np.array(tiempos)
+        datos['campos'] = np.stack(campos)
+    if sondas is not None:
+        datos['sondas_t'] = sondas.tiempos
+        for nombre in salidas['sondas']:
+            datos[f'sonda_{nombre}'] = sondas.lecturas(nombre)
+    if diagnosticos is not None:
+        for campo, serie in diagnosticos.como_dict().items():
+            datos[f'diagnostico_{campo}'] = serie
+
+    os.makedirs(directorio, exist_ok=True)
+    base = os.path.join(directorio, espec['nombre'])
+    np.savez(base + '.npz', **datos)
+    archivos = [base + '.npz', base + '.json']
+    if salidas.get('graficas'):
+        archivos += _graficar(base, datos)
+    resumen = {
+        'especificacion': {k: v for k, v in espec.items() if not k.startswith('_')},
+        'tiempos': {'construccion': t_construccion, 'integracion': t_integracion},
+        'resumen': {'pasos': solucionador.pasos_dados, 't_final': solucionador.t,
+                    'minimo': float(solucionador.u.min()), 'maximo': float(solucionador.u.max())},
+        'archivos': archivos,
+    }
+    with open(base + '.json', 'w', encoding='utf-8') as f:
+        json.dump(resumen, f, indent=2, default=float)
+    return resumen
+
+
+def _graficar(base, datos):
+    """Guarda las gráficas de una corrida como PNG sin abrir ventanas"""
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    archivos = []
+    fig, ax = plt.subplots(figsize=(6, 5))
+    imagen = ax.imshow(datos['u'], origin='lower', cmap='viridis',
+                       extent=(datos['x'][0], datos['x'][-1], datos['y'][0], datos['y'][-1]))
+    fig.colorbar(imagen, ax=ax)
+    ax.set_title('Temperatura final')
+    fig.savefig(base + '_final.png', dpi=120)
+    plt.close(fig)
+    archivos.append(base + '_final.png')
+    puntos = [k for k in datos if k.startswith('sonda_') and datos[k].ndim == 1]
+    if puntos:
+        fig, ax = plt.subplots(figsize=(7, 4))
+        for clave in puntos:
+            ax.plot(datos['sondas_t'], datos[clave], label=clave[len('sonda_'):])
+        ax.set_xlabel('t'); ax.set_ylabel('u'); ax.legend()
+        fig.savefig(base + '_sondas.png', dpi=120)
+        plt.close(fig)
+        archivos.append(base + '_sondas.png')
+    return archivos
+
+
+def ejecutar_lote(especificaciones, directorio=DIRECTORIO_SALIDA, procesos=None):
+    """Ejecuta varias especificaciones en paralelo
+
+    Args:
+        especificaciones: lista de dicts (ver leer_especificacion)
+        directorio: carpeta de resultados
+        procesos: número de procesos (None = núcleos disponibles, 1 = en este proceso)
+
+    Returns:
+        Lista de resúmenes en el mismo orden; una corrida fallida da {'nombre', 'error'}
+    """
+    nombres = [e.get('nombre') for e in especificaciones]
+    if len(set(nombres)) != len(nombres):
+        raise ValueError('Los nombres de las especificaciones deben ser únicos.')
+    if procesos == 1 or len(especificaciones) == 1:
+        futuros = None
+    else:
+        pool = ProcessPoolExecutor(max_workers=procesos)
+        futuros = [pool.submit(ejecutar_especificacion, e, directorio) for e in especificaciones]
+    resultados = []
+    for i, espec in enumerate(especificaciones):
+        try:
+            resultados.append(futuros[i].result() if futuros else ejecutar_especificacion(espec, directorio))
+        except Exception as e:
+            resultados.append({'nombre': espec.get('nombre'), 'error': repr(e)})
+    if futuros:
+        pool.shutdown()
+    return resultados
+
+
+def principal(argv=None):
+    """Punto de entrada de la línea de comandos; devuelve el código de salida"""
+    parser = argparse.ArgumentParser(prog='python -m utils.lote',
+                                     description='Ejecuta especificaciones de la ecuación de calor 2D sin GUI.')
+    parser.add_argument('especificaciones', nargs='+', help='archivos .json, .toml o .yaml')
+    parser.add_argument('-o', '--salida', default=DIRECTORIO_SALIDA, help='carpeta de resultados')
+    parser.add_argument('-j', '--procesos', type=int, default=None, help='procesos en paralelo')
+    args = parser.parse_args(argv)
+    especificaciones = [leer_especificacion(ruta) for ruta in args.especificaciones]
+    fallidas = 0
+    for resultado in ejecutar_lote(especificaciones, args.salida, args.procesos):
+        if 'error' in resultado:
+            fallidas += 1
+            print(f"  {resultado['nombre']}: ERROR {resultado['error']}", file=sys.stderr)
+        else:
+            t = resultado['tiempos']
+            print(f"  {resultado['especificacion']['nombre']}: {resultado['resumen']['pasos']} pasos, "
+                  f"{t['construccion'] + t['integracion']:.3f} s -> {resultado['archivos'][0]}")
+    return 1 if fallidas else 0
+
+
+if __name__ == "__main__":
+    sys.exit(principal())
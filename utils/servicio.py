@@ -0,0 +1,259 @@
+"""Servicio local de simulaciones: cola de trabajos sobre un pool de procesos ya inicializados
+
+Protocolo: líneas JSON sobre TCP en localhost. Cada línea del cliente es
+{"tipo": "trabajo", "caso": {...}} (mismo formato de caso que utils/barrido.py)
+o {"tipo": "metricas"}. Por cada trabajo el servidor responde con eventos
+'aceptado', 'progreso' (fracción completada) y 'resultado' o 'error', todos
+con el id del trabajo. Los procesos del pool importan NumPy/SciPy una sola vez y
+conservan los solucionadores (operadores factorizados) entre trabajos con la
+misma malla y parámetros.
+"""
+
+import sys
+sys.path.append('./')
+
+import asyncio
+import collections
+import functools
+import itertools
+import json
+import multiprocessing
+import os
+import socket
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from utils.barrido import normalizar_caso
+
+CLAVES_METODO = {'FTCS': 'ftcs', 'Crank-Nicolson': 'cn', 'ADI': 'adi'}
+HOST = '127.0.0.1'
+PUERTO = 8765
+FRACCIONES_PROGRESO = 10
+VENTANA_METRICAS = 1000  # trabajos recientes sobre los que se resumen espera y latencia
+
+
+def _calentar():
+    """Inicializador de los procesos: importa los módulos pesados antes del primer trabajo"""
+    import scipy.linalg.lapack  # noqa: F401
+    import src.solucionadores  # noqa: F401
+
+
+@functools.lru_cache(maxsize=16)
+def _solucionador(N, dt, metodo, alpha, tipo_frontera, valor_frontera):
+    """Solucionador reutilizable por proceso; fijar_estado() evita reconstruir operadores"""
+    from src.condiciones import inicializar_dominio
+    from src.solucionadores import SolucionadorCalor
+    x, y, dx, dy = inicializar_dominio(N, N)
+    return SolucionadorCalor((N, N), dx, dy, dt, CLAVES_METODO[metodo], alpha, tipo_frontera,
+                             valor_frontera)
+
+
+def ejecutar_trabajo(id_trabajo, caso, cola_progreso=None):
+    """Ejecuta un caso en un proceso del pool y publica el progreso en cola_progreso
+
+    Returns:
+        dict con 'u' (campo final), 'tiempo' (s de cómputo) y 'pasos'
+    """
+    from src.condiciones import inicializar_dominio, temperatura_inicial
+    caso = normalizar_caso(caso)
+    N, pasos = caso['N'], caso['pasos']
+    solucionador = _solucionador(N, caso['dt'], caso['metodo'], caso['alpha'], caso['tipo_frontera'],
+                                 caso['valor_frontera'])
+    x, y, _, _ = inicializar_dominio(N, N)
+    t_inicio = time.perf_counter()
+    solucionador.fijar_estado(temperatura_inicial(x, y, tipo=caso['condicion_inicial']))
+    bloque = max(1, -(-pasos // FRACCIONES_PROGRESO))
+    for hecho in range(0, pasos, bloque):
+        solucionador.avanzar(min(bloque, pasos - hecho))
+        if cola_progreso is not None:
+            cola_progreso.put((id_trabajo, solucionador.pasos_dados / pasos))
+    t_total = time.perf_counter() - t_inicio
+    return {'u': solucionador.u.copy(), 'tiempo': t_total, 'pasos': pasos}
+
+
+class ServicioSimulacion:
+    """Servidor asyncio con cola de trabajos y métricas de profundidad y latencia
+
+    Args:
+        procesos: tamaño del pool de procesos persistente
+        host, puerto: dirección de escucha (puerto 0 elige uno libre)
+    """
+
+    def __init__(self, procesos=None, host=HOST, puerto=PUERTO):
+        self.procesos = procesos or os.cpu_count() or 1
+        self.host, self.puerto = host, puerto
+        self._ids = itertools.count(1)
+        self._cola = None
+        self._clientes = {}
+        self._pool = None
+        self._gestor = None
+        self._progreso = None
+        self._servidor = None
+        self._tareas = []
+        self._conexiones = set()
+        self.en_ejecucion = 0
+        self.completados = 0
+        self.fallidos = 0
+        self._esperas = collections.deque(maxlen=VENTANA_METRICAS)
+        self._latencias = collections.deque(maxlen=VENTANA_METRICAS)
+
+    def metricas(self):
+        """Profundidad de la cola y latencias (s) de los últimos VENTANA_METRICAS trabajos"""
+        def resumen(valores):
+            if not valores:
+                return {'media': None, 'p95': None}
+            return {'media': float(np.mean(valores)), 'p95': float(np.percentile(valores, 95))}
+        return {'en_cola': self._cola.qsize() if self._cola else 0, 'en_ejecucion': self.en_ejecucion,
+                'completados': self.completados, 'fallidos': self.fallidos, 'procesos': self.procesos,
+                'espera': resumen(self._esperas), 'latencia': resumen(self._latencias)}
+
+    async def iniciar(self):
+        """Crea el pool, arranca los despachadores y abre el socket; devuelve el puerto real"""
+        self._cola = asyncio.Queue()
+        self._gestor = multiprocessing.Manager()
+        self._progreso = self._gestor.Queue()
+        self._pool = ProcessPoolExecutor(max_workers=self.procesos, initializer=_calentar)
+        self._tareas = [asyncio.create_task(self._despachar()) for _ in range(self.procesos)]
+        self._tareas.append(asyncio.create_task(self._reenviar_progreso()))
+        self._servidor = await asyncio.start_server(self._atender, self.host, self.puerto)
+        self.puerto = self._servidor.sockets[0].getsockname()[1]
+        return self.puerto
+
+    async def detener(self):
+        """Cierra el socket, cancela los despachadores y apaga el pool"""
+        self._servidor.close()
+        await self._servidor.wait_closed()
+        self._progreso.put(None)
+        # Las conexiones abiertas se cierran aquí: Server.close() no las espera
+        tareas = self._tareas + list(self._conexiones)
+        for tarea in tareas:
+            tarea.cancel()
+        await asyncio.gather(*tareas, return_exceptions=True)
+        self._pool.shutdown()
+        self._gestor.shutdown()
+
+    async def servir(self):
+        """Atiende conexiones hasta que se cancele"""
+        await self.iniciar()
+        print(f"Servicio de simulación en {self.host}:{self.puerto} con {self.procesos} procesos")
+        try:
+            await self._servidor.serve_forever()
+        finally:
+            await self.detener()
+
+    async def _enviar(self, escritor, evento):
+        """Envía un evento; si el cliente ya se desconectó lo descarta y devuelve False"""
+        if escritor.is_closing():
+            return False
+        try:
+            escritor.write((json.dumps(evento) + '\n').encode())
+            await escritor.drain()
+        except ConnectionError:
+            # El cliente se fue (BrokenPipeError, ConnectionResetError): el trabajo sigue y
+            # sus eventos se descartan sin afectar al despachador ni al reenvío de progreso
+            escritor.close()
+            return False
+        return True
+
+    async def _atender(self, lector, escritor):
+        """Lee peticiones JSON de una conexión hasta que el cliente la cierre"""
+        tarea = asyncio.current_task()
+        self._conexiones.add(tarea)
+        try:
+            await self._leer_peticiones(lector, escritor)
+        except ConnectionError:
+            pass
+        finally:
+            self._conexiones.discard(tarea)
+            escritor.close()
+
+    async def _leer_peticiones(self, lector, escritor):
+        while True:
+            linea = await lector.readline()
+            if not linea:
+                break
+            try:
+                peticion = json.loads(linea)
+                if not isinstance(peticion, dict):
+                    raise ValueError('La petición debe ser un objeto JSON')
+                tipo = peticion.get('tipo')
+                if tipo == 'metricas':
+                    await self._enviar(escritor, dict(self.metricas(), evento='metricas'))
+                    continue
+                if tipo != 'trabajo':
+                    raise ValueError(f"Tipo de petición '{tipo}' no reconocido")
+                caso = normalizar_caso(peticion['caso'])
+            except (ValueError, KeyError, TypeError) as e:
+                await self._enviar(escritor, {'evento': 'error', 'mensaje': str(e)})
+                continue
+            id_trabajo = next(self._ids)
+            self._clientes[id_trabajo] = escritor
+            await self._cola.put((id_trabajo, caso, time.perf_counter()))
+            await self._enviar(escritor, {'evento': 'aceptado', 'id': id_trabajo,
+                                          'en_cola': self._cola.qsize()})
+
+    async def _despachar(self):
+        """Toma trabajos de la cola y los ejecuta en el pool, uno a la vez por despachador"""
+        loop = asyncio.get_running_loop()
+        while True:
+            id_trabajo, caso, t_llegada = await self._cola.get()
+            self._esperas.append(time.perf_counter() - t_llegada)
+            self.en_ejecucion += 1
+            escritor = self._clientes[id_trabajo]
+            try:
+                resultado = await loop.run_in_executor(self._pool, ejecutar_trabajo, id_trabajo, caso,
+                                                       self._progreso)
+                self.completados += 1
+                evento = {'evento': 'resultado', 'id': id_trabajo, 'tiempo': resultado['tiempo'],
+                          'pasos': resultado['pasos'], 'u': resultado['u'].tolist()}
+            except Exception as e:
+                self.fallidos += 1
+                evento = {'evento': 'error', 'id': id_trabajo, 'mensaje': repr(e)}
+            finally:
+                self.en_ejecucion -= 1
+                self._latencias.append(time.perf_counter() - t_llegada)
+                self._cola.task_done()
+            # El progreso viaja por otra cola; el que llegue después del resultado se descarta
+            self._clientes.pop(id_trabajo, None)
+            await self._enviar(escritor, evento)
+
+    async def _reenviar_progreso(self):
+        """Reenvía a cada cliente los avances publicados por los procesos del pool"""
+        loop = asyncio.get_running_loop()
+        while True:
+            mensaje = await loop.run_in_executor(None, self._progreso.get)
+            if mensaje is None:
+                break
+            id_trabajo, fraccion = mensaje
+            escritor = self._clientes.get(id_trabajo)
+            if escritor is not None:
+                await self._enviar(escritor, {'evento': 'progreso', 'id': id_trabajo, 'fraccion': fraccion})
+
+
+def enviar_trabajo(caso, host=HOST, puerto=PUERTO):
+    """Cliente síncrono: envía un caso y genera los eventos recibidos hasta el resultado o error"""
+    with socket.create_connection((host, puerto)) as conexion:
+        conexion.sendall((json.dumps({'tipo': 'trabajo', 'caso': caso}) + '\n').encode())
+        for linea in conexion.makefile('r', encoding='utf-8'):
+            evento = json.loads(linea)
+            if evento['evento'] == 'resultado':
+                evento['u'] = np.array(evento['u'])
+            yield evento
+            if evento['evento'] in ('resultado', 'error'):
+                return
+
+
+def consultar_metricas(host=HOST, puerto=PUERTO):
+    """Cliente síncrono: devuelve las métricas actuales del servicio"""
+    with socket.create_connection((host, puerto)) as conexion:
+        conexion.sendall(b'{"tipo": "metricas"}\n')
+        return json.loads(conexion.makefile('r', encoding='utf-8').readline())
+
+
+if __name__ == "__main__":
+    procesos = int(sys.argv[1]) if len(sys.argv) > 1 else None
+    try:
+        asyncio.run(ServicioSimulacion(procesos).servir())
+    except KeyboardInterrupt:
+        pass